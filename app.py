@@ -12,8 +12,12 @@ from dotenv import load_dotenv
 # Local imports
 from data import IELTS_QUESTIONS
 from config import CSS_STYLES
-from services import text_to_speech, load_whisper_model, transcribe_audio, grade_submission
-from components import display_results, render_progress_dots
+from config.settings import STT_VAD_ENABLED, STT_INFERENCE_URL
+from services import text_to_speech
+from services.inference_client import InferenceClient
+from services.stt_service import decode_audio, question_prompt
+from services.vad import trim_silence
+from components import display_results, render_progress_dots, load_stt_engine, grade_submission
 
 # Load environment variables
 load_dotenv()
@@ -58,9 +62,12 @@ def main():
     if 'is_processing' not in st.session_state:
         st.session_state.is_processing = False
     
-    # Load Whisper model
-    with st.spinner("Loading speech recognition model..."):
-        whisper_model = load_whisper_model()
+    # Load the speech-to-text engine, unless the shared inference server owns it
+    if STT_INFERENCE_URL:
+        stt_engine = InferenceClient(STT_INFERENCE_URL)
+    else:
+        with st.spinner("Loading speech recognition model..."):
+            stt_engine = load_stt_engine()
     
     # ==================== START SCREEN ====================
     if not st.session_state.test_started:
@@ -178,7 +185,14 @@ def main():
             # Transcribe - Subtle indicator
             with st.spinner("Transcribing your answer..."):
                 st.session_state.is_processing = True
-                transcript = transcribe_audio(audio['bytes'], whisper_model)
+                recording = decode_audio(audio['bytes'])
+                if STT_VAD_ENABLED:
+                    # Skip Whisper entirely for silent recordings
+                    speech = trim_silence(recording)
+                    recording = None if speech.is_silent else speech.audio
+                transcript = "" if recording is None else stt_engine.transcribe(
+                    recording, prompt=question_prompt(question)
+                ).text
                 st.session_state.is_processing = False
             
             # Validation: Check if transcript is empty or too short
@@ -0,0 +1,138 @@
+"""
+Shared Whisper Inference Server
+Owns the Whisper model(s) and serves transcriptions to the Streamlit app and the API
+"""
+import asyncio
+import json
+import os
+from typing import Optional
+
+import numpy as np
+
+from backend.utils.stt_batcher import MicroBatcher
+from backend.utils.stt_worker import InferenceWorkerPool, QueueFullError
+from config.settings import STT_BATCH_WINDOW_MS, STT_MAX_AUDIO_SECONDS
+from services.inference_client import ENCODING, parse_address
+from services.stt_engines import (
+    STTEngine,
+    create_stt_engine,
+    engine_transcribe,
+    engine_warm_up
+)
+from services.stt_service import Transcription, decode_preset
+
+SAMPLE_RATE = 16000
+
+# Headroom over the longest answer for chunk overlap
+MAX_REQUEST_SAMPLES = int((STT_MAX_AUDIO_SECONDS + 5) * SAMPLE_RATE)
+
+
+class InferenceServer:
+    """
+    Serves transcription requests over a Unix socket or localhost TCP.
+
+    Every client shares the same worker pool, so the model is loaded once per
+    worker instead of once per process, and each model replica is only ever
+    used by its own worker thread. With STT_BATCH_WINDOW_MS > 0, requests
+    from all clients are micro-batched together.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.engine: Optional[STTEngine] = None
+        self.pool: Optional[InferenceWorkerPool] = None
+        self.batcher: Optional[MicroBatcher] = None
+        self.requests = 0
+        self.failures = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self):
+        """Load the model, warm up every worker and begin listening."""
+        self.engine = await asyncio.to_thread(create_stt_engine)
+        self.pool = InferenceWorkerPool(create_stt_engine, warm_up=engine_warm_up)
+        self.pool.start(first_model=self.engine)
+        if STT_BATCH_WINDOW_MS > 0 and self.engine.supports_batching:
+            self.batcher = MicroBatcher(self.pool)
+
+        # Clients only see the socket once every worker's replica is warm
+        await asyncio.to_thread(self.pool.wait_started)
+        if self.pool.failed:
+            raise RuntimeError(f"Inference workers failed to start: {self.pool.error}")
+
+        kind, address = parse_address(self.url)
+        if kind == "unix":
+            if os.path.exists(address):
+                os.unlink(address)
+            os.makedirs(os.path.dirname(address) or ".", exist_ok=True)
+            self._server = await asyncio.start_unix_server(self.handle, address)
+        else:
+            self._server = await asyncio.start_server(self.handle, *address)
+
+    async def serve_forever(self):
+        """Start the server and run until cancelled."""
+        await self.start()
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            self.pool.shutdown()
+
+    def info(self) -> dict:
+        """Model and queue status."""
+        return {
+            "status": "loaded",
+            **self.engine.describe(),
+            "workers": self.pool.num_workers,
+            "queue_depth": self.pool.queue_depth,
+            "busy_workers": self.pool.busy_workers,
+            "batching": self.batcher is not None,
+            "requests": self.requests,
+            "failures": self.failures
+        }
+
+    async def transcribe(self, audio: np.ndarray, preset: Optional[str],
+                         prompt: Optional[str]) -> Transcription:
+        """Run one transcription through the batcher or the worker pool."""
+        if self.batcher is not None:
+            return await self.batcher.transcribe(audio, preset=preset, prompt=prompt)
+        return await self.pool.submit(engine_transcribe, audio, preset=preset, prompt=prompt)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answer one request on a client connection."""
+        try:
+            reply = await self._dispatch(reader)
+        except QueueFullError:
+            reply = {"error": "busy", "detail": "Inference queue is full"}
+        except (ValueError, KeyError, asyncio.IncompleteReadError) as e:
+            reply = {"error": "bad_request", "detail": str(e)}
+        except Exception as e:
+            self.failures += 1
+            reply = {"error": "failed", "detail": f"Transcription failed: {e}"}
+
+        try:
+            writer.write(json.dumps(reply).encode(ENCODING) + b"\n")
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, reader: asyncio.StreamReader) -> dict:
+        header = json.loads(await reader.readline())
+        op = header.get("op")
+        if op == "info":
+            return self.info()
+        if op != "transcribe":
+            raise ValueError(f"Unknown operation: {op}")
+
+        samples = int(header["samples"])
+        if not 0 < samples <= MAX_REQUEST_SAMPLES:
+            raise ValueError(f"Audio must be between 0 and {MAX_REQUEST_SAMPLES} samples")
+        decode_preset(header.get("preset"))
+
+        data = await reader.readexactly(samples * 4)
+        audio = np.frombuffer(data, dtype="<f4").astype(np.float32)
+
+        self.requests += 1
+        result = await self.transcribe(audio, header.get("preset"), header.get("prompt"))
+        return {"text": result.text, "fallbacks": result.fallbacks}
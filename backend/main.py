@@ -2,9 +2,13 @@
 FastAPI Backend for IELTS Speaking Grader
 Main application entry point
 """
+import os
+from contextlib import asynccontextmanager
+
 from backend.routes import test_routes, tts_routes, stt_routes, grading_routes
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -12,11 +16,26 @@ load_dotenv()
 
 # Import routes
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Load and warm up Whisper and synthesize the question audio in the
+    background; stop both on shutdown.
+    """
+    await stt_routes.start_stt()
+    await tts_routes.start_tts(test_routes.question_audio_items())
+    yield
+    await tts_routes.stop_tts()
+    await stt_routes.stop_stt()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="IELTS Speaking Grader API",
     description="REST API for IELTS speaking test with AI-powered grading",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configure CORS for mobile app access
@@ -50,16 +69,49 @@ async def root():
     }
 
 
+@app.get("/live")
+async def liveness():
+    """Liveness probe: the process is up and serving requests."""
+    return {"status": "alive"}
+
+
+@app.get("/ready")
+async def readiness():
+    """
+    Readiness probe: 200 once Whisper is loaded and warmed up, 503 before.
+
+    Returns:
+        Model load state, load and warm-up latency and inference queue depth
+    """
+    stt = await stt_routes.stt_status()
+    return JSONResponse(
+        status_code=200 if stt["ready"] else 503,
+        content={"status": "ready" if stt["ready"] else "not_ready", "stt": stt}
+    )
+
+
 @app.get("/health")
 async def health_check():
     """Detailed health check."""
+    stt = await stt_routes.stt_status()
+    if stt["ready"]:
+        whisper_status = "ready"
+    elif stt.get("error"):
+        whisper_status = "failed"
+    else:
+        whisper_status = "loading"
+
+    api_key = os.getenv("GEMINI_API_KEY")
+    gemini_status = "configured" if api_key and api_key != "your_api_key_here" else "missing"
+
     return {
-        "status": "healthy",
+        "status": "healthy" if whisper_status == "ready" and gemini_status == "configured" else "degraded",
         "services": {
-            "whisper": "loaded",
-            "gemini": "configured",
+            "whisper": whisper_status,
+            "gemini": gemini_status,
             "tts": "ready"
-        }
+        },
+        "stt": stt
     }
 
 
@@ -25,6 +25,7 @@ class Question(BaseModel):
     id: int
     text: str
     tip: str
+    audio_url: Optional[str] = None  # Question audio in the session's voice
 
 
 # ==================== Test/Session Models ====================
@@ -54,6 +55,22 @@ class STTResponse(BaseModel):
     transcript: str
     word_count: int
     duration: Optional[float] = None
+    trimmed_seconds: Optional[float] = None  # Silence removed before decoding
+    cached: bool = False  # Served from the transcript cache
+    preset: Optional[str] = None  # Decode preset used (fast, balanced, accurate)
+    model: Optional[str] = None  # Whisper model that produced the transcript
+    real_time_factor: Optional[float] = None  # Processing time / audio duration
+    fallbacks: Optional[int] = None  # Temperature-fallback re-decodes
+    result_id: Optional[str] = None  # Two-pass mode: ID of the refined transcript
+
+
+class TranscriptResult(BaseModel):
+    """Refined transcript of a two-pass transcription."""
+    result_id: str
+    status: str  # pending, ready, failed
+    draft: str
+    final: Optional[STTResponse] = None
+    error: Optional[str] = None
 
 
 # ==================== Grading Models ====================
@@ -62,6 +79,7 @@ class AnswerSubmission(BaseModel):
     question_id: int
     question_text: str
     transcript: str
+    result_id: Optional[str] = None  # Two-pass transcription to upgrade to
 
 
 class GradingRequest(BaseModel):
@@ -2,93 +2,24 @@
 Grading Routes
 Handles AI-powered grading using Google Gemini
 """
-import os
-import json
-from typing import List, Dict, Any
+import asyncio
+from typing import List
 from fastapi import APIRouter, HTTPException
-from google import genai
-from google.genai import types
 
 from backend.models.schemas import (
+    AnswerSubmission,
     GradingRequest,
     GradingResponse,
     ScoreBreakdown,
     LanguageError
 )
-from config.settings import GEMINI_MODEL
+from backend.utils.transcript_results import transcript_results
+from config.settings import STT_REFINE_WAIT_SECONDS
+from services.grading_service import GradingError, grade_submission
 
 router = APIRouter()
 
 
-# System prompt for IELTS grading (same as in grading_service.py)
-SYSTEM_INSTRUCTION = """You are an EXPERT IELTS Speaking Examiner with 20+ years of experience. Your task is to provide a highly detailed, evidence-based evaluation of the student's speaking performance.
-
-CRITICAL INSTRUCTION: You must justify every score with SPECIFIC EXAMPLES (quotes) from the student's transcript. Do not give generic advice.
-
-***SCORING CRITERIA Breakdown:***
-
-1.  **Fluency & Coherence (FC):**
-    *   Do they speak at a normal length? Are there long pauses?
-    *   Do they use discourse markers (e.g., "However", "On the other hand") effectively?
-    *   *Evidence required:* Quote where they hesitated or used good linking words.
-
-2.  **Lexical Resource (LR):**
-    *   Do they use a wide range of vocabulary? Is it precise?
-    *   Do they use idioms or collocations?
-    *   *Evidence required:* Quote specific good/bad vocabulary choices.
-
-3.  **Grammatical Range & Accuracy (GRA):**
-    *   Do they use a mix of simple and complex sentences?
-    *   Are there frequent errors? Do errors cause confusion?
-    *   *Evidence required:* Quote specific grammatical errors and suggest the correct form.
-
-4.  **Pronunciation (P):**
-    *   (Inferred from transcript context): Are there garbled words suggesting mispronunciation?
-    *   *Note:* Be lenient here as you are grading a transcript, but penalize if the STT output is incomprehensible due to mumbling.
-
-    **FEEDBACK INSTRUCTIONS:**
-*   **POSITIVE_FEEDBACK:** Must be specific.
-*   **CRITICAL_FEEDBACK:** Must be actionable.
-*   **LANGUAGE_ERRORS:**
-    *   `explanation`: Briefly explain WHY it is wrong or better (e.g., "'Immediately' is more natural than 'very fast' in this context").
-    *   `error_type`: Use categories like "Vocabulary", "Grammar", "Pronunciation", "Fluency".
-*   **BAND_UPGRADE_TIP:** Give a specific exercise."""
-
-
-# Schema for structured JSON output
-GRADE_SCHEMA = {
-    "type": "OBJECT",
-    "properties": {
-        "FINAL_OVERALL_BAND_SCORE": {"type": "NUMBER"},
-        "SCORE_BREAKDOWN": {
-            "type": "OBJECT",
-            "properties": {
-                "Fluency_Coherence": {"type": "NUMBER"},
-                "Lexical_Resource": {"type": "NUMBER"},
-                "Grammatical_Range_Accuracy": {"type": "NUMBER"},
-                "Pronunciation": {"type": "NUMBER"}
-            }
-        },
-        "POSITIVE_FEEDBACK": {"type": "STRING"},
-        "CRITICAL_FEEDBACK": {"type": "STRING"},
-        "LANGUAGE_ERRORS": {
-            "type": "ARRAY",
-            "items": {
-                "type": "OBJECT",
-                "properties": {
-                    "error_type": {"type": "STRING"},
-                    "original_phrase": {"type": "STRING"},
-                    "correction": {"type": "STRING"},
-                    "explanation": {"type": "STRING"}
-                }
-            }
-        },
-        "BAND_UPGRADE_TIP": {"type": "STRING"}
-    },
-    "required": ["FINAL_OVERALL_BAND_SCORE", "SCORE_BREAKDOWN", "POSITIVE_FEEDBACK", "CRITICAL_FEEDBACK", "LANGUAGE_ERRORS", "BAND_UPGRADE_TIP"]
-}
-
-
 def parse_feedback(feedback_text: str) -> List[str]:
     """Parse feedback string into list of points."""
     # Split by bullet points or newlines
@@ -102,11 +33,34 @@ def parse_feedback(feedback_text: str) -> List[str]:
     return points if points else [feedback_text]
 
 
+async def final_transcript(session_id: str, answer: AnswerSubmission) -> str:
+    """
+    Transcript to grade for an answer.
+
+    If the answer's transcript is a two-pass draft (found by ``result_id``
+    or by session and question), waits for the refined transcript and
+    uses it instead. Falls back to the submitted transcript if refinement
+    fails or takes longer than STT_REFINE_WAIT_SECONDS.
+    """
+    result_id = answer.result_id or await transcript_results.find(session_id, answer.question_id)
+    if result_id is None:
+        return answer.transcript
+
+    result = await transcript_results.wait(result_id, STT_REFINE_WAIT_SECONDS)
+    # Only replace the draft itself, never a transcript the client changed
+    if result is None or result.final is None or result.draft.strip() != answer.transcript.strip():
+        return answer.transcript
+    return result.final.transcript
+
+
 @router.post("/submit")
 async def submit_for_grading(request: GradingRequest) -> GradingResponse:
     """
     Grade submitted answers using Google Gemini AI.
 
+    Two-pass draft transcripts are replaced by their refined version,
+    waiting for refinement to finish if needed.
+
     Args:
         request: Contains session_id and list of answers with transcripts
 
@@ -131,14 +85,6 @@ async def submit_for_grading(request: GradingRequest) -> GradingResponse:
             ]
         }
     """
-    # Validate API key
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key or api_key == "your_api_key_here":
-        raise HTTPException(
-            status_code=500,
-            detail="GEMINI_API_KEY not configured. Please set it in .env file"
-        )
-
     # Validate answers
     if not request.answers or len(request.answers) == 0:
         raise HTTPException(
@@ -146,35 +92,19 @@ async def submit_for_grading(request: GradingRequest) -> GradingResponse:
             detail="No answers provided for grading"
         )
 
-    try:
-        # Build Q&A text for Gemini
-        qa_text = ""
-        for answer in request.answers:
-            qa_text += f"**Question {answer.question_id}:** {answer.question_text}\n"
-            qa_text += f"**Student Answer {answer.question_id}:** {answer.transcript}\n\n"
+    transcripts = await asyncio.gather(
+        *(final_transcript(request.session_id, answer) for answer in request.answers)
+    )
 
-        user_prompt = (
-            f"Please analyze the following student transcripts against the IELTS Speaking Band Descriptors (FC, LR, GRA, P).\n\n"
-            f"{qa_text}\n\n"
-            f"Based on this, generate a score for each criterion and a final overall Band Score. BE STRICT. BE DETAILED."
-        )
-
-        # Call Gemini API
-        client = genai.Client(api_key=api_key)
-        response = client.models.generate_content(
-            model=GEMINI_MODEL,
-            contents=user_prompt,
-            config=types.GenerateContentConfig(
-                system_instruction=SYSTEM_INSTRUCTION,
-                temperature=0.3,
-                response_mime_type="application/json",
-                response_schema=GRADE_SCHEMA
-            )
+    try:
+        # Gemini is called on a worker thread so the event loop stays free
+        result = await asyncio.to_thread(
+            grade_submission,
+            [answer.question_text for answer in request.answers],
+            list(transcripts),
+            [answer.question_id for answer in request.answers]
         )
 
-        # Parse response
-        result = json.loads(response.text)
-
         # Extract scores
         scores = ScoreBreakdown(
             fluency=result["SCORE_BREAKDOWN"]["Fluency_Coherence"],
@@ -207,10 +137,10 @@ async def submit_for_grading(request: GradingRequest) -> GradingResponse:
             detailed_result=result  # Include full result for reference
         )
 
-    except json.JSONDecodeError as e:
+    except GradingError as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to parse Gemini response: {str(e)}"
+            detail=str(e)
         )
     except Exception as e:
         raise HTTPException(
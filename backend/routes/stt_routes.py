@@ -2,40 +2,544 @@
 Speech-to-Text (STT) Routes
 Transcribes user's audio recordings to text
 """
-from fastapi import APIRouter, File, UploadFile, HTTPException, Form
-from backend.models.schemas import STTResponse
-from services.stt_service import load_whisper_model, transcribe_audio
+import asyncio
+import functools
+import hashlib
+import json
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+from fastapi import APIRouter, HTTPException, Request, WebSocket, WebSocketDisconnect
+from backend.models.schemas import STTResponse, TranscriptResult
+from backend.utils.live_transcriber import LiveTranscriber
+from backend.utils.stt_batcher import MicroBatcher
+from backend.utils.stt_router import ModelRouter
+from backend.utils.stt_worker import InferenceWorkerPool, QueueFullError
+from backend.utils.transcript_results import transcript_results
+from backend.utils.upload_stream import (
+    AudioTooLongError,
+    StreamingAudioDecoder,
+    UploadFormatError,
+    UploadTooLargeError,
+    stream_multipart
+)
+from data import IELTS_QUESTIONS
+from config.settings import (
+    WHISPER_MODEL,
+    WHISPER_QUANTIZE,
+    STT_BATCH_WINDOW_MS,
+    STT_DECODE_PRESETS,
+    STT_DEFAULT_PRESET,
+    STT_VAD_ENABLED,
+    STT_MAX_AUDIO_SECONDS,
+    STT_MAX_UPLOAD_BYTES,
+    STT_VAD_MIN_SPEECH_SECONDS,
+    STT_VAD_MAX_SILENCE_SECONDS,
+    STT_CACHE_MAX_BYTES,
+    STT_CACHE_DIR,
+    STT_CHUNKING_ENABLED,
+    STT_CHUNK_SECONDS,
+    STT_CHUNK_OVERLAP_SECONDS,
+    STT_INFERENCE_URL,
+    STT_ENGINE,
+    STT_CPU_CORES,
+    STT_WORKERS,
+    STT_FALLBACK_MODEL,
+    STT_SECONDARY_WORKERS,
+    STT_DRAFT_MODEL
+)
+from services.cache import TwoTierCache
+from services.inference_client import InferenceBusyError, InferenceClient
+from services.long_audio import split_long_audio, stitch_transcripts
+from services.stt_engines import (
+    available_engines,
+    create_stt_engine,
+    engine_transcribe,
+    engine_warm_up
+)
+from services.stt_service import Transcription, decode_preset, question_prompt
+from services.vad import trim_silence
 
 router = APIRouter()
 
-# Load Whisper model once at startup
-whisper_model = None
+# Speech-to-text engine loaded once at startup
+stt_engine = None
+
+# Worker pool that runs inference off the event loop
+stt_pool = None
+
+# Optional micro-batcher in front of the pool
+stt_batcher = None
+
+# Pools (and batchers) for the smaller fallback and draft models, by model name
+secondary_pools: Dict[str, InferenceWorkerPool] = {}
+secondary_batchers: Dict[str, MicroBatcher] = {}
+
+# Optional load-adaptive router between Whisper sizes
+stt_router = None
+
+# Client for the shared inference server (replaces the model and pool)
+stt_client = None
+
+# Transcripts keyed by audio content hash + model + decode options
+transcript_cache = TwoTierCache(STT_CACHE_MAX_BYTES, STT_CACHE_DIR)
+
+# Background refinements of two-pass drafts
+refine_tasks: Set[asyncio.Task] = set()
+
+# Cumulative transcription metrics (exposed at /metrics)
+stt_metrics = {
+    "requests": 0,
+    "rejected_silent": 0,
+    "chunked_requests": 0,
+    "prompted_requests": 0,
+    "two_pass_requests": 0,
+    "fallback_decodes": 0,
+    "audio_seconds": 0.0,
+    "trimmed_seconds": 0.0
+}
+
+
+# Model loading and warm-up progress (exposed at /ready)
+stt_state = {
+    "model_loaded": False,
+    "warmed_up": False,
+    "load_seconds": None,
+    "warmup_seconds": None,
+    "error": None
+}
+
+# Background task loading and warming up the model
+startup_task = None
+
+
+async def start_stt():
+    """
+    Start loading Whisper in the background (called from the app lifespan).
+
+    The server accepts connections immediately; /ready reports 503 until
+    every worker's model replica has been warmed up.
+    """
+    global stt_client, startup_task
+    if STT_INFERENCE_URL:
+        # The shared inference server owns the model
+        stt_client = InferenceClient(STT_INFERENCE_URL)
+        return
+    startup_task = asyncio.create_task(load_and_warm_up())
+
+
+async def load_and_warm_up():
+    """Load the models, start the inference workers and warm every replica up."""
+    global stt_engine, stt_pool, stt_batcher, stt_router
+    try:
+        secondary = [
+            name for name in dict.fromkeys((STT_FALLBACK_MODEL, STT_DRAFT_MODEL))
+            if name and name != WHISPER_MODEL
+        ]
+        # Every worker thread, whichever model it serves, gets the same core share
+        core_share = max(1, STT_CPU_CORES // (STT_WORKERS + STT_SECONDARY_WORKERS * len(secondary)))
+
+        started = time.perf_counter()
+        engine = await asyncio.to_thread(create_stt_engine, cpu_threads=core_share)
+        stt_state["load_seconds"] = round(time.perf_counter() - started, 2)
+
+        # Each worker warms up its own replica as soon as it has loaded it
+        started = time.perf_counter()
+        stt_pool = InferenceWorkerPool(
+            functools.partial(create_stt_engine, cpu_threads=core_share),
+            cpu_cores=core_share * STT_WORKERS,
+            warm_up=engine_warm_up
+        )
+        stt_pool.start(first_model=engine)
+        # Smaller models get their own few workers rather than a replica in every worker
+        for name in secondary:
+            pool = InferenceWorkerPool(
+                functools.partial(create_stt_engine, model_name=name, cpu_threads=core_share),
+                num_workers=STT_SECONDARY_WORKERS,
+                cpu_cores=core_share * STT_SECONDARY_WORKERS,
+                warm_up=engine_warm_up
+            )
+            pool.start()
+            secondary_pools[name] = pool
+        if STT_BATCH_WINDOW_MS > 0 and engine.supports_batching:
+            stt_batcher = MicroBatcher(stt_pool)
+            secondary_batchers.update((name, MicroBatcher(pool)) for name, pool in secondary_pools.items())
+        if STT_FALLBACK_MODEL in secondary_pools:
+            stt_router = ModelRouter(stt_pool, WHISPER_MODEL, STT_FALLBACK_MODEL)
+        stt_engine = engine
+        stt_state["model_loaded"] = True
+
+        for pool in all_pools():
+            await asyncio.to_thread(pool.wait_started)
+        stt_state["warmup_seconds"] = round(time.perf_counter() - started, 2)
+        stt_state["warmed_up"] = all(pool.ready for pool in all_pools())
+    except Exception as e:
+        stt_state["error"] = f"{type(e).__name__}: {e}"
+
+
+def all_pools() -> List[InferenceWorkerPool]:
+    """The primary worker pool followed by the smaller models' pools."""
+    return ([stt_pool] if stt_pool is not None else []) + list(secondary_pools.values())
+
+
+async def stop_stt():
+    """Stop background loading and the inference workers."""
+    if startup_task is not None and not startup_task.done():
+        startup_task.cancel()
+    for task in list(refine_tasks):
+        task.cancel()
+    for pool in all_pools():
+        pool.shutdown()
+
+
+async def stt_status() -> dict:
+    """
+    Readiness of speech-to-text.
+
+    Returns:
+        ``ready`` plus model load state, warm-up latency and queue depth
+        (or the shared inference server's status)
+    """
+    if stt_client is not None:
+        try:
+            info = await stt_client.ainfo()
+        except (OSError, RuntimeError, asyncio.TimeoutError) as e:
+            return {"ready": False, "server": STT_INFERENCE_URL, "error": str(e) or type(e).__name__}
+        return {
+            "ready": True,
+            "server": STT_INFERENCE_URL,
+            "queue_depth": info["queue_depth"],
+            "busy_workers": info["busy_workers"]
+        }
+
+    state = dict(stt_state)
+    pools = all_pools()
+    for pool in pools:
+        if pool.error is not None and not state["error"]:
+            # A worker thread could not load its model replica
+            state["error"] = f"{type(pool.error).__name__}: {pool.error}"
+    return {
+        # warmed_up is only set once warm-up timing is recorded, so /ready
+        # never reports ready while /health still shows warm-up in progress
+        "ready": state["warmed_up"] and all(pool.ready for pool in pools),
+        **state,
+        "ready_workers": sum(pool.ready_workers for pool in pools),
+        "failed_workers": sum(pool.failed_workers for pool in pools),
+        "queue_depth": sum(pool.queue_depth for pool in pools),
+        "busy_workers": sum(pool.busy_workers for pool in pools)
+    }
+
+
+def require_stt():
+    """Reject requests until the worker pool (or inference server client) exists."""
+    if stt_client is not None or (stt_pool is not None and not stt_pool.failed):
+        return
+    if stt_state["error"] or stt_pool is not None:
+        raise HTTPException(status_code=503, detail="Speech recognition model failed to load")
+    raise HTTPException(
+        status_code=503,
+        detail="Speech recognition model is still loading. Please retry shortly.",
+        headers={"Retry-After": "10"}
+    )
+
+
+async def run_transcription(audio: np.ndarray, preset: Optional[str] = None,
+                            prompt: Optional[str] = None,
+                            model_name: Optional[str] = None) -> Transcription:
+    """
+    Transcribe decoded audio on the inference server, the batcher or the worker pool.
 
+    ``model_name`` picks the pool of a smaller fallback or draft model (see
+    ModelRouter); None uses the primary model.
+    """
+    if stt_client is not None:
+        return await stt_client.atranscribe(audio, preset, prompt)
+    pool, batcher = stt_pool, stt_batcher
+    if model_name in secondary_pools:
+        pool, batcher = secondary_pools[model_name], secondary_batchers.get(model_name)
+    if batcher is not None:
+        result = await batcher.transcribe(audio, preset=preset, prompt=prompt)
+    else:
+        result = await pool.submit(engine_transcribe, audio, preset=preset, prompt=prompt)
+    # The router predicts the primary pool's queue wait from its decode times
+    if stt_router is not None and pool is stt_pool:
+        stt_router.record(result.decode_seconds)
+    return result
 
-@router.on_event("startup")
-async def load_model():
-    """Load Whisper model on startup."""
-    global whisper_model
-    whisper_model = load_whisper_model()
 
+async def transcribe_long_audio(audio: np.ndarray, preset: Optional[str] = None,
+                                prompt: Optional[str] = None,
+                                model_name: Optional[str] = None) -> Transcription:
+    """
+    Transcribe a long answer as parallel chunks split at pauses.
 
-@router.post("/transcribe")
-async def transcribe_speech(
-    audio_file: UploadFile = File(...,
-                                  description="Audio file to transcribe (WAV, MP3, M4A)"),
-    session_id: str = Form(None),
-    question_id: int = Form(None)
-) -> STTResponse:
+    Chunks run concurrently on the worker pool (or share a batch), so
+    latency approaches that of the longest chunk instead of growing with
+    the length of the answer.
+    """
+    if not STT_CHUNKING_ENABLED or len(audio) <= STT_CHUNK_SECONDS * 16000:
+        return await run_transcription(audio, preset, prompt, model_name)
+
+    stt_metrics["chunked_requests"] += 1
+    chunks = split_long_audio(audio)
+    results = await asyncio.gather(
+        *(run_transcription(chunk, preset, prompt, model_name) for chunk in chunks)
+    )
+    return Transcription(
+        stitch_transcripts([result.text for result in results]),
+        sum(result.fallbacks for result in results)
+    )
+
+
+async def transcribe_speech_only(audio: np.ndarray, prompt: Optional[str] = None) -> str:
+    """Transcribe audio after the voice activity gate; silence returns ""."""
+    if STT_VAD_ENABLED:
+        vad = trim_silence(audio)
+        if vad.is_silent:
+            return ""
+        audio = vad.audio
+    result = await run_transcription(audio, prompt=prompt)
+    stt_metrics["fallback_decodes"] += result.fallbacks
+    return result.text
+
+
+def lookup_question(question_id: Optional[str]) -> Optional[str]:
+    """Question text for a 1-based question ID, or None if unknown."""
+    if not question_id or not question_id.strip().isdigit():
+        return None
+    index = int(question_id) - 1
+    if 0 <= index < len(IELTS_QUESTIONS):
+        return IELTS_QUESTIONS[index]
+    return None
+
+
+def transcription_options(preset: str = STT_DEFAULT_PRESET, prompt: Optional[str] = None,
+                          model_name: str = WHISPER_MODEL) -> dict:
+    """Everything besides the audio that changes the transcript."""
+    return {
+        "engine": stt_engine.name if stt_engine else STT_ENGINE,
+        "model": model_name,
+        "preset": preset,
+        "prompt": prompt,
+        "quantized": stt_engine.quantize if stt_engine else WHISPER_QUANTIZE,
+        "batched": stt_batcher is not None,
+        "vad": [STT_VAD_MIN_SPEECH_SECONDS, STT_VAD_MAX_SILENCE_SECONDS] if STT_VAD_ENABLED else None,
+        "chunks": [STT_CHUNK_SECONDS, STT_CHUNK_OVERLAP_SECONDS] if STT_CHUNKING_ENABLED else None
+    }
+
+
+def transcript_cache_key(audio_digest: str, options: dict) -> str:
+    """Cache key for an upload's SHA-256 digest under the given options."""
+    payload = audio_digest + json.dumps(options, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def two_pass_available() -> bool:
+    """Whether the local workers hold a draft model for two-pass mode."""
+    return STT_DRAFT_MODEL in secondary_pools
+
+
+def build_stt_response(result: Transcription, duration: float, elapsed: float,
+                       trimmed_seconds: Optional[float], preset: str, model_name: str) -> STTResponse:
+    """STTResponse for a finished transcription of ``duration`` seconds of audio."""
+    return STTResponse(
+        transcript=result.text,
+        word_count=len(result.text.split()),
+        duration=round(duration, 2),
+        trimmed_seconds=trimmed_seconds,
+        preset=preset,
+        model=model_name,
+        real_time_factor=round(elapsed / duration, 3) if duration else None,
+        fallbacks=result.fallbacks
+    )
+
+
+async def refine_transcript(result_id: str, speech: np.ndarray, duration: float,
+                            trimmed_seconds: Optional[float], preset: str,
+                            prompt: Optional[str], cache_key: str):
+    """Second pass of two-pass mode: transcribe with the primary model and publish it."""
+    try:
+        started = time.perf_counter()
+        result = await transcribe_long_audio(speech, preset, prompt, WHISPER_MODEL)
+        response = build_stt_response(
+            result, duration, time.perf_counter() - started, trimmed_seconds, preset, WHISPER_MODEL
+        )
+        stt_metrics["fallback_decodes"] += result.fallbacks
+        await transcript_cache.aset(cache_key, response.model_dump_json(exclude={"cached"}).encode())
+        await transcript_results.resolve(result_id, response)
+    except asyncio.CancelledError:
+        await transcript_results.fail(result_id, "Refinement was cancelled")
+        raise
+    except Exception as e:
+        await transcript_results.fail(result_id, f"Transcription failed: {str(e)}")
+
+
+# Allowed upload MIME types and file extensions
+ALLOWED_AUDIO_TYPES = [
+    "audio/wav", "audio/mpeg", "audio/mp4",
+    "audio/x-m4a", "audio/m4a", "audio/aac",
+    "audio/webm", "application/octet-stream"
+]
+ALLOWED_AUDIO_EXTENSIONS = ('.m4a', '.mp3', '.wav', '.webm', '.aac', '.mp4')
+
+# Room for multipart boundaries and the small form fields
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+# Request body documented in OpenAPI (the body is parsed as a stream)
+TRANSCRIBE_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["audio_file"],
+                    "properties": {
+                        "audio_file": {
+                            "type": "string",
+                            "format": "binary",
+                            "description": "Audio file to transcribe (WAV, MP3, M4A)"
+                        },
+                        "session_id": {"type": "string"},
+                        "question_id": {"type": "integer"},
+                        "preset": {
+                            "type": "string",
+                            "enum": list(STT_DECODE_PRESETS),
+                            "default": STT_DEFAULT_PRESET,
+                            "description": "Decode preset trading latency for accuracy"
+                        },
+                        "two_pass": {
+                            "type": "boolean",
+                            "default": False,
+                            "description": "Return a draft at once and refine it in the background"
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
+
+def is_allowed_audio(content_type: str, filename: Optional[str]) -> bool:
+    """Check an upload by MIME type, or by file extension as a fallback."""
+    if (content_type or "").lower().strip() in ALLOWED_AUDIO_TYPES:
+        return True
+    return bool(filename) and filename.lower().endswith(ALLOWED_AUDIO_EXTENSIONS)
+
+
+@contextmanager
+def upload_errors() -> Iterator[None]:
+    """Turn upload and decode failures into 400 responses."""
+    try:
+        yield
+    except UploadTooLargeError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"File too large. Maximum size is {STT_MAX_UPLOAD_BYTES // (1024 * 1024)}MB"
+        )
+    except AudioTooLongError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Recording too long. Maximum length is {STT_MAX_AUDIO_SECONDS} seconds"
+        )
+    except UploadFormatError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        # ffmpeg could not decode the upload
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+async def receive_audio_upload(request: Request) -> Tuple[StreamingAudioDecoder, Dict[str, str], str]:
+    """
+    Stream a multipart upload into the audio decoder as it arrives.
+
+    The decode is left unfinished so a cached transcript can be returned
+    without waiting for it: call ``decode_upload`` for the samples, or
+    ``decoder.close()`` to cancel.
+
+    Returns:
+        The audio decoder, the remaining form fields and the SHA-256 digest
+        of the uploaded audio bytes
+
+    Raises:
+        HTTPException: For invalid, missing or oversized uploads
+    """
+    fields: Dict[str, str] = {}
+    decoder = None
+    audio_hash = hashlib.sha256()
+    try:
+        with upload_errors():
+            async for part, chunk in stream_multipart(
+                request, STT_MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES
+            ):
+                if part.name != "audio_file":
+                    value = fields.get(part.name, "") + chunk.decode("utf-8", "replace")
+                    if len(value) > 1024:
+                        raise HTTPException(status_code=400, detail=f"Form field '{part.name}' is too long")
+                    fields[part.name] = value
+                    continue
+
+                if decoder is None:
+                    if not is_allowed_audio(part.content_type, part.filename):
+                        raise HTTPException(
+                            status_code=400,
+                            detail=f"Invalid file type ({part.content_type}). Allowed: wav, mp3, m4a, webm, aac"
+                        )
+                    decoder = StreamingAudioDecoder()
+
+                if decoder.bytes_received + len(chunk) > STT_MAX_UPLOAD_BYTES:
+                    raise UploadTooLargeError()
+                audio_hash.update(chunk)
+                await decoder.feed(chunk)
+    except BaseException:
+        if decoder is not None:
+            decoder.close()
+        raise
+
+    if decoder is None:
+        raise HTTPException(status_code=422, detail="audio_file is required")
+    return decoder, fields, audio_hash.hexdigest()
+
+
+async def decode_upload(decoder: StreamingAudioDecoder) -> np.ndarray:
+    """
+    Finish decoding a received upload.
+
+    Raises:
+        HTTPException: If the audio is too long or cannot be decoded
+    """
+    with upload_errors():
+        return await decoder.finish()
+
+
+@router.post("/transcribe", openapi_extra=TRANSCRIBE_REQUEST_BODY)
+async def transcribe_speech(request: Request) -> STTResponse:
     """
     Transcribe audio recording to text using Whisper.
 
-    Args:
+    The upload is streamed into the decoder while it arrives, so oversized
+    files are rejected early and compressed audio is decoded in parallel
+    with the upload.
+
+    Form Data:
         audio_file: Uploaded audio file from user's recording
         session_id: Optional session identifier for tracking
-        question_id: Optional question ID being answered
+        question_id: Optional question ID being answered; its text is used
+            as Whisper's initial prompt to bias decoding toward the topic
+        preset: Optional decode preset (fast, balanced, accurate)
+        two_pass: Optional "true" to get a draft from the small draft model
+            right away; the refined transcript is fetched from
+            /api/stt/results/{result_id}
 
     Returns:
-        Transcribed text with word count
+        Transcribed text with word count, the preset used, the Whisper
+        model that produced it (a smaller one while the server is under
+        load), the real-time factor (processing time / audio duration),
+        the number of temperature-fallback re-decodes and, in two-pass
+        mode, the ``result_id`` of the refined transcript
 
     Example:
         POST /api/stt/transcribe
@@ -45,65 +549,129 @@ async def transcribe_speech(
         - audio_file: [user_recording.wav]
         - session_id: "abc-123"
         - question_id: 1
+        - preset: "fast"
+        - two_pass: "true"
     """
-    global whisper_model
-
-    # Validate file type
-    # Normalize and expand allowed MIME types
-    incoming_type = (audio_file.content_type or "").lower().strip()
-    allowed_types = [
-        "audio/wav", "audio/mpeg", "audio/mp4", 
-        "audio/x-m4a", "audio/m4a", "audio/aac",
-        "audio/webm", "application/octet-stream"
-    ]
-    
-    # Check by MIME type OR by file extension as a fallback
-    is_valid = incoming_type in allowed_types
-    if not is_valid and audio_file.filename:
-        ext = audio_file.filename.lower()
-        if ext.endswith(('.m4a', '.mp3', '.wav', '.webm', '.aac', '.mp4')):
-            is_valid = True
-
-    if not is_valid:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid file type ({incoming_type}). Allowed: wav, mp3, m4a, webm, aac"
-        )
+    require_stt()
+    decoder, fields, audio_digest = await receive_audio_upload(request)
+    try:
+        question_id = fields.get("question_id")
+        if question_id and not question_id.strip().isdigit():
+            raise HTTPException(status_code=422, detail="question_id must be an integer")
 
-    # Check file size (max 25MB)
-    audio_bytes = await audio_file.read()
-    if len(audio_bytes) > 25 * 1024 * 1024:
-        raise HTTPException(
-            status_code=400,
-            detail="File too large. Maximum size is 25MB"
-        )
+        preset = (fields.get("preset") or STT_DEFAULT_PRESET).strip().lower()
+        try:
+            decode_preset(preset)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        prompt = question_prompt(lookup_question(question_id))
+
+        stt_metrics["requests"] += 1
+
+        two_pass = fields.get("two_pass", "").strip().lower() in ("1", "true", "yes")
+        if two_pass and not two_pass_available():
+            raise HTTPException(
+                status_code=400,
+                detail="Two-pass mode is not available on this server (no draft model is loaded)"
+            )
+
+        # Retried uploads of the same recording skip Whisper (and the rest of
+        # the decode) entirely; a cached primary-model transcript is served
+        # even while the router is on the fallback
+        if two_pass:
+            candidates = [WHISPER_MODEL, STT_DRAFT_MODEL]
+        else:
+            candidates = [WHISPER_MODEL, stt_router.current if stt_router is not None else WHISPER_MODEL]
+        for model in dict.fromkeys(candidates):
+            cached = await transcript_cache.aget(
+                transcript_cache_key(audio_digest, transcription_options(preset, prompt, model))
+            )
+            if cached is not None:
+                return STTResponse(**json.loads(cached), cached=True)
+
+        # Two-pass mode drafts with the small model; otherwise, under load, the
+        # router sends the request to the fallback model. Only misses are routed,
+        # so cache hits don't count towards the router's load figures.
+        if two_pass:
+            model_name = STT_DRAFT_MODEL
+        elif stt_router is not None:
+            model_name = stt_router.choose()
+        else:
+            model_name = WHISPER_MODEL
+        cache_key = transcript_cache_key(audio_digest, transcription_options(preset, prompt, model_name))
+
+        audio = await decode_upload(decoder)
+    finally:
+        # Stops ffmpeg when the answer comes from the cache or the request is rejected
+        decoder.close()
+
+    stt_metrics["audio_seconds"] += len(audio) / 16000
+
+    # Trim silence and reject empty recordings without calling the model
+    trimmed_seconds = None
+    speech = audio
+    if STT_VAD_ENABLED:
+        vad = await asyncio.to_thread(trim_silence, audio)
+        trimmed_seconds = round(vad.trimmed_seconds, 2)
+        stt_metrics["trimmed_seconds"] += vad.trimmed_seconds
+        if vad.is_silent:
+            stt_metrics["rejected_silent"] += 1
+            raise HTTPException(
+                status_code=400,
+                detail="Recording too short or silent. Please speak more clearly."
+            )
+        speech = vad.audio
 
     try:
-        # Transcribe using Whisper
-        transcript = transcribe_audio(audio_bytes, whisper_model)
+        # Transcribe using Whisper on worker threads
+        started = time.perf_counter()
+        result = await transcribe_long_audio(speech, preset, prompt, model_name)
+        elapsed = time.perf_counter() - started
 
-        # Validate transcript
-        words = transcript.split()
-        word_count = len(words)
+        if prompt:
+            stt_metrics["prompted_requests"] += 1
+        stt_metrics["fallback_decodes"] += result.fallbacks
 
-        if word_count < 3:
+        # Duration of the decoded 16kHz audio
+        duration = len(audio) / 16000
+        response = build_stt_response(result, duration, elapsed, trimmed_seconds, preset, model_name)
+
+        # Validate transcript
+        if response.word_count < 3:
             raise HTTPException(
                 status_code=400,
                 detail="Recording too short or silent. Please speak more clearly."
             )
 
-        # Calculate approximate duration (rough estimate)
-        # Assuming 16kHz, 16-bit audio
-        duration = len(audio_bytes) / (16000 * 2)
+        if two_pass:
+            # Return the draft now; the primary model refines it in the background
+            stt_metrics["two_pass_requests"] += 1
+            session_id = fields.get("session_id")
+            response.result_id = await transcript_results.create(
+                response.transcript,
+                session_id.strip() if session_id else None,
+                int(question_id) if question_id else None
+            )
+            refined_key = transcript_cache_key(audio_digest, transcription_options(preset, prompt))
+            task = asyncio.create_task(refine_transcript(
+                response.result_id, speech, duration, trimmed_seconds, preset, prompt, refined_key
+            ))
+            refine_tasks.add(task)
+            task.add_done_callback(refine_tasks.discard)
+            return response
 
-        return STTResponse(
-            transcript=transcript,
-            word_count=word_count,
-            duration=round(duration, 2)
-        )
+        await transcript_cache.aset(cache_key, response.model_dump_json(exclude={"cached"}).encode())
+        return response
 
     except HTTPException:
         raise
+    except (QueueFullError, InferenceBusyError):
+        raise HTTPException(
+            status_code=503,
+            detail="Transcription service is busy. Please retry shortly.",
+            headers={"Retry-After": "5"}
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -111,6 +679,113 @@ async def transcribe_speech(
         )
 
 
+@router.get("/results/{result_id}")
+async def get_transcript_result(result_id: str, wait: float = 0) -> TranscriptResult:
+    """
+    Get the refined transcript of a two-pass transcription.
+
+    Args:
+        result_id: ``result_id`` returned with the draft by /transcribe
+        wait: Seconds to hold the request while refinement is pending
+            (long polling, max 30)
+
+    Returns:
+        Status (pending, ready, failed), the draft and, once ready, the
+        refined transcription
+
+    Example:
+        GET /api/stt/results/3f2a...?wait=10
+    """
+    result = await transcript_results.wait(result_id, min(max(wait, 0), 30))
+    if result is None:
+        raise HTTPException(status_code=404, detail="Transcription result not found")
+    return result
+
+
+async def send_stream_error(websocket: WebSocket, detail: str, code: int):
+    """Send an error frame and close the live transcription socket."""
+    try:
+        await websocket.send_json({"type": "error", "detail": detail})
+        await websocket.close(code=code)
+    except (WebSocketDisconnect, RuntimeError):
+        # The client is already gone
+        pass
+
+
+@router.websocket("/stream")
+async def stream_transcription(websocket: WebSocket):
+    """
+    Live transcription while the user is speaking.
+
+    Protocol:
+        - Optional ?question_id= query parameter biases decoding toward the
+          question, as in /transcribe
+        - Client sends binary frames of 16-bit little-endian PCM, 16 kHz mono
+        - Server sends {"type": "partial", "transcript": ...} every few seconds
+        - Client sends the text message "stop" when the user finishes
+        - Server sends {"type": "final", "transcript", "word_count", "duration"}
+          and closes the connection
+
+    Example:
+        ws://localhost:8000/api/stt/stream?question_id=1
+    """
+    await websocket.accept()
+    if stt_client is None and (stt_pool is None or stt_pool.failed):
+        if stt_state["error"] or stt_pool is not None:
+            await send_stream_error(websocket, "Speech recognition model failed to load", 1011)
+        else:
+            await send_stream_error(
+                websocket, "Speech recognition model is still loading. Please retry shortly.", 1013
+            )
+        return
+
+    async def send_partial(transcript: str):
+        await websocket.send_json({"type": "partial", "transcript": transcript})
+
+    prompt = question_prompt(lookup_question(websocket.query_params.get("question_id")))
+
+    async def transcribe(audio: np.ndarray) -> str:
+        return await transcribe_speech_only(audio, prompt)
+
+    live = LiveTranscriber(transcribe, on_partial=send_partial)
+
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+
+            if message.get("bytes"):
+                live.add(message["bytes"])
+                if live.duration > STT_MAX_AUDIO_SECONDS:
+                    await send_stream_error(
+                        websocket,
+                        f"Recording too long. Maximum length is {STT_MAX_AUDIO_SECONDS} seconds",
+                        1009
+                    )
+                    return
+                if live.partial_due():
+                    live.start_partial()
+            elif (message.get("text") or "").strip().lower() == "stop":
+                break
+
+        transcript = await live.finish()
+        await websocket.send_json({
+            "type": "final",
+            "transcript": transcript,
+            "word_count": len(transcript.split()),
+            "duration": round(live.duration, 2)
+        })
+        await websocket.close()
+
+    except WebSocketDisconnect:
+        pass
+    except (QueueFullError, InferenceBusyError):
+        await send_stream_error(websocket, "Transcription service is busy. Please retry shortly.", 1013)
+    except Exception as e:
+        await send_stream_error(websocket, f"Transcription failed: {str(e)}", 1011)
+
+
 @router.get("/model-info")
 async def get_model_info():
     """
@@ -119,9 +794,20 @@ async def get_model_info():
     Returns:
         Model configuration and status
     """
-    global whisper_model
+    global stt_engine
+
+    if stt_client is not None:
+        try:
+            info = await stt_client.ainfo()
+        except (OSError, RuntimeError, asyncio.TimeoutError):
+            return {
+                "status": "unavailable",
+                "model": None,
+                "server": STT_INFERENCE_URL
+            }
+        return {**info, "languages": ["en"], "server": STT_INFERENCE_URL}
 
-    if whisper_model is None:
+    if stt_engine is None:
         return {
             "status": "not_loaded",
             "model": None
@@ -129,7 +815,48 @@ async def get_model_info():
 
     return {
         "status": "loaded",
-        "model": "base",
+        **stt_engine.describe(),
+        "available_engines": available_engines(),
         "languages": ["en"],
-        "max_audio_length": "30 seconds recommended"
+        "max_audio_length": "30 seconds recommended",
+        "workers": stt_pool.num_workers,
+        "secondary_workers": {name: pool.num_workers for name, pool in secondary_pools.items()},
+        "queue_depth": stt_pool.queue_depth,
+        "presets": STT_DECODE_PRESETS,
+        "default_preset": STT_DEFAULT_PRESET,
+        "batching": {
+            "enabled": stt_batcher is not None,
+            "window_ms": STT_BATCH_WINDOW_MS,
+            "max_batch_size": stt_batcher.max_batch_size if stt_batcher else 1
+        },
+        "routing": stt_router.stats() if stt_router else None,
+        "draft_model": STT_DRAFT_MODEL if two_pass_available() else None
+    }
+
+
+@router.get("/metrics")
+async def get_stt_metrics():
+    """
+    Get cumulative transcription metrics.
+
+    Returns:
+        Request counts, silence rejections, temperature-fallback re-decodes,
+        seconds of audio trimmed by the voice activity gate and transcript cache hit/miss counters
+    """
+    return {
+        "requests": stt_metrics["requests"],
+        "rejected_silent": stt_metrics["rejected_silent"],
+        "chunked_requests": stt_metrics["chunked_requests"],
+        "prompted_requests": stt_metrics["prompted_requests"],
+        "two_pass_requests": stt_metrics["two_pass_requests"],
+        "two_pass_results": transcript_results.stats(),
+        "fallback_decodes": stt_metrics["fallback_decodes"],
+        "fallbacks_per_request": round(
+            stt_metrics["fallback_decodes"] / max(stt_metrics["requests"], 1), 3
+        ),
+        "audio_seconds": round(stt_metrics["audio_seconds"], 2),
+        "trimmed_seconds": round(stt_metrics["trimmed_seconds"], 2),
+        "queue_depth": stt_pool.queue_depth if stt_pool else 0,
+        "routing": stt_router.stats() if stt_router else None,
+        "cache": transcript_cache.stats()
     }
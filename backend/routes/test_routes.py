@@ -4,7 +4,7 @@ Handles test session creation and management
 """
 import uuid
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List, Tuple
 from fastapi import APIRouter, HTTPException
 
 from backend.models.schemas import (
@@ -15,6 +15,7 @@ from backend.models.schemas import (
     VoiceOption,
     SessionInfo
 )
+from backend.routes.tts_routes import audio_url
 from data import IELTS_QUESTIONS
 
 router = APIRouter()
@@ -30,6 +31,12 @@ VOICE_MAP = {
 }
 
 
+def question_audio_items() -> List[Tuple[str, str]]:
+    """Every (question, voice) pair a test session can ask for."""
+    voices = dict.fromkeys(VOICE_MAP.values())
+    return [(question, voice) for question in IELTS_QUESTIONS for voice in voices]
+
+
 @router.get("/start")
 async def start_test(voice: str = "female") -> TestStartResponse:
     """
@@ -39,7 +46,8 @@ async def start_test(voice: str = "female") -> TestStartResponse:
         voice: Voice preference (male, female, other)
 
     Returns:
-        Session ID, questions, and voice configuration
+        Session ID, questions with the URL of their audio in the selected
+        voice, and voice configuration
     """
     # Generate unique session ID
     session_id = str(uuid.uuid4())
@@ -69,7 +77,8 @@ async def start_test(voice: str = "female") -> TestStartResponse:
             id=idx + 1,
             text=question_text,
             tip=tips[idx] if idx < len(
-                tips) else "Speak clearly and naturally."
+                tips) else "Speak clearly and naturally.",
+            audio_url=audio_url(question_text, voice_id)
         ))
 
     # Prepare voice options
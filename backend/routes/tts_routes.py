@@ -2,25 +2,125 @@
 Text-to-Speech (TTS) Routes
 Converts question text to speech audio
 """
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import Response
+import asyncio
+import re
+import time
+from typing import Dict, List, Tuple
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
 
 from backend.models.schemas import TTSRequest
-from backend.utils.async_tts import text_to_speech_async
+from backend.utils.http_cache import RangeNotSatisfiableError, etag_matches, parse_byte_range
+from backend.utils.tts_dispatcher import TTSBusyError, TTSDispatcher
+from backend.utils.tts_flight import SpeechSingleFlight
+from config.settings import TTS_PRESYNTHESIZE
+from services.tts_service import tts_cache, tts_cache_key
 
 router = APIRouter()
 
+# Audio served at /audio/{key}: content address -> (text, voice)
+audio_sources: Dict[str, Tuple[str, str]] = {}
+
+# Startup synthesis of the question audio (exposed at /metrics)
+presynthesis = {
+    "total": 0,
+    "ready": 0,
+    "failed": 0,
+    "seconds": None
+}
+
+# Bounded concurrency and queue for outbound syntheses
+tts_dispatcher = TTSDispatcher()
+
+# Identical concurrent requests share one synthesis
+speech_flights = SpeechSingleFlight(tts_dispatcher)
+
+# Background task synthesizing the question audio
+presynthesis_task = None
+
+AUDIO_KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+# Content-addressed audio never changes
+AUDIO_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def tts_busy() -> HTTPException:
+    """503 for requests the synthesis dispatcher could not admit."""
+    return HTTPException(
+        status_code=503,
+        detail="Speech synthesis is busy. Please retry shortly.",
+        headers={"Retry-After": "5"}
+    )
+
+
+def audio_url(text: str, voice: str) -> str:
+    """
+    URL of the audio for ``text`` spoken by ``voice``.
+
+    The URL is a content address, so its response never changes and can be
+    cached by clients and intermediaries indefinitely.
+    """
+    key = tts_cache_key(text, voice)
+    audio_sources[key] = (text, voice)
+    return f"/api/tts/audio/{key}"
+
+
+async def synthesize_all(items: List[Tuple[str, str]]):
+    """Synthesize (text, voice) pairs into the audio cache."""
+    started = time.perf_counter()
+
+    async def synthesize(text: str, voice: str):
+        try:
+            if await tts_cache.aget(tts_cache_key(text, voice)) is None:
+                await speech_flights.synthesize(text, voice)
+            presynthesis["ready"] += 1
+        except Exception:
+            # The audio endpoint retries synthesis on first request
+            presynthesis["failed"] += 1
+
+    await asyncio.gather(*(synthesize(text, voice) for text, voice in items))
+    presynthesis["seconds"] = round(time.perf_counter() - started, 2)
+
+
+async def start_tts(items: List[Tuple[str, str]]):
+    """
+    Register the question audio and synthesize it in the background
+    (called from the app lifespan).
+
+    Args:
+        items: (text, voice) pairs to have ready before clients ask for them
+    """
+    global presynthesis_task
+    for text, voice in items:
+        audio_url(text, voice)
+    if TTS_PRESYNTHESIZE and items:
+        presynthesis["total"] = len(items)
+        presynthesis_task = asyncio.create_task(synthesize_all(items))
+
+
+async def stop_tts():
+    """Stop background synthesis."""
+    if presynthesis_task is not None and not presynthesis_task.done():
+        presynthesis_task.cancel()
+
 
 @router.post("/generate")
 async def generate_speech(request: TTSRequest):
     """
     Convert text to speech using edge-tts.
 
+    Audio is streamed while Edge TTS synthesizes it, so playback can start
+    after the first chunk; cached audio is sent as one complete body.
+    Concurrent requests for the same text and voice share one synthesis.
+
     Args:
         request: Contains text and voice preference
 
     Returns:
-        MP3 audio file as bytes
+        MP3 audio (chunked transfer encoding unless cached); 503 with
+        Retry-After when the synthesis queue is saturated
 
     Example:
         POST /api/tts/generate
@@ -29,25 +129,140 @@ async def generate_speech(request: TTSRequest):
             "voice": "en-US-JennyNeural"
         }
     """
+    key = tts_cache_key(request.text, request.voice)
+    headers = {
+        "Content-Disposition": "inline; filename=question.mp3",
+        "Cache-Control": "public, max-age=3600"  # Cache for 1 hour
+    }
+    if key in audio_sources:
+        # Cacheable GET address of the same audio for replays; only question
+        # audio is registered, so /audio/{key} can always produce it again
+        headers["Content-Location"] = f"/api/tts/audio/{key}"
+
+    audio_bytes = await tts_cache.aget(key)
+    if audio_bytes is not None:
+        return Response(content=audio_bytes, media_type="audio/mpeg", headers=headers)
+
+    # Wait for the first chunk so synthesis errors still return a 500
+    chunks = speech_flights.stream(request.text, request.voice)
     try:
-        # Use async TTS service
-        audio_bytes = await text_to_speech_async(request.text, request.voice)
-
-        # Return audio as MP3
-        return Response(
-            content=audio_bytes,
-            media_type="audio/mpeg",
-            headers={
-                "Content-Disposition": "inline; filename=question.mp3",
-                "Cache-Control": "public, max-age=3600"  # Cache for 1 hour
-            }
-        )
+        first_chunk = await chunks.__anext__()
+    except StopAsyncIteration:
+        raise HTTPException(status_code=500, detail="Failed to generate speech: no audio returned")
+    except TTSBusyError:
+        raise tts_busy()
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate speech: {str(e)}"
         )
 
+    async def audio_stream():
+        yield first_chunk
+        async for chunk in chunks:
+            yield chunk
+
+    return StreamingResponse(audio_stream(), media_type="audio/mpeg", headers=headers)
+
+
+@router.get("/audio/{key}")
+async def get_audio(key: str, request: Request):
+    """
+    Get synthesized audio by its content address.
+
+    URLs come from ``audio_url`` on each question of /api/test/start and
+    the ``Content-Location`` header of /generate for question text. Audio
+    is synthesized at startup; a miss is synthesized on first request.
+
+    The key doubles as a strong ETag: ``If-None-Match`` on audio that
+    exists is answered with 304 (without reading registered audio), and
+    ``Range`` requests (one range) get 206 partial content so players
+    can seek.
+
+    Args:
+        key: Content hash of the text, voice and audio format
+
+    Returns:
+        MP3 audio (or the requested byte range), cacheable forever
+
+    Example:
+        GET /api/tts/audio/5d41402abc4b2a76b9719d911017c592...
+        Range: bytes=0-65535
+    """
+    if not AUDIO_KEY_PATTERN.match(key):
+        raise HTTPException(status_code=404, detail="Audio not found")
+
+    headers = {
+        "ETag": f'"{key}"',
+        "Cache-Control": AUDIO_CACHE_CONTROL,
+        "Accept-Ranges": "bytes"
+    }
+    audio_bytes = None
+    if key not in audio_sources:
+        # Only audio that is still cached can be served for unregistered keys
+        audio_bytes = await tts_cache.aget(key)
+        if audio_bytes is None:
+            raise HTTPException(status_code=404, detail="Audio not found")
+
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    if audio_bytes is None:
+        audio_bytes = await tts_cache.aget(key)
+    if audio_bytes is None:
+        try:
+            audio_bytes = await speech_flights.synthesize(*audio_sources[key])
+        except TTSBusyError:
+            raise tts_busy()
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to generate speech: {str(e)}"
+            )
+
+    # A stale If-Range validator means the client must refetch everything
+    byte_range = None
+    if_range = request.headers.get("if-range")
+    if if_range is None or if_range.strip() == headers["ETag"]:
+        try:
+            byte_range = parse_byte_range(request.headers.get("range"), len(audio_bytes))
+        except RangeNotSatisfiableError:
+            return Response(
+                status_code=416,
+                headers={**headers, "Content-Range": f"bytes */{len(audio_bytes)}"}
+            )
+
+    if byte_range is None:
+        return Response(content=audio_bytes, media_type="audio/mpeg", headers=headers)
+
+    start, end = byte_range
+    return Response(
+        content=audio_bytes[start:end + 1],
+        status_code=206,
+        media_type="audio/mpeg",
+        headers={**headers, "Content-Range": f"bytes {start}-{end}/{len(audio_bytes)}"}
+    )
+
+
+@router.get("/metrics")
+async def get_tts_metrics():
+    """
+    Get text-to-speech cache metrics.
+
+    Returns:
+        Hit/miss counters and memory usage of the synthesized audio cache
+        (shared with the web app through its on-disk tier) and progress of
+        the startup question audio synthesis, how many requests started
+        a synthesis (leaders) or joined one already in flight (coalesced),
+        and dispatcher queue wait versus synthesis time
+    """
+    return {
+        "cache": tts_cache.stats(),
+        "presynthesis": presynthesis,
+        "single_flight": speech_flights.stats(),
+        "dispatcher": tts_dispatcher.stats()
+    }
+
 
 @router.get("/voices")
 async def get_available_voices():
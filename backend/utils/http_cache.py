@@ -0,0 +1,67 @@
+"""
+HTTP Conditional and Range Request Helpers
+ETag matching and single byte-range parsing for static-like responses
+"""
+from typing import Optional, Tuple
+
+
+class RangeNotSatisfiableError(Exception):
+    """Raised when a Range header lies outside the resource."""
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches ``etag``.
+
+    Uses the weak comparison the header calls for, so ``W/"x"`` matches ``"x"``.
+    """
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    return any((tag[2:] if tag.startswith("W/") else tag) == opaque for tag in candidates)
+
+
+def parse_byte_range(range_header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single ``bytes=`` range against a resource of ``size`` bytes.
+
+    Args:
+        range_header: Value of the Range header (or None)
+        size: Length of the full resource
+
+    Returns:
+        Inclusive (start, end) offsets, or None to send the whole resource
+        (no header, another unit, several ranges or a malformed value)
+
+    Raises:
+        RangeNotSatisfiableError: If the range starts past the end
+    """
+    if not range_header or not range_header.startswith("bytes="):
+        return None
+    spec = range_header[len("bytes="):].strip()
+    if "," in spec or "-" not in spec:
+        return None
+
+    first, last = (part.strip() for part in spec.split("-", 1))
+    if not first and not last:
+        return None
+    if not (first or "0").isdigit() or not (last or "0").isdigit():
+        return None
+
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise RangeNotSatisfiableError()
+        return max(0, size - length), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size:
+        raise RangeNotSatisfiableError()
+    if end < start:
+        return None
+    return start, end
@@ -0,0 +1,120 @@
+"""
+Live Transcription over a Sliding Window
+Turns a stream of PCM frames into partial and final transcripts
+"""
+import asyncio
+from typing import Awaitable, Callable, List, Optional
+
+import numpy as np
+
+from config.settings import STT_STREAM_PARTIAL_SECONDS, STT_STREAM_WINDOW_SECONDS
+from services.stt_service import pcm16_to_float
+from services.vad import find_quiet_cut
+
+SAMPLE_RATE = 16000
+
+
+class LiveTranscriber:
+    """
+    Incremental transcription of a growing recording.
+
+    Audio that has been transcribed as part of a full window is committed
+    and never decoded again; only the uncommitted tail (shorter than one
+    window) is re-transcribed for each partial. When the speaker stops, the
+    final transcript only needs the tail decoded, so it is ready almost
+    immediately.
+    """
+
+    def __init__(
+        self,
+        transcribe: Callable[[np.ndarray], Awaitable[str]],
+        on_partial: Optional[Callable[[str], Awaitable[None]]] = None,
+        partial_seconds: float = STT_STREAM_PARTIAL_SECONDS,
+        window_seconds: float = STT_STREAM_WINDOW_SECONDS
+    ):
+        self.transcribe = transcribe
+        self.on_partial = on_partial
+        self.partial_samples = int(partial_seconds * SAMPLE_RATE)
+        self.window_samples = int(window_seconds * SAMPLE_RATE)
+        self.committed: List[str] = []
+        self.total_samples = 0
+        self._bytes_received = 0
+        self._buffer = bytearray()
+        self._last_partial_at = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pending_samples(self) -> int:
+        """Samples received but not yet committed."""
+        return len(self._buffer) // 2
+
+    @property
+    def duration(self) -> float:
+        """Seconds of audio received so far."""
+        return self.total_samples / SAMPLE_RATE
+
+    def add(self, pcm: bytes):
+        """
+        Append 16-bit little-endian PCM samples (16 kHz mono).
+
+        Frames need not be sample-aligned: a stray odd byte stays in the
+        buffer and completes its sample with the next frame.
+        """
+        self._buffer += pcm
+        self._bytes_received += len(pcm)
+        self.total_samples = self._bytes_received // 2
+
+    def partial_due(self) -> bool:
+        """Whether enough new audio arrived and no partial is in flight."""
+        if self._task is not None and not self._task.done():
+            return False
+        return self.total_samples - self._last_partial_at >= self.partial_samples
+
+    def start_partial(self) -> asyncio.Task:
+        """Transcribe the current window in the background and report it."""
+        self._last_partial_at = self.total_samples
+        self._task = asyncio.ensure_future(self._partial())
+        return self._task
+
+    async def finish(self) -> str:
+        """Wait for any partial in flight and return the final transcript."""
+        if self._task is not None:
+            try:
+                await self._task
+            except Exception:
+                pass
+
+        tail = ""
+        # A trailing half sample (odd byte) is dropped
+        n_samples = self.pending_samples
+        if n_samples:
+            tail = await self.transcribe(pcm16_to_float(bytes(self._buffer[:n_samples * 2])))
+        self._buffer.clear()
+        return self._join(self.committed + [tail])
+
+    async def _partial(self):
+        n_samples = self.pending_samples
+        audio = pcm16_to_float(bytes(self._buffer[:n_samples * 2]))
+
+        try:
+            if n_samples < self.window_samples:
+                text = await self.transcribe(audio)
+                partial = self._join(self.committed + [text])
+            else:
+                # Window is full: finalise everything up to a pause, keep the rest
+                cut = find_quiet_cut(audio[:self.window_samples])
+                text = await self.transcribe(audio[:cut])
+                self.committed.append(text)
+                del self._buffer[:cut * 2]
+                partial = self._join(self.committed)
+        except Exception:
+            # Partials are best effort (e.g. workers busy); the final pass
+            # still covers all uncommitted audio
+            return
+
+        if self.on_partial is not None:
+            await self.on_partial(partial)
+
+    @staticmethod
+    def _join(parts: List[str]) -> str:
+        return " ".join(part.strip() for part in parts if part and part.strip())
@@ -0,0 +1,107 @@
+"""
+Dynamic Micro-Batching for Whisper Transcription
+Collects concurrent requests for a short window and decodes them together
+"""
+import asyncio
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+
+from backend.utils.stt_worker import InferenceWorkerPool
+from config.settings import STT_BATCH_WINDOW_MS, STT_MAX_BATCH_SIZE
+from services.stt_engines import engine_transcribe_batch
+from services.stt_service import Transcription
+
+
+class MicroBatcher:
+    """
+    Groups transcription requests into batches for the worker pool.
+
+    A batch is flushed when ``max_batch_size`` requests are pending or
+    ``window_ms`` has passed since the first pending request arrived,
+    whichever comes first. Requests only share a batch when they use the
+    same decode options (preset and prompt).
+    """
+
+    def __init__(
+        self,
+        pool: InferenceWorkerPool,
+        window_ms: float = STT_BATCH_WINDOW_MS,
+        max_batch_size: int = STT_MAX_BATCH_SIZE
+    ):
+        self.pool = pool
+        self.window_ms = window_ms
+        self.max_batch_size = max(1, max_batch_size)
+        self._pending: Dict[tuple, List[Tuple[np.ndarray, asyncio.Future]]] = {}
+        self._timers: Dict[tuple, asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self.batches_run = 0
+        self.requests_batched = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of requests waiting for their batch window."""
+        return sum(len(items) for items in self._pending.values())
+
+    async def transcribe(self, audio: np.ndarray, **options) -> Transcription:
+        """
+        Queue a clip for the next batch and wait for its transcript.
+
+        Args:
+            audio: 16 kHz mono float32 array
+            **options: Decode options passed to engine_transcribe_batch (preset, prompt)
+
+        Returns:
+            Transcription of the clip
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = tuple(sorted(options.items()))
+        pending = self._pending.setdefault(key, [])
+        pending.append((audio, future))
+
+        if len(pending) >= self.max_batch_size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.window_ms / 1000, self._flush, key)
+
+        return await future
+
+    def _flush(self, key: tuple):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+        pending = self._pending.pop(key, [])
+        batch = pending[:self.max_batch_size]
+        if len(pending) > self.max_batch_size:
+            self._pending[key] = pending[self.max_batch_size:]
+            loop = asyncio.get_running_loop()
+            self._timers[key] = loop.call_later(self.window_ms / 1000, self._flush, key)
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._run_batch(batch, dict(key)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[np.ndarray, asyncio.Future]], options: dict):
+        self.batches_run += 1
+        self.requests_batched += len(batch)
+
+        try:
+            results = await self.pool.submit(
+                engine_transcribe_batch,
+                [audio for audio, _ in batch],
+                max_batch_size=self.max_batch_size,
+                **options
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
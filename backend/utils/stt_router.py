@@ -0,0 +1,87 @@
+"""
+Load-Adaptive Whisper Model Routing
+Sends transcriptions to a smaller Whisper model while the worker queue is deep
+"""
+from typing import Dict, Optional
+
+from backend.utils.stt_worker import InferenceWorkerPool
+from config.settings import STT_ROUTE_MAX_WAIT_SECONDS, STT_ROUTE_QUEUE_DEPTH
+
+# Weight of the newest decode time in the moving average
+EWMA_ALPHA = 0.2
+
+
+class ModelRouter:
+    """
+    Chooses the Whisper model size for each transcription request.
+
+    Requests go to ``primary`` until the pool's queue depth reaches
+    ``max_queue_depth`` or the predicted queue wait exceeds
+    ``max_wait_seconds``; they then go to ``fallback``. The router returns
+    to ``primary`` once both measures drop below half their threshold, so
+    it does not flap around the limit.
+    """
+
+    def __init__(
+        self,
+        pool: InferenceWorkerPool,
+        primary: str,
+        fallback: str,
+        max_queue_depth: int = STT_ROUTE_QUEUE_DEPTH,
+        max_wait_seconds: float = STT_ROUTE_MAX_WAIT_SECONDS
+    ):
+        self.pool = pool
+        self.primary = primary
+        self.fallback = fallback
+        self.max_queue_depth = max(1, max_queue_depth)
+        self.max_wait_seconds = max_wait_seconds
+        self.current = primary
+        self.switches = 0
+        self.requests: Dict[str, int] = {primary: 0, fallback: 0}
+        # Moving average of worker seconds per decode job
+        self.decode_seconds: Optional[float] = None
+
+    @property
+    def predicted_wait(self) -> float:
+        """Seconds a new job is expected to wait for a free worker."""
+        if self.decode_seconds is None:
+            return 0.0
+        return self.pool.queue_depth * self.decode_seconds / self.pool.num_workers
+
+    def choose(self) -> str:
+        """Model name for the next request under the current load."""
+        depth = self.pool.queue_depth
+        wait = self.predicted_wait
+
+        if self.current == self.primary:
+            overloaded = depth >= self.max_queue_depth or wait > self.max_wait_seconds
+            if overloaded:
+                self.current = self.fallback
+                self.switches += 1
+        elif depth <= self.max_queue_depth // 2 and wait <= self.max_wait_seconds / 2:
+            self.current = self.primary
+            self.switches += 1
+
+        self.requests[self.current] += 1
+        return self.current
+
+    def record(self, decode_seconds: float):
+        """Fold one finished job's decode time into the moving average."""
+        if self.decode_seconds is None:
+            self.decode_seconds = decode_seconds
+        else:
+            self.decode_seconds += EWMA_ALPHA * (decode_seconds - self.decode_seconds)
+
+    def stats(self) -> dict:
+        """Current model, thresholds and per-model request counts."""
+        return {
+            "primary": self.primary,
+            "fallback": self.fallback,
+            "current": self.current,
+            "switches": self.switches,
+            "requests": dict(self.requests),
+            "max_queue_depth": self.max_queue_depth,
+            "max_wait_seconds": self.max_wait_seconds,
+            "predicted_wait_seconds": round(self.predicted_wait, 2),
+            "decode_seconds": round(self.decode_seconds, 3) if self.decode_seconds is not None else None
+        }
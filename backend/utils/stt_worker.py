@@ -0,0 +1,222 @@
+"""
+Whisper Inference Worker Pool
+Runs blocking model calls on dedicated threads so async routes only do I/O
+"""
+import asyncio
+import queue
+import threading
+from typing import Any, Callable, List, Optional
+
+from config.settings import STT_CPU_CORES, STT_WORKERS, STT_QUEUE_SIZE
+
+
+class QueueFullError(Exception):
+    """Raised when the inference job queue is at capacity."""
+
+
+class WorkerStartupError(Exception):
+    """Raised when no worker could load its model."""
+
+
+def _set_result(future: asyncio.Future, result: Any):
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future, exc: BaseException):
+    if not future.done():
+        future.set_exception(exc)
+
+
+class InferenceWorkerPool:
+    """
+    Bounded job queue served by a fixed set of inference threads.
+
+    Every worker owns a model replica created by ``model_factory``. Whisper
+    installs kv-cache hooks on the model while decoding, so two threads must
+    never decode on the same model object at the same time.
+
+    If ``warm_up`` is given, each worker calls ``warm_up(model)`` on its own
+    replica before taking jobs; ``ready`` turns true once every worker has
+    loaded and warmed up (or failed to load) its model.
+    """
+
+    def __init__(
+        self,
+        model_factory: Callable[[], Any],
+        num_workers: int = STT_WORKERS,
+        max_queue: int = STT_QUEUE_SIZE,
+        cpu_cores: int = STT_CPU_CORES,
+        warm_up: Optional[Callable[[Any], Any]] = None
+    ):
+        self.model_factory = model_factory
+        self.warm_up = warm_up
+        self.num_workers = max(1, num_workers)
+        self.cpu_cores = max(1, cpu_cores)
+        self._jobs: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._threads: List[threading.Thread] = []
+        self._busy = 0
+        self._lock = threading.Lock()
+        # Workers whose model_factory() raised, and the first such error
+        self.failed_workers = 0
+        self.error: Optional[BaseException] = None
+        # Workers whose model is loaded and warmed up
+        self.ready_workers = 0
+        self._all_started = threading.Event()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting for a free worker."""
+        return self._jobs.qsize()
+
+    @property
+    def busy_workers(self) -> int:
+        """Number of workers currently running a job."""
+        return self._busy
+
+    @property
+    def failed(self) -> bool:
+        """Whether every worker failed to load its model."""
+        return self.failed_workers >= self.num_workers
+
+    @property
+    def ready(self) -> bool:
+        """Whether every worker has started and at least one can serve jobs."""
+        return self._all_started.is_set() and not self.failed
+
+    def wait_started(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every worker has warmed up or failed to load its model.
+
+        Returns:
+            False if the timeout passed first
+        """
+        return self._all_started.wait(timeout)
+
+    def start(self, first_model: Optional[Any] = None):
+        """
+        Start the worker threads.
+
+        Args:
+            first_model: Already-loaded model to reuse for the first worker
+        """
+        import torch
+
+        # Split the core budget between workers so they don't oversubscribe
+        torch.set_num_threads(max(1, self.cpu_cores // self.num_workers))
+
+        for idx in range(self.num_workers):
+            model = first_model if idx == 0 else None
+            thread = threading.Thread(
+                target=self._run,
+                args=(model,),
+                name=f"stt-worker-{idx}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def shutdown(self, timeout: float = 5.0):
+        """Stop the workers after they finish their current job."""
+        # Queued jobs are dropped so the stop signals always fit in the queue
+        self._fail_queued(RuntimeError("Inference workers are shutting down"))
+        for _ in self._threads:
+            try:
+                self._jobs.put_nowait(None)
+            except queue.Full:
+                break
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        # Release anyone still waiting for startup
+        self._all_started.set()
+
+    async def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run ``fn(*args, model=<worker model>, **kwargs)`` on a worker.
+
+        Returns:
+            Whatever ``fn`` returns
+
+        Raises:
+            QueueFullError: If the job queue is full
+            WorkerStartupError: If no worker could load its model
+        """
+        if self.failed:
+            raise WorkerStartupError(f"Inference workers failed to start: {self.error}")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        try:
+            self._jobs.put_nowait((fn, args, kwargs, future, loop))
+        except queue.Full:
+            raise QueueFullError(
+                f"Transcription queue is full ({self._jobs.maxsize} waiting)"
+            )
+        # The last worker may have failed while this job was being queued
+        if self.failed:
+            self._fail_queued(WorkerStartupError(f"Inference workers failed to start: {self.error}"))
+        return await future
+
+    def _fail_queued(self, exc: BaseException):
+        """Fail every job still waiting in the queue."""
+        while True:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                return
+            if job is not None:
+                _, _, _, future, loop = job
+                loop.call_soon_threadsafe(_set_exception, future, exc)
+
+    def _worker_started(self):
+        with self._lock:
+            if self.ready_workers + self.failed_workers >= self.num_workers:
+                self._all_started.set()
+
+    def _run(self, model: Optional[Any]):
+        if model is None:
+            try:
+                model = self.model_factory()
+            except Exception as e:
+                with self._lock:
+                    self.failed_workers += 1
+                    if self.error is None:
+                        self.error = e
+                    all_failed = self.failed
+                # Nobody is left to serve the queue
+                if all_failed:
+                    self._fail_queued(WorkerStartupError(f"Inference workers failed to start: {e}"))
+                self._worker_started()
+                return
+
+        if self.warm_up is not None:
+            try:
+                self.warm_up(model)
+            except Exception:
+                # Only the first request pays for a failed warm-up
+                pass
+        with self._lock:
+            self.ready_workers += 1
+        self._worker_started()
+
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+
+            fn, args, kwargs, future, loop = job
+            # Client disconnected while the job was queued
+            if future.cancelled():
+                continue
+
+            with self._lock:
+                self._busy += 1
+            try:
+                result = fn(*args, model=model, **kwargs)
+            except Exception as e:
+                loop.call_soon_threadsafe(_set_exception, future, e)
+            else:
+                loop.call_soon_threadsafe(_set_result, future, result)
+            finally:
+                with self._lock:
+                    self._busy -= 1
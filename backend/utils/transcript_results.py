@@ -0,0 +1,173 @@
+"""
+Two-Pass Transcription Results
+Holds refined transcripts until clients or the grading route pick them up
+"""
+import asyncio
+import hashlib
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from backend.models.schemas import STTResponse, TranscriptResult
+from config.settings import STT_RESULTS_DIR, STT_RESULTS_MAX
+from services.cache import TwoTierCache
+
+# How often a waiter re-reads a result refined by another process
+POLL_SECONDS = 0.25
+
+
+def _answer_key(session_id: str, question_id: int) -> str:
+    return hashlib.sha256(f"{session_id}\n{question_id}".encode()).hexdigest()
+
+
+def _is_result_id(value: str) -> bool:
+    # Result IDs double as file names in the shared store
+    return len(value) == 32 and all(c in "0123456789abcdef" for c in value)
+
+
+class TranscriptResults:
+    """
+    Bounded store of two-pass results, oldest evicted first.
+
+    A result starts ``pending`` with the draft transcript and becomes
+    ``ready`` (or ``failed``) when the larger model finishes. Results can be
+    looked up by ID, or by session and question for the grading route.
+
+    With a ``directory``, every result is also written to a disk-only
+    TwoTierCache there, so API worker processes sharing the directory can
+    serve (and wait for) results refined by one another. Disk access runs
+    on a thread, which is why lookups and updates are coroutines.
+    """
+
+    def __init__(self, max_results: int = STT_RESULTS_MAX, directory: Optional[str] = None):
+        self.max_results = max(1, max_results)
+        # No memory tier: another process may update an entry at any time
+        self.shared = TwoTierCache(0, directory) if directory else None
+        self._results: "OrderedDict[str, TranscriptResult]" = OrderedDict()
+        self._done: Dict[str, asyncio.Event] = {}
+        self._by_answer: Dict[Tuple[str, int], str] = {}
+        self._answer_of: Dict[str, Tuple[str, int]] = {}
+
+    async def create(self, draft: str, session_id: Optional[str] = None,
+                     question_id: Optional[int] = None) -> str:
+        """Register a pending result for ``draft`` and return its ID."""
+        result_id = uuid.uuid4().hex
+        result = TranscriptResult(result_id=result_id, status="pending", draft=draft)
+        self._results[result_id] = result
+        self._done[result_id] = asyncio.Event()
+        answer = None
+        if session_id and question_id is not None:
+            answer = (session_id, question_id)
+            self._by_answer[answer] = result_id
+            self._answer_of[result_id] = answer
+
+        evicted = []
+        while len(self._results) > self.max_results:
+            old_id, _ = self._results.popitem(last=False)
+            self._done.pop(old_id).set()
+            old_answer = self._answer_of.pop(old_id, None)
+            if old_answer is not None and self._by_answer.get(old_answer) == old_id:
+                del self._by_answer[old_answer]
+            evicted.append((old_id, old_answer))
+
+        if self.shared is not None:
+            await self._share(result)
+            if answer is not None:
+                await self.shared.aset(_answer_key(*answer), result_id.encode())
+            for old_id, old_answer in evicted:
+                await self.shared.adelete(old_id)
+                if old_answer is None:
+                    continue
+                # Another request (or process) may have re-pointed the answer since
+                key = _answer_key(*old_answer)
+                if await self.shared.aget(key) == old_id.encode():
+                    await self.shared.adelete(key)
+        return result_id
+
+    async def resolve(self, result_id: str, final: STTResponse):
+        """Store the refined transcript and wake up waiters."""
+        if result_id in self._results:
+            await self._update(result_id, {"status": "ready", "final": final})
+
+    async def fail(self, result_id: str, error: str):
+        """Mark refinement as failed (the draft stays usable)."""
+        if result_id in self._results:
+            await self._update(result_id, {"status": "failed", "error": error})
+
+    async def get(self, result_id: str) -> Optional[TranscriptResult]:
+        """Current state of a result, or None if unknown or evicted."""
+        result = self._results.get(result_id)
+        if result is None and self.shared is not None and _is_result_id(result_id):
+            # Created by another worker process
+            data = await self.shared.aget(result_id)
+            if data is not None:
+                result = TranscriptResult.model_validate_json(data)
+        return result
+
+    async def find(self, session_id: str, question_id: int) -> Optional[str]:
+        """ID of the latest two-pass result for a session's answer."""
+        result_id = self._by_answer.get((session_id, question_id))
+        if result_id is None and self.shared is not None:
+            data = await self.shared.aget(_answer_key(session_id, question_id))
+            if data is not None:
+                result_id = data.decode()
+        return result_id
+
+    def clear(self):
+        """Forget every result, including those in the shared directory."""
+        for done in self._done.values():
+            done.set()
+        self._results.clear()
+        self._done.clear()
+        self._by_answer.clear()
+        self._answer_of.clear()
+        if self.shared is not None:
+            self.shared.clear()
+
+    async def wait(self, result_id: str, timeout: float) -> Optional[TranscriptResult]:
+        """
+        Wait up to ``timeout`` seconds for a result to leave ``pending``.
+
+        Returns:
+            The result in whatever state it reached, or None if unknown
+        """
+        done = self._done.get(result_id)
+        if done is None:
+            return await self._poll(result_id, timeout)
+        try:
+            await asyncio.wait_for(done.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return await self.get(result_id)
+
+    async def _poll(self, result_id: str, timeout: float) -> Optional[TranscriptResult]:
+        """Wait for a result owned by another process by re-reading the shared store."""
+        deadline = time.monotonic() + timeout
+        while True:
+            result = await self.get(result_id)
+            if result is None or result.status != "pending" or time.monotonic() >= deadline:
+                return result
+            await asyncio.sleep(min(POLL_SECONDS, max(0.0, deadline - time.monotonic())))
+
+    async def _update(self, result_id: str, changes: dict):
+        result = self._results[result_id].model_copy(update=changes)
+        self._results[result_id] = result
+        # Local waiters read memory; other processes see the shared copy once written
+        self._done[result_id].set()
+        if self.shared is not None:
+            await self._share(result)
+
+    async def _share(self, result: TranscriptResult):
+        await self.shared.aset(result.result_id, result.model_dump_json().encode())
+
+    def stats(self) -> dict:
+        """Number of stored results by status."""
+        counts = {"pending": 0, "ready": 0, "failed": 0}
+        for result in self._results.values():
+            counts[result.status] += 1
+        return counts
+
+
+# Shared by the STT routes (which create results) and the grading route
+transcript_results = TranscriptResults(directory=STT_RESULTS_DIR)
@@ -0,0 +1,101 @@
+"""
+Outbound Speech Synthesis Dispatcher
+Caps concurrent Edge TTS syntheses and bounds the queue waiting for them
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from config.settings import TTS_MAX_CONCURRENCY, TTS_QUEUE_SIZE, TTS_QUEUE_TIMEOUT_SECONDS
+
+
+class TTSBusyError(Exception):
+    """Raised when a synthesis cannot start (queue full or deadline passed)."""
+
+
+class TTSDispatcher:
+    """
+    Admission control for outbound syntheses.
+
+    At most ``max_concurrency`` syntheses run at once and at most
+    ``max_queue`` wait for a slot. A request arriving to a full queue is
+    rejected immediately; a queued request that has not started within
+    ``queue_timeout`` seconds is rejected at its deadline.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = TTS_MAX_CONCURRENCY,
+        max_queue: int = TTS_QUEUE_SIZE,
+        queue_timeout: float = TTS_QUEUE_TIMEOUT_SECONDS
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout = queue_timeout
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.queue_wait_seconds = 0.0
+        self.max_queue_wait_seconds = 0.0
+        self.synthesis_seconds = 0.0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Hold a synthesis slot for the duration of the ``async with`` block.
+
+        Raises:
+            TTSBusyError: If the queue is full or the wait passes its deadline
+        """
+        if self.active + self.waiting >= self.max_concurrency + self.max_queue:
+            self.rejected += 1
+            raise TTSBusyError("Speech synthesis queue is full")
+
+        queued = time.perf_counter()
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            self._record_wait(time.perf_counter() - queued)
+            raise TTSBusyError("Timed out waiting for a speech synthesis slot")
+        finally:
+            self.waiting -= 1
+
+        started = time.perf_counter()
+        self.admitted += 1
+        self._record_wait(started - queued)
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self.synthesis_seconds += time.perf_counter() - started
+            self._slots.release()
+
+    def _record_wait(self, wait: float):
+        self.queue_wait_seconds += wait
+        self.max_queue_wait_seconds = max(self.max_queue_wait_seconds, wait)
+
+    def stats(self) -> dict:
+        """Slot usage, admission counters and queue wait versus synthesis time."""
+        admitted = max(self.admitted, 1)
+        waited = max(self.admitted + self.timed_out, 1)
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "queue_timeout_seconds": self.queue_timeout,
+            "active": self.active,
+            "waiting": self.waiting,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            # Timed-out requests waited too, so they count towards queue wait
+            "avg_queue_wait_seconds": round(self.queue_wait_seconds / waited, 3),
+            "max_queue_wait_seconds": round(self.max_queue_wait_seconds, 3),
+            "avg_synthesis_seconds": round(self.synthesis_seconds / admitted, 3)
+        }
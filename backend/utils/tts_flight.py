@@ -0,0 +1,112 @@
+"""
+Single-Flight Speech Synthesis
+Concurrent requests for the same text and voice share one Edge TTS synthesis
+"""
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from backend.utils.tts_dispatcher import TTSDispatcher
+from services.tts_service import stream_and_cache
+
+
+class _Flight:
+    """Chunks of one in-flight synthesis, replayed to every subscriber."""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.changed = asyncio.Condition()
+        self.task: Optional[asyncio.Task] = None
+
+    async def publish(self, chunk: bytes):
+        async with self.changed:
+            self.chunks.append(chunk)
+            self.changed.notify_all()
+
+    async def finish(self, error: Optional[BaseException] = None):
+        async with self.changed:
+            self.done = True
+            self.error = error
+            self.changed.notify_all()
+
+    async def subscribe(self) -> AsyncIterator[bytes]:
+        sent = 0
+        while True:
+            async with self.changed:
+                await self.changed.wait_for(lambda: self.done or len(self.chunks) > sent)
+                chunks = self.chunks[sent:]
+                done, error = self.done, self.error
+            for chunk in chunks:
+                yield chunk
+            sent += len(chunks)
+            if done and sent == len(self.chunks):
+                if error is not None:
+                    raise error
+                return
+
+
+class SpeechSingleFlight:
+    """
+    Coalesces identical in-flight synthesis requests by (text, voice).
+
+    The first request (the leader) starts a synthesis task; requests that
+    arrive while it runs subscribe to the same task and receive every chunk
+    from the start. The task is not tied to any one client, so a leader that
+    disconnects does not cancel the audio for the others. The finished audio
+    is cached before the flight ends, so later requests hit the cache.
+    Each synthesis holds a ``dispatcher`` slot while it runs.
+    """
+
+    def __init__(self, dispatcher: TTSDispatcher):
+        self.dispatcher = dispatcher
+        self._flights: Dict[Tuple[str, str], _Flight] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def stream(self, text: str, voice: str) -> AsyncIterator[bytes]:
+        """
+        MP3 chunks for ``text`` spoken by ``voice``, joining an identical
+        in-flight synthesis if there is one.
+
+        Raises (while iterating):
+            TTSBusyError: If the dispatcher could not admit the synthesis
+            Exception: Whatever the shared synthesis failed with
+        """
+        key = (text, voice)
+        flight = self._flights.get(key)
+        if flight is None:
+            self.leaders += 1
+            flight = _Flight()
+            self._flights[key] = flight
+            flight.task = asyncio.create_task(self._run(key, flight))
+        else:
+            self.coalesced += 1
+        return flight.subscribe()
+
+    async def synthesize(self, text: str, voice: str) -> bytes:
+        """Complete MP3 for ``text`` spoken by ``voice`` (single-flight)."""
+        return b"".join([chunk async for chunk in self.stream(text, voice)])
+
+    async def _run(self, key: Tuple[str, str], flight: _Flight):
+        error = None
+        try:
+            async with self.dispatcher.slot():
+                async for chunk in stream_and_cache(*key):
+                    await flight.publish(chunk)
+        except asyncio.CancelledError:
+            error = RuntimeError("Speech synthesis was cancelled")
+            raise
+        except Exception as e:
+            error = e
+        finally:
+            self._flights.pop(key, None)
+            await flight.finish(error)
+
+    def stats(self) -> dict:
+        """Leader (synthesis) and coalesced (shared) request counts."""
+        return {
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._flights)
+        }
@@ -0,0 +1,280 @@
+"""
+Streaming Audio Uploads
+Parses multipart uploads as they arrive and pipes the audio into ffmpeg
+"""
+import asyncio
+import os
+import shutil
+import tempfile
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import numpy as np
+from fastapi import Request
+
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ModuleNotFoundError:  # python-multipart < 0.0.13
+    from multipart.multipart import MultipartParser, parse_options_header
+
+from config.settings import STT_MAX_AUDIO_SECONDS, STT_SPOOL_MEMORY_BYTES
+from services.stt_service import (
+    decode_audio,
+    decode_audio_file,
+    ffmpeg_decode_command,
+    pcm16_to_float
+)
+
+SAMPLE_RATE = 16000
+
+# Bytes read from ffmpeg stdout per iteration
+PCM_READ_SIZE = 64 * 1024
+
+
+class UploadTooLargeError(Exception):
+    """Raised as soon as an upload exceeds its byte limit."""
+
+
+class AudioTooLongError(Exception):
+    """Raised as soon as decoded audio exceeds the duration limit."""
+
+
+class UploadFormatError(Exception):
+    """Raised when the request body is not valid multipart/form-data."""
+
+
+class UploadPart:
+    """Headers of one multipart form part."""
+
+    def __init__(self, headers: Dict[bytes, bytes]):
+        _, params = parse_options_header(headers.get(b"content-disposition", b""))
+        self.name = params.get(b"name", b"").decode("utf-8", "replace")
+        filename = params.get(b"filename")
+        self.filename = filename.decode("utf-8", "replace") if filename else None
+        self.content_type = headers.get(b"content-type", b"").decode("latin-1")
+
+
+async def stream_multipart(request: Request, max_bytes: int) -> AsyncIterator[Tuple[UploadPart, bytes]]:
+    """
+    Yield ``(part, chunk)`` pairs while a multipart body is being received.
+
+    Args:
+        request: Incoming request with a multipart/form-data body
+        max_bytes: Maximum body size; exceeding it aborts the upload
+
+    Raises:
+        UploadTooLargeError: If Content-Length or the received bytes exceed max_bytes
+        UploadFormatError: If the body is not multipart/form-data
+    """
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        raise UploadTooLargeError(f"Content-Length {content_length} exceeds {max_bytes} bytes")
+
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise UploadFormatError("Expected a multipart/form-data request body")
+
+    events: List[Tuple[UploadPart, bytes]] = []
+    state = {"field": b"", "value": b"", "headers": {}, "part": None}
+
+    def on_header_field(data, start, end):
+        state["field"] += data[start:end]
+
+    def on_header_value(data, start, end):
+        state["value"] += data[start:end]
+
+    def on_header_end():
+        state["headers"][state["field"].lower()] = state["value"]
+        state["field"] = b""
+        state["value"] = b""
+
+    def on_headers_finished():
+        state["part"] = UploadPart(state["headers"])
+        state["headers"] = {}
+
+    def on_part_data(data, start, end):
+        events.append((state["part"], bytes(data[start:end])))
+
+    parser = MultipartParser(params[b"boundary"], {
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_header_end": on_header_end,
+        "on_headers_finished": on_headers_finished,
+        "on_part_data": on_part_data
+    })
+
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > max_bytes:
+            raise UploadTooLargeError(f"Upload exceeds {max_bytes} bytes")
+
+        parser.write(chunk)
+        for event in events:
+            yield event
+        events.clear()
+
+    parser.finalize()
+    for event in events:
+        yield event
+
+
+class StreamingAudioDecoder:
+    """
+    Decodes an upload to 16 kHz float32 while its chunks are still arriving.
+
+    WAV uploads are buffered and decoded in one step (16 kHz mono PCM needs
+    no ffmpeg at all). Compressed formats are written to ffmpeg's stdin as
+    they arrive while a reader task collects PCM from stdout, so decoding
+    finishes shortly after the last byte is received. MP4/M4A bytes are also
+    spooled in case the moov atom sits at the end of the file and ffmpeg
+    cannot demux the stream from a pipe.
+    """
+
+    def __init__(self, max_seconds: float = STT_MAX_AUDIO_SECONDS):
+        self.max_samples = int(max_seconds * SAMPLE_RATE)
+        self.bytes_received = 0
+        self._head = bytearray()
+        self._wav: Optional[bytearray] = None
+        self._spool = None
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._stdin_open = False
+        self._pcm = bytearray()
+        self._too_long = False
+        self._reader: Optional[asyncio.Task] = None
+        self._stderr: Optional[asyncio.Task] = None
+
+    async def feed(self, chunk: bytes):
+        """
+        Pass the next chunk of the upload to the decoder.
+
+        Raises:
+            AudioTooLongError: If the decoded audio already exceeds the limit
+        """
+        if self._too_long:
+            raise AudioTooLongError(f"Audio exceeds {self.max_samples // SAMPLE_RATE} seconds")
+        self.bytes_received += len(chunk)
+
+        if self._wav is not None:
+            self._wav += chunk
+            return
+
+        if self._process is None:
+            # Buffer until the container can be sniffed
+            self._head += chunk
+            if len(self._head) < 12:
+                return
+            if self._head[:4] == b"RIFF" and self._head[8:12] == b"WAVE":
+                self._wav = self._head
+                return
+            if self._head[4:8] == b"ftyp":
+                self._spool = tempfile.SpooledTemporaryFile(max_size=STT_SPOOL_MEMORY_BYTES)
+            await self._start_ffmpeg()
+            chunk = bytes(self._head)
+            self._head = bytearray()
+
+        if self._spool is not None:
+            self._spool.write(chunk)
+        await self._write_stdin(chunk)
+
+    async def finish(self) -> np.ndarray:
+        """
+        Signal the end of the upload and return the decoded samples.
+
+        Raises:
+            AudioTooLongError: If the decoded audio exceeds the limit
+            RuntimeError: If the audio cannot be decoded
+        """
+        try:
+            if self._process is None:
+                data = self._wav if self._wav is not None else self._head
+                if not data:
+                    raise RuntimeError("Failed to decode audio: empty upload")
+                audio = await asyncio.to_thread(decode_audio, data)
+            else:
+                audio = await self._finish_ffmpeg()
+        finally:
+            self.close()
+
+        if self._too_long or len(audio) > self.max_samples:
+            raise AudioTooLongError(f"Audio exceeds {self.max_samples // SAMPLE_RATE} seconds")
+        return audio
+
+    def close(self):
+        """Release the ffmpeg process and spool (safe to call repeatedly)."""
+        if self._process is not None and self._process.returncode is None:
+            if self._stdin_open:
+                self._stdin_open = False
+                self._process.stdin.close()
+            self._process.kill()
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+
+    async def _start_ffmpeg(self):
+        try:
+            self._process = await asyncio.create_subprocess_exec(
+                *ffmpeg_decode_command("pipe:0"),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except OSError as e:
+            # ffmpeg missing or not executable
+            raise RuntimeError(f"Failed to decode audio: cannot run ffmpeg ({e})") from e
+        self._stdin_open = True
+        self._reader = asyncio.ensure_future(self._read_pcm())
+        self._stderr = asyncio.ensure_future(self._process.stderr.read())
+
+    async def _write_stdin(self, chunk: bytes):
+        if not self._stdin_open:
+            return
+        try:
+            self._process.stdin.write(chunk)
+            # Backpressure: don't outrun ffmpeg
+            await self._process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            # ffmpeg gave up on the stream; the spool fallback may still work
+            self._stdin_open = False
+
+    async def _read_pcm(self):
+        while True:
+            data = await self._process.stdout.read(PCM_READ_SIZE)
+            if not data:
+                break
+            self._pcm += data
+            if len(self._pcm) > self.max_samples * 2:
+                self._too_long = True
+                self._process.kill()
+                break
+
+    async def _finish_ffmpeg(self) -> np.ndarray:
+        if self._stdin_open:
+            self._stdin_open = False
+            try:
+                self._process.stdin.close()
+                await self._process.stdin.wait_closed()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        await self._reader
+        stderr = await self._stderr
+        await self._process.wait()
+
+        if self._too_long:
+            raise AudioTooLongError(f"Audio exceeds {self.max_samples // SAMPLE_RATE} seconds")
+        if self._process.returncode == 0 and self._pcm:
+            return pcm16_to_float(self._pcm)
+
+        if self._spool is None:
+            raise RuntimeError(f"Failed to decode audio: {stderr.decode(errors='ignore')[-500:]}")
+        return await asyncio.to_thread(self._decode_spool)
+
+    def _decode_spool(self) -> np.ndarray:
+        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
+            self._spool.seek(0)
+            shutil.copyfileobj(self._spool, tmp_file)
+            tmp_file_path = tmp_file.name
+        try:
+            return decode_audio_file(tmp_file_path)
+        finally:
+            os.unlink(tmp_file_path)
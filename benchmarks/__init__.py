@@ -0,0 +1,4 @@
+"""
+Benchmarks package initialization
+Run each benchmark from the project root with ``python -m benchmarks.<name>``
+"""
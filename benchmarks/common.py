@@ -0,0 +1,90 @@
+"""
+Shared Benchmark Helpers
+Fixture loading, word error rate and real-time factor
+"""
+import os
+import re
+import time
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from services.stt_service import decode_audio
+
+SAMPLE_RATE = 16000
+
+AUDIO_EXTENSIONS = ('.wav', '.mp3', '.m4a', '.webm', '.aac', '.mp4', '.flac', '.ogg')
+
+
+def load_fixtures(directory: str) -> List[Tuple[str, np.ndarray, str]]:
+    """
+    Load ``<name>.<audio ext>`` files with matching ``<name>.txt`` references.
+
+    Returns:
+        (name, 16 kHz float32 audio, reference transcript) per fixture
+    """
+    fixtures = []
+    for filename in sorted(os.listdir(directory)):
+        name, ext = os.path.splitext(filename)
+        reference_path = os.path.join(directory, name + ".txt")
+        if ext.lower() not in AUDIO_EXTENSIONS or not os.path.exists(reference_path):
+            continue
+
+        with open(os.path.join(directory, filename), "rb") as f:
+            audio = decode_audio(f.read())
+        with open(reference_path, encoding="utf-8") as f:
+            reference = f.read().strip()
+        fixtures.append((name, audio, reference))
+
+    if not fixtures:
+        raise SystemExit(f"No audio/.txt fixture pairs found in {directory}")
+    return fixtures
+
+
+def normalize_text(text: str) -> List[str]:
+    """Lowercase, drop punctuation and split into words."""
+    return re.sub(r"[^a-z0-9' ]+", " ", text.lower()).split()
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """Word-level Levenshtein distance divided by the reference length."""
+    ref = normalize_text(reference)
+    hyp = normalize_text(hypothesis)
+    if not ref:
+        return float(bool(hyp))
+
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word)
+            )
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def evaluate(transcribe: Callable[[np.ndarray], str],
+             fixtures: List[Tuple[str, np.ndarray, str]]) -> dict:
+    """
+    Transcribe every fixture and aggregate accuracy and speed.
+
+    Returns:
+        Mean WER and overall real-time factor (processing time / audio time)
+    """
+    errors = []
+    audio_seconds = 0.0
+    elapsed = 0.0
+    for _, audio, reference in fixtures:
+        start = time.perf_counter()
+        hypothesis = transcribe(audio)
+        elapsed += time.perf_counter() - start
+        audio_seconds += len(audio) / SAMPLE_RATE
+        errors.append(word_error_rate(reference, hypothesis))
+
+    return {
+        "wer": sum(errors) / len(errors),
+        "rtf": elapsed / audio_seconds
+    }
@@ -0,0 +1,61 @@
+"""
+Import Cost Benchmark
+Measures import time and baseline RSS of the API and service modules
+
+Each module is imported in a fresh interpreter, so the numbers are what a
+cold process pays before serving its first request. Also lists which heavy
+frameworks the import pulled in.
+
+Usage:
+    python -m benchmarks.import_cost
+    python -m benchmarks.import_cost --modules backend.main services --runs 5
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("torch", "whisper", "streamlit", "google.genai", "edge_tts")
+
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "heavy": [name for name in {heavy!r} if name in sys.modules]
+}}))
+"""
+
+
+def measure(module: str) -> dict:
+    """Import ``module`` in a fresh interpreter and report its cost."""
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(args):
+    print(f"{'module':<28} {'import_s':>9} {'max_rss_mb':>11}  heavy imports")
+    for module in args.modules:
+        runs = [measure(module) for _ in range(args.runs)]
+        seconds = statistics.median(run["seconds"] for run in runs)
+        rss = statistics.median(run["max_rss_mb"] for run in runs)
+        heavy = ", ".join(runs[-1]["heavy"]) or "-"
+        print(f"{module:<28} {seconds:>9.2f} {rss:>11.0f}  {heavy}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--modules", nargs="+",
+                        default=["backend.main", "services", "services.stt_service",
+                                 "backend.routes.stt_routes"],
+                        help="Modules to import")
+    parser.add_argument("--runs", type=int, default=3,
+                        help="Fresh interpreters per module (median is reported)")
+    main(parser.parse_args())
@@ -0,0 +1,107 @@
+"""
+Micro-Batching Benchmark
+Measures transcription throughput and latency against the batch window
+
+Usage:
+    python -m benchmarks.stt_batching --audio answer1.wav answer2.m4a \
+        --requests 32 --rate 20 --windows 0 5 10 25 50
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import numpy as np
+
+from backend.utils.stt_batcher import MicroBatcher
+from backend.utils.stt_worker import InferenceWorkerPool
+from services.stt_engines import WhisperEngine, engine_transcribe_batch
+from services.stt_service import decode_audio
+
+
+async def run_unbatched(pool: InferenceWorkerPool, audios: List[np.ndarray], rate: float):
+    """Send every request to the pool on its own."""
+    async def submit(audio):
+        results = await pool.submit(engine_transcribe_batch, [audio])
+        return results[0]
+
+    return await _drive(submit, audios, rate)
+
+
+async def run_batched(pool: InferenceWorkerPool, audios: List[np.ndarray], rate: float,
+                      window_ms: float, max_batch_size: int):
+    """Send requests through a MicroBatcher with the given window."""
+    batcher = MicroBatcher(pool, window_ms=window_ms, max_batch_size=max_batch_size)
+    stats = await _drive(batcher.transcribe, audios, rate)
+    stats["avg_batch"] = batcher.requests_batched / max(batcher.batches_run, 1)
+    return stats
+
+
+async def _drive(transcribe, audios: List[np.ndarray], rate: float) -> dict:
+    latencies = []
+
+    async def one(audio, delay):
+        await asyncio.sleep(delay)
+        start = time.perf_counter()
+        await transcribe(audio)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(audio, idx / rate) for idx, audio in enumerate(audios)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "throughput": len(audios) / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(0.95 * (len(latencies) - 1))],
+        "avg_batch": 1.0
+    }
+
+
+async def main(args):
+    clips = []
+    for path in args.audio:
+        with open(path, "rb") as f:
+            clips.append(decode_audio(f.read()))
+    audios = [clips[idx % len(clips)] for idx in range(args.requests)]
+
+    print(f"Loading {args.workers} model replica(s)...")
+    pool = InferenceWorkerPool(WhisperEngine, num_workers=args.workers,
+                               max_queue=args.requests)
+    pool.start()
+
+    # Warm up every worker so model loading doesn't skew the first run
+    await asyncio.gather(*(pool.submit(engine_transcribe_batch, [clips[0]])
+                           for _ in range(args.workers)))
+
+    print(f"\n{args.requests} requests arriving at {args.rate}/s\n")
+    print(f"{'window_ms':>10} {'req/s':>8} {'p50_s':>8} {'p95_s':>8} {'avg_batch':>10}")
+
+    for window_ms in args.windows:
+        if window_ms <= 0:
+            stats = await run_unbatched(pool, audios, args.rate)
+            label = "off"
+        else:
+            stats = await run_batched(pool, audios, args.rate, window_ms, args.max_batch_size)
+            label = f"{window_ms:g}"
+        print(f"{label:>10} {stats['throughput']:>8.2f} {stats['p50']:>8.2f} "
+              f"{stats['p95']:>8.2f} {stats['avg_batch']:>10.1f}")
+
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--audio", nargs="+", required=True,
+                        help="Audio files used as request payloads")
+    parser.add_argument("--requests", type=int, default=32,
+                        help="Total requests per window setting")
+    parser.add_argument("--rate", type=float, default=20.0,
+                        help="Request arrival rate (requests/second)")
+    parser.add_argument("--windows", type=float, nargs="+", default=[0, 5, 10, 25, 50],
+                        help="Batch windows to compare in ms (0 = unbatched)")
+    parser.add_argument("--max-batch-size", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=1)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,68 @@
+"""
+STT Engine Benchmark
+Compares real-time factor, peak RSS and WER of the installed STT engines
+
+Each engine runs in its own interpreter so peak RSS is not shared between
+engines. Fixtures are audio files with a matching reference transcript,
+e.g. ``answer1.wav`` + ``answer1.txt``.
+
+Usage:
+    python -m benchmarks.stt_engines --fixtures fixtures/ --model base
+    python -m benchmarks.stt_engines --fixtures fixtures/ --engines whisper faster-whisper
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+
+from benchmarks.common import evaluate, load_fixtures
+from services.stt_engines import available_engines, create_stt_engine
+
+
+def run_engine(args):
+    """Benchmark one engine in this process and print the result as JSON."""
+    fixtures = load_fixtures(args.fixtures)
+    engine = create_stt_engine(args.run, model_name=args.model)
+    # First call pays one-off allocator and kernel warm-up
+    engine.warm_up()
+    stats = evaluate(lambda audio: engine.transcribe(audio, preset=args.preset).text, fixtures)
+    stats["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps(stats))
+
+
+def main(args):
+    engines = args.engines or available_engines()
+    print(f"Engines: {', '.join(engines)}; model '{args.model}', preset '{args.preset}'\n")
+    print(f"{'engine':>16} {'WER':>8} {'RTF':>8} {'peak_rss_mb':>12}")
+
+    for name in engines:
+        command = [
+            sys.executable, "-m", "benchmarks.stt_engines",
+            "--fixtures", args.fixtures, "--model", args.model,
+            "--preset", args.preset, "--run", name
+        ]
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"{name:>16} failed: {result.stderr.strip().splitlines()[-1]}")
+            continue
+        stats = json.loads(result.stdout.strip().splitlines()[-1])
+        print(f"{name:>16} {stats['wer']:>8.2%} {stats['rtf']:>8.3f} {stats['peak_rss_mb']:>12.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fixtures", required=True,
+                        help="Directory of audio files with .txt references")
+    parser.add_argument("--model", default="base")
+    parser.add_argument("--preset", default="balanced",
+                        help="Decode preset used by every engine")
+    parser.add_argument("--engines", nargs="+",
+                        help="Engines to compare (default: all installed)")
+    parser.add_argument("--run", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run_engine(args)
+    else:
+        main(args)
@@ -0,0 +1,47 @@
+"""
+Int8 Quantization Benchmark
+Compares WER and real-time factor of fp32 and int8 Whisper on CPU fixtures
+
+Fixtures are audio files with a matching reference transcript, e.g.
+``answer1.wav`` + ``answer1.txt``.
+
+Usage:
+    python -m benchmarks.stt_quantization --fixtures fixtures/ --model base
+"""
+import argparse
+
+import torch
+
+from benchmarks.common import evaluate, load_fixtures
+from services.stt_service import create_whisper_model, transcribe_audio
+
+
+def main(args):
+    torch.set_num_threads(args.threads)
+    fixtures = load_fixtures(args.fixtures)
+    print(f"{len(fixtures)} fixtures, model '{args.model}', {args.threads} thread(s)\n")
+
+    results = {}
+    for mode, quantize in (("fp32", False), ("int8", True)):
+        model = create_whisper_model(args.model, quantize=quantize).cpu()
+        # First call pays one-off allocator and kernel warm-up
+        transcribe_audio(fixtures[0][1], model)
+        results[mode] = evaluate(lambda audio: transcribe_audio(audio, model), fixtures)
+        del model
+
+    print(f"{'mode':>6} {'WER':>8} {'RTF':>8}")
+    for mode, stats in results.items():
+        print(f"{mode:>6} {stats['wer']:>8.2%} {stats['rtf']:>8.3f}")
+
+    base, quant = results["fp32"], results["int8"]
+    print(f"\nWER delta: {quant['wer'] - base['wer']:+.2%}")
+    print(f"Speedup:   {base['rtf'] / quant['rtf']:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fixtures", required=True,
+                        help="Directory of audio files with .txt references")
+    parser.add_argument("--model", default="base")
+    parser.add_argument("--threads", type=int, default=torch.get_num_threads())
+    main(parser.parse_args())
@@ -1,2 +1,3 @@
 # Components package
 from .ui_helpers import display_results, render_progress_dots
+from .service_adapters import load_stt_engine, grade_submission
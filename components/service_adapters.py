@@ -0,0 +1,48 @@
+"""
+Streamlit Adapters for the Service Layer.
+Caches the speech-to-text engine per server process and shows service errors in the UI.
+"""
+import threading
+from typing import Optional
+
+import numpy as np
+import streamlit as st
+
+# Local imports
+from services.grading_service import GradingError, grade_submission as grade_answers
+from services.stt_engines import STTEngine, create_stt_engine
+from services.stt_service import Transcription
+
+
+class SerializedEngine:
+    """
+    One engine shared by every Streamlit session, used by one session at a time.
+
+    Engines are not thread-safe and Streamlit runs each session's script on
+    its own thread, so concurrent transcriptions wait for the lock.
+    """
+
+    def __init__(self, engine: STTEngine):
+        self.engine = engine
+        self._lock = threading.Lock()
+
+    def transcribe(self, audio: np.ndarray, preset: Optional[str] = None,
+                   prompt: Optional[str] = None) -> Transcription:
+        """Transcribe 16 kHz mono float32 audio once the engine is free."""
+        with self._lock:
+            return self.engine.transcribe(audio, preset, prompt)
+
+
+@st.cache_resource
+def load_stt_engine() -> SerializedEngine:
+    """Load the speech-to-text engine with caching."""
+    return SerializedEngine(create_stt_engine())
+
+
+def grade_submission(questions: list, transcripts: list) -> dict:
+    """Grade the answers, showing an error message instead of raising."""
+    try:
+        return grade_answers(questions, transcripts)
+    except GradingError as e:
+        st.error(f"⚠️ {e}")
+        return None
@@ -2,6 +2,7 @@
 Configuration settings for IELTS Speaking Grader.
 Contains CSS styles, voice options, and other constants.
 """
+import os
 
 # Voice options for TTS
 VOICE_OPTIONS = {
@@ -9,9 +10,144 @@ VOICE_OPTIONS = {
     "female": "en-US-JennyNeural"
 }
 
+# Synthesized speech cache keyed by text, voice and audio format
+TTS_CACHE_MAX_BYTES = int(os.getenv("TTS_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+# Content-addressed on-disk tier shared by the web app and the API (empty disables it)
+TTS_CACHE_DIR = os.getenv(
+    "TTS_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "ielts-tts")
+) or None
+# Size limit for the on-disk tier; least recently used audio is deleted past it
+TTS_CACHE_DISK_MAX_BYTES = int(os.getenv("TTS_CACHE_DISK_MAX_BYTES", 256 * 1024 * 1024))
+# Synthesize audio for every question and API voice when the API starts
+TTS_PRESYNTHESIZE = os.getenv("TTS_PRESYNTHESIZE", "true").lower() == "true"
+# Outbound Edge TTS syntheses running at once
+TTS_MAX_CONCURRENCY = int(os.getenv("TTS_MAX_CONCURRENCY", 4))
+# Syntheses allowed to wait for a slot; beyond that requests get a 503
+TTS_QUEUE_SIZE = int(os.getenv("TTS_QUEUE_SIZE", 32))
+# Seconds a synthesis may wait for a slot before its request gets a 503
+TTS_QUEUE_TIMEOUT_SECONDS = float(os.getenv("TTS_QUEUE_TIMEOUT_SECONDS", 10))
+
 # Gemini Model
 GEMINI_MODEL = "gemini-2.5-flash"
 
+# Whisper model used for speech-to-text
+WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")
+# Opt-in int8 dynamic quantization of the Linear layers (CPU only)
+WHISPER_QUANTIZE = os.getenv("WHISPER_QUANTIZE", "false").lower() == "true"
+# Speech-to-text engine: whisper (reference, default), faster-whisper
+# (CTranslate2, needs the faster-whisper package) or auto (fastest installed)
+STT_ENGINE = os.getenv("STT_ENGINE", "whisper")
+# CTranslate2 compute type for faster-whisper (int8, int8_float32, float32)
+STT_COMPUTE_TYPE = os.getenv("STT_COMPUTE_TYPE", "int8")
+# Memory-map fp32 weights from disk (CPU only) so every model replica and
+# every forked API worker shares the same physical pages
+WHISPER_MMAP = os.getenv("WHISPER_MMAP", "false").lower() == "true"
+
+# Whisper decode presets, selectable per request. The model is used for
+# English answers only, so language detection is always skipped.
+STT_DECODE_PRESETS = {
+    "fast": {
+        "language": "en",
+        "beam_size": None,
+        "best_of": None,
+        "temperature": (0.0,),
+        "condition_on_previous_text": False
+    },
+    "balanced": {
+        "language": "en",
+        "beam_size": None,
+        "best_of": 2,
+        "temperature": (0.0, 0.4, 0.8),
+        "condition_on_previous_text": False
+    },
+    "accurate": {
+        "language": "en",
+        "beam_size": 5,
+        "best_of": 5,
+        "temperature": (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+        "condition_on_previous_text": True
+    }
+}
+STT_DEFAULT_PRESET = os.getenv("STT_DEFAULT_PRESET", "balanced")
+
+# STT inference worker pool
+# CPU cores this process may spend on Whisper inference
+STT_CPU_CORES = int(os.getenv("STT_CPU_CORES", os.cpu_count() or 1))
+# Each worker owns its own model replica (Whisper decoding is not thread-safe)
+STT_WORKERS = int(os.getenv("STT_WORKERS", max(1, min(4, STT_CPU_CORES // 2))))
+# Jobs allowed to wait for a free worker before requests are rejected with 503
+STT_QUEUE_SIZE = int(os.getenv("STT_QUEUE_SIZE", 32))
+
+# Upload limits for /api/stt/transcribe
+STT_MAX_UPLOAD_BYTES = int(os.getenv("STT_MAX_UPLOAD_BYTES", 25 * 1024 * 1024))
+# Longest recording accepted after decoding (caps decoded PCM memory)
+STT_MAX_AUDIO_SECONDS = int(os.getenv("STT_MAX_AUDIO_SECONDS", 300))
+# MP4/M4A uploads are spooled in case ffmpeg can't demux them from a pipe;
+# anything beyond this many bytes spills to disk
+STT_SPOOL_MEMORY_BYTES = int(os.getenv("STT_SPOOL_MEMORY_BYTES", 1024 * 1024))
+
+# Voice activity gate applied before Whisper
+STT_VAD_ENABLED = os.getenv("STT_VAD_ENABLED", "true").lower() == "true"
+# Clips with less detected speech than this are rejected without decoding
+STT_VAD_MIN_SPEECH_SECONDS = float(os.getenv("STT_VAD_MIN_SPEECH_SECONDS", 0.5))
+# Internal pauses longer than this are shortened to this length
+STT_VAD_MAX_SILENCE_SECONDS = float(os.getenv("STT_VAD_MAX_SILENCE_SECONDS", 1.0))
+
+# Transcript cache keyed by audio content hash, model and decode options
+STT_CACHE_MAX_BYTES = int(os.getenv("STT_CACHE_MAX_BYTES", 8 * 1024 * 1024))
+# Optional on-disk tier that survives restarts (disabled when unset)
+STT_CACHE_DIR = os.getenv("STT_CACHE_DIR") or None
+
+# Long answers are split at pauses and transcribed in parallel
+STT_CHUNKING_ENABLED = os.getenv("STT_CHUNKING_ENABLED", "true").lower() == "true"
+# Maximum chunk length (kept under Whisper's 30-second window)
+STT_CHUNK_SECONDS = float(os.getenv("STT_CHUNK_SECONDS", 25))
+# Audio shared by neighbouring chunks; repeated words are removed when stitching
+STT_CHUNK_OVERLAP_SECONDS = float(os.getenv("STT_CHUNK_OVERLAP_SECONDS", 1.0))
+
+# Live transcription over WebSocket (/api/stt/stream)
+# New audio needed before the next partial transcript is produced
+STT_STREAM_PARTIAL_SECONDS = float(os.getenv("STT_STREAM_PARTIAL_SECONDS", 3))
+# Uncommitted audio kept in the sliding window before it is finalised
+STT_STREAM_WINDOW_SECONDS = float(os.getenv("STT_STREAM_WINDOW_SECONDS", 15))
+
+# Dynamic micro-batching of concurrent transcriptions
+# How long to collect requests before running a batch (0 disables batching)
+STT_BATCH_WINDOW_MS = float(os.getenv("STT_BATCH_WINDOW_MS", 0))
+# Maximum requests per batch (also caps 30-second windows per decoder pass)
+STT_MAX_BATCH_SIZE = int(os.getenv("STT_MAX_BATCH_SIZE", 8))
+
+# Load-adaptive model routing
+# Smaller Whisper model used while the queue is deep (unset disables routing)
+STT_FALLBACK_MODEL = os.getenv("STT_FALLBACK_MODEL") or None
+# Workers (model replicas) serving each smaller model: fallback and draft
+# models get their own pools instead of a copy in every primary worker
+STT_SECONDARY_WORKERS = int(os.getenv("STT_SECONDARY_WORKERS", 1))
+# Switch to the fallback model at this many queued requests...
+STT_ROUTE_QUEUE_DEPTH = int(os.getenv("STT_ROUTE_QUEUE_DEPTH", 4))
+# ...or when the predicted queue wait exceeds this many seconds
+STT_ROUTE_MAX_WAIT_SECONDS = float(os.getenv("STT_ROUTE_MAX_WAIT_SECONDS", 5))
+
+# Two-pass transcription
+# Small Whisper model for the instant draft (unset disables two-pass mode)
+STT_DRAFT_MODEL = os.getenv("STT_DRAFT_MODEL") or None
+# Refined transcripts kept for lookup by result ID
+STT_RESULTS_MAX = int(os.getenv("STT_RESULTS_MAX", 1024))
+# Directory shared by API worker processes so any of them can serve a result
+# (defaults to a subdirectory of STT_CACHE_DIR; unset keeps results in memory)
+STT_RESULTS_DIR = os.getenv("STT_RESULTS_DIR") or (
+    os.path.join(STT_CACHE_DIR, "results") if STT_CACHE_DIR else None
+)
+# Seconds grading waits for a pending refined transcript before using the draft
+STT_REFINE_WAIT_SECONDS = float(os.getenv("STT_REFINE_WAIT_SECONDS", 30))
+
+# Shared inference server (run_inference.py)
+# When set, the Streamlit app and the API send audio to this server instead
+# of loading their own Whisper model: unix:///path/to.sock or tcp://host:port
+STT_INFERENCE_URL = os.getenv("STT_INFERENCE_URL") or None
+# Seconds to wait for the server to answer one transcription
+STT_INFERENCE_TIMEOUT = float(os.getenv("STT_INFERENCE_TIMEOUT", 120))
+
 # CSS Styles for Mobile App Simulation
 CSS_STYLES = """
 <style>
@@ -1,19 +1,143 @@
 """
 Simple script to run the FastAPI backend server
 """
+import argparse
+import os
+import shutil
+import signal
+import socket
+import tempfile
+import time
+
 import uvicorn
 
-if __name__ == "__main__":
-    print("🚀 Starting IELTS Speaking Grader API...")
-    print("📍 Server: http://localhost:8000")
-    print("📖 Docs: http://localhost:8000/docs")
-    print("🔧 Health: http://localhost:8000/health")
-    print("\nPress CTRL+C to stop\n")
+HOST = "0.0.0.0"
+PORT = 8000
 
+# A worker that exits sooner than this after starting is restarted after a delay
+MIN_WORKER_UPTIME_SECONDS = 10
+RESPAWN_DELAY_SECONDS = 5
+
+
+def run_development():
+    """Single process with auto-reload."""
     uvicorn.run(
         "backend.main:app",
-        host="0.0.0.0",
-        port=8000,
+        host=HOST,
+        port=PORT,
         reload=True,  # Auto-reload on code changes
         log_level="info"
     )
+
+
+def run_preforked(workers: int):
+    """
+    Load Whisper weights once, then fork and supervise ``workers`` uvicorn processes.
+
+    The weights are memory-mapped before forking, so every worker (and every
+    model replica inside it) reads the same physical pages. Each worker gets
+    an equal share of the CPU cores for its Torch threads. A worker that
+    exits is forked again from the parent, so it shares the mapping too.
+    """
+    cpu_cores = int(os.getenv("STT_CPU_CORES", os.cpu_count() or 1))
+    # Settings are read at import time, so set the per-worker values first
+    os.environ["STT_CPU_CORES"] = str(max(1, cpu_cores // workers))
+    os.environ.setdefault("WHISPER_MMAP", "true")
+    temp_results_dir = None
+    if not os.getenv("STT_RESULTS_DIR") and not os.getenv("STT_CACHE_DIR"):
+        # Two-pass results must be visible to whichever worker gets the lookup
+        temp_results_dir = os.path.join(tempfile.gettempdir(), f"stt-results-{os.getpid()}")
+        os.environ["STT_RESULTS_DIR"] = temp_results_dir
+
+    from config.settings import STT_INFERENCE_URL, WHISPER_MMAP, WHISPER_QUANTIZE
+    if WHISPER_MMAP and not WHISPER_QUANTIZE and not STT_INFERENCE_URL:
+        from services.stt_service import can_mmap_weights, load_shared_weights
+        if can_mmap_weights():
+            load_shared_weights()
+
+    from backend.main import app
+    from backend.utils.transcript_results import transcript_results
+
+    # Results only live as long as the workers that wait on them
+    transcript_results.clear()
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((HOST, PORT))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+
+    children = {}
+    stopping = False
+
+    def spawn() -> int:
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                # uvicorn installs its own handlers; drop the supervisor's
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                server = uvicorn.Server(uvicorn.Config(app, log_level="info"))
+                server.run(sockets=[sock])
+                code = 0
+            finally:
+                os._exit(code)
+        children[pid] = time.monotonic()
+        return pid
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    for _ in range(workers):
+        spawn()
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    # Supervise: replace workers that crash or get OOM-killed until stopped
+    try:
+        while children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            started = children.pop(pid, None)
+            if started is None or stopping:
+                continue
+            print(f"⚠️  Worker {pid} exited with code {os.waitstatus_to_exitcode(status)}; restarting")
+            # Don't spin on a worker that dies right after starting
+            if time.monotonic() - started < MIN_WORKER_UPTIME_SECONDS:
+                time.sleep(RESPAWN_DELAY_SECONDS)
+            if not stopping:
+                spawn()
+    finally:
+        sock.close()
+        transcript_results.clear()
+        if temp_results_dir is not None:
+            shutil.rmtree(temp_results_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="IELTS Speaking Grader API")
+    parser.add_argument("--workers", type=int, default=int(os.getenv("API_WORKERS", 1)),
+                        help="Preforked worker processes (1 runs the auto-reload dev server)")
+    args = parser.parse_args()
+
+    print("🚀 Starting IELTS Speaking Grader API...")
+    print(f"📍 Server: http://localhost:{PORT}")
+    print(f"📖 Docs: http://localhost:{PORT}/docs")
+    print(f"🔧 Health: http://localhost:{PORT}/health")
+    print("\nPress CTRL+C to stop\n")
+
+    if args.workers > 1:
+        print(f"👷 Workers: {args.workers} (preforked, shared model weights)")
+        run_preforked(args.workers)
+    else:
+        run_development()
@@ -0,0 +1,30 @@
+"""
+Script to run the shared Whisper inference server
+"""
+import argparse
+import asyncio
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+from backend.inference_server import InferenceServer  # noqa: E402
+from config.settings import STT_INFERENCE_URL  # noqa: E402
+
+DEFAULT_URL = "unix:///tmp/ielts-stt.sock"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Shared Whisper inference server")
+    parser.add_argument("--url", default=STT_INFERENCE_URL or DEFAULT_URL,
+                        help="unix:///path/to.sock or tcp://host:port to listen on")
+    args = parser.parse_args()
+
+    print("🎙️ Starting Whisper inference server...")
+    print(f"📍 Listening on {args.url}")
+    print("\nPress CTRL+C to stop\n")
+
+    try:
+        asyncio.run(InferenceServer(args.url).serve_forever())
+    except KeyboardInterrupt:
+        pass
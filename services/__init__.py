@@ -1,4 +1,6 @@
 # Services package
+# Whisper, Torch, Edge TTS and the Gemini SDK are imported on first use
 from .tts_service import text_to_speech
-from .stt_service import load_whisper_model, transcribe_audio
+from .stt_service import transcribe_audio
+from .stt_engines import create_stt_engine
 from .grading_service import grade_submission
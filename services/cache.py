@@ -0,0 +1,263 @@
+"""
+Two-Tier Byte Cache.
+In-memory LRU bounded by total bytes, backed by an optional on-disk store.
+"""
+import asyncio
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+# When the disk tier passes its limit, trim it to this fraction of the limit
+# so the directory isn't rescanned on every write
+DISK_TRIM_RATIO = 0.9
+
+
+class TwoTierCache:
+    """
+    Byte-size bounded LRU in memory with an optional content-addressed disk tier.
+
+    Keys are hex digests; on disk each value lives at ``<dir>/<key[:2]>/<key>``
+    and is written atomically, so the disk tier survives restarts and can be
+    shared by several processes. Async callers use ``aget``/``aset``, which
+    run disk I/O on a thread instead of the event loop.
+
+    With ``max_disk_bytes``, the disk tier is trimmed least recently used
+    first (by file modification time, which disk hits refresh) once it
+    outgrows the limit.
+    """
+
+    def __init__(self, max_bytes: int, directory: Optional[str] = None,
+                 max_disk_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        # Bytes on disk as of the last scan plus what this process wrote since
+        self._disk_size: Optional[int] = None
+        self.disk_evictions = 0
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if directory:
+            try:
+                os.makedirs(directory, exist_ok=True)
+            except OSError:
+                # Unwritable location: run memory-only rather than fail
+                self.directory = None
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached value, promoting disk hits into memory."""
+        value = self._get_memory(key)
+        if value is None:
+            value = self._get_disk(key)
+        return value
+
+    def set(self, key: str, value: bytes):
+        """Store a value in memory and, if configured, on disk."""
+        self._remember(key, value)
+        self._write_disk(key, value)
+
+    async def aget(self, key: str) -> Optional[bytes]:
+        """``get`` for the event loop: memory hits return at once, disk reads run on a thread."""
+        value = self._get_memory(key)
+        if value is None and self.directory:
+            return await asyncio.to_thread(self._get_disk, key)
+        if value is None:
+            with self._lock:
+                self.misses += 1
+        return value
+
+    async def aset(self, key: str, value: bytes):
+        """``set`` for the event loop: the disk write runs on a thread."""
+        self._remember(key, value)
+        if self.directory:
+            await asyncio.to_thread(self._write_disk, key, value)
+
+    def delete(self, key: str):
+        """Drop a value from both tiers (missing keys are ignored)."""
+        with self._lock:
+            value = self._entries.pop(key, None)
+            if value is not None:
+                self._size -= len(value)
+        path = self.path_for(key)
+        if path is not None:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    async def adelete(self, key: str):
+        """``delete`` for the event loop: the file is removed on a thread."""
+        if self.directory:
+            await asyncio.to_thread(self.delete, key)
+        else:
+            self.delete(key)
+
+    def clear(self):
+        """Drop every value from both tiers."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        if not self.directory:
+            return
+        try:
+            entries = self._disk_entries()
+        except OSError:
+            return
+        for _, _, path in entries:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        with self._lock:
+            self._disk_size = 0
+
+    def path_for(self, key: str) -> Optional[str]:
+        """Path of the on-disk entry (whether or not it exists yet)."""
+        if not self.directory:
+            return None
+        return os.path.join(self.directory, key[:2], key)
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current memory usage."""
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                "disk": bool(self.directory),
+                "max_disk_bytes": self.max_disk_bytes,
+                "disk_evictions": self.disk_evictions
+            }
+
+    def _get_memory(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+            return value
+
+    def _get_disk(self, key: str) -> Optional[bytes]:
+        value = self._read_disk(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+        self._remember(key, value)
+        return value
+
+    def _remember(self, key: str, value: bytes):
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = value
+            self._size += len(value)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        path = self.path_for(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                value = f.read()
+        except OSError:
+            # Missing, unreadable or vanished mid-read: treat as a miss
+            return None
+        if self.max_disk_bytes is not None:
+            try:
+                # Recently read entries are the last to be trimmed
+                os.utime(path)
+            except OSError:
+                pass
+        return value
+
+    def _write_disk(self, key: str, value: bytes):
+        path = self.path_for(key)
+        if path is None:
+            return
+        tmp_file_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as tmp_file:
+                tmp_file_path = tmp_file.name
+                tmp_file.write(value)
+            os.replace(tmp_file_path, path)
+            tmp_file_path = None
+        except OSError:
+            # The disk tier is best effort; memory still holds the value
+            if tmp_file_path is not None:
+                try:
+                    os.unlink(tmp_file_path)
+                except OSError:
+                    pass
+            return
+        if self.max_disk_bytes is not None:
+            self._account_disk(len(value))
+
+    def _account_disk(self, added: int):
+        with self._lock:
+            if self._disk_size is not None:
+                self._disk_size += added
+            over = self._disk_size is None or self._disk_size > self.max_disk_bytes
+        if over:
+            self._trim_disk()
+
+    def _disk_entries(self) -> List[Tuple[float, int, str]]:
+        """(mtime, size, path) of every entry file, oldest first."""
+        entries = []
+        for shard in os.scandir(self.directory):
+            # Entries live in two-character shard directories; leave anything else alone
+            if len(shard.name) != 2 or not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    info = entry.stat()
+                except OSError:
+                    continue
+                entries.append((info.st_mtime, info.st_size, entry.path))
+        entries.sort()
+        return entries
+
+    def _trim_disk(self):
+        """Delete the least recently used entries once the disk tier is over its limit."""
+        try:
+            entries = self._disk_entries()
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        if total > self.max_disk_bytes:
+            target = self.max_disk_bytes * DISK_TRIM_RATIO
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    os.unlink(path)
+                except OSError:
+                    continue
+                total -= size
+                evicted += 1
+        with self._lock:
+            self._disk_size = total
+            self.disk_evictions += evicted
@@ -1,14 +1,17 @@
 """
 Grading Service using Google Gemini API.
+The Gemini SDK is imported on first use, so importing this module is cheap.
 """
 import os
 import json
-import streamlit as st
-from google import genai
-from google.genai import types
+from typing import List, Optional
 
 # Local imports
-from config import GEMINI_MODEL
+from config.settings import GEMINI_MODEL
+
+
+class GradingError(Exception):
+    """Raised when a submission cannot be graded."""
 
 
 # System prompt for IELTS grading
@@ -79,20 +82,38 @@ GRADE_SCHEMA = {
 }
 
 
-def grade_submission(questions: list, transcripts: list) -> dict:
-    """Send questions and transcripts to Gemini for IELTS grading."""
+def grade_submission(questions: list, transcripts: list,
+                     question_ids: Optional[List[int]] = None) -> dict:
+    """
+    Send questions and transcripts to Gemini for IELTS grading.
+
+    Args:
+        questions: Question texts
+        transcripts: Student answers, one per question
+        question_ids: Numbers shown for each question (default 1, 2, ...)
+
+    Returns:
+        Parsed grading result following GRADE_SCHEMA
+
+    Raises:
+        GradingError: If the API key is missing, the call fails or the
+            response is not valid JSON
+    """
     api_key = os.getenv("GEMINI_API_KEY")
     if not api_key or api_key == "your_api_key_here":
-        st.error("⚠️ Please set your GEMINI_API_KEY in the .env file")
-        return None
-    
+        raise GradingError("GEMINI_API_KEY not configured. Please set it in the .env file")
+
+    from google import genai
+    from google.genai import types
+
     client = genai.Client(api_key=api_key)
-    
+
     # Build the combined Q&A text
+    question_ids = question_ids or range(1, len(questions) + 1)
     qa_text = ""
-    for i, (q, t) in enumerate(zip(questions, transcripts), 1):
+    for i, q, t in zip(question_ids, questions, transcripts):
         qa_text += f"**Question {i}:** {q}\n**Student Answer {i}:** {t}\n\n"
-    
+
     user_prompt = f"Please analyze the following student transcripts against the IELTS Speaking Band Descriptors (FC, LR, GRA, P).\n\n{qa_text}\n\nBased on this, generate a score for each criterion and a final overall Band Score. BE STRICT. BE DETAILED."
 
     try:
@@ -106,7 +127,10 @@ def grade_submission(questions: list, transcripts: list) -> dict:
                 response_schema=GRADE_SCHEMA
             )
         )
-        return json.loads(response.text)
     except Exception as e:
-        st.error(f"Error calling Gemini API: {str(e)}")
-        return None
+        raise GradingError(f"Error calling Gemini API: {str(e)}")
+
+    try:
+        return json.loads(response.text)
+    except json.JSONDecodeError as e:
+        raise GradingError(f"Failed to parse Gemini response: {str(e)}")
@@ -0,0 +1,134 @@
+"""
+Shared Inference Server Client
+Sends decoded audio to the standalone Whisper server (run_inference.py)
+"""
+import asyncio
+import json
+import socket
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from config.settings import STT_INFERENCE_TIMEOUT
+from services.stt_service import Transcription
+
+# Wire protocol, one request per connection:
+#   client -> server: JSON header line, then header["samples"] float32 LE samples
+#   server -> client: JSON reply line
+ENCODING = "utf-8"
+
+
+class InferenceBusyError(Exception):
+    """Raised when the inference server's job queue is full."""
+
+
+def parse_address(url: str) -> Tuple[str, Union[str, Tuple[str, int]]]:
+    """
+    Parse an inference server URL.
+
+    Args:
+        url: ``unix:///path/to.sock`` or ``tcp://host:port``
+
+    Returns:
+        ("unix", path) or ("tcp", (host, port))
+    """
+    if url.startswith("unix:"):
+        path = url[len("unix:"):]
+        if path.startswith("//"):
+            path = path[2:]
+        return "unix", path
+    if url.startswith("tcp://"):
+        host, _, port = url[len("tcp://"):].rpartition(":")
+        if not host or not port.isdigit():
+            raise ValueError(f"Invalid inference server address: {url}")
+        return "tcp", (host, int(port))
+    raise ValueError(f"Inference server address must start with unix: or tcp://, got {url}")
+
+
+def encode_request(op: str, audio: Optional[np.ndarray] = None, **fields) -> bytes:
+    """Build one request: header line plus raw float32 samples."""
+    payload = b""
+    if audio is not None:
+        payload = np.ascontiguousarray(audio, dtype="<f4").tobytes()
+        fields["samples"] = len(payload) // 4
+    return json.dumps({"op": op, **fields}).encode(ENCODING) + b"\n" + payload
+
+
+def decode_reply(line: bytes) -> dict:
+    """
+    Parse a reply line, raising the error the server reported.
+
+    Raises:
+        InferenceBusyError: If the server's queue is full
+        ValueError: If the server rejected the request
+        RuntimeError: If inference failed or the server closed the connection
+    """
+    if not line:
+        raise RuntimeError("Inference server closed the connection")
+    reply = json.loads(line)
+    error = reply.get("error")
+    if error == "busy":
+        raise InferenceBusyError(reply.get("detail", "Inference server is busy"))
+    if error == "bad_request":
+        raise ValueError(reply.get("detail", "Bad request"))
+    if error:
+        raise RuntimeError(reply.get("detail", error))
+    return reply
+
+
+class InferenceClient:
+    """
+    Client for the shared inference server.
+
+    ``transcribe``/``info`` block and suit Streamlit script threads;
+    ``atranscribe``/``ainfo`` are for the FastAPI event loop.
+    """
+
+    def __init__(self, url: str, timeout: float = STT_INFERENCE_TIMEOUT):
+        self.url = url
+        self.kind, self.address = parse_address(url)
+        self.timeout = timeout
+
+    def transcribe(self, audio: np.ndarray, preset: Optional[str] = None,
+                   prompt: Optional[str] = None) -> Transcription:
+        """Transcribe 16 kHz float32 audio on the server."""
+        reply = self._call(encode_request("transcribe", audio, preset=preset, prompt=prompt))
+        return Transcription(reply["text"], reply.get("fallbacks", 0))
+
+    def info(self) -> dict:
+        """Model and queue status of the server."""
+        return self._call(encode_request("info"))
+
+    async def atranscribe(self, audio: np.ndarray, preset: Optional[str] = None,
+                          prompt: Optional[str] = None) -> Transcription:
+        """Async variant of transcribe."""
+        reply = await self._acall(encode_request("transcribe", audio, preset=preset, prompt=prompt))
+        return Transcription(reply["text"], reply.get("fallbacks", 0))
+
+    async def ainfo(self) -> dict:
+        """Async variant of info."""
+        return await self._acall(encode_request("info"))
+
+    def _call(self, request: bytes) -> dict:
+        family = socket.AF_UNIX if self.kind == "unix" else socket.AF_INET
+        with socket.socket(family, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.address)
+            sock.sendall(request)
+            with sock.makefile("rb") as stream:
+                return decode_reply(stream.readline())
+
+    async def _acall(self, request: bytes) -> dict:
+        async def exchange():
+            if self.kind == "unix":
+                reader, writer = await asyncio.open_unix_connection(self.address)
+            else:
+                reader, writer = await asyncio.open_connection(*self.address)
+            try:
+                writer.write(request)
+                await writer.drain()
+                return decode_reply(await reader.readline())
+            finally:
+                writer.close()
+
+        return await asyncio.wait_for(exchange(), self.timeout)
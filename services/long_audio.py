@@ -0,0 +1,77 @@
+"""
+Long-Answer Chunking.
+Splits long recordings at pauses for parallel transcription and stitches
+the pieces back together.
+"""
+import re
+from typing import List
+
+import numpy as np
+
+# Local imports
+from config.settings import STT_CHUNK_SECONDS, STT_CHUNK_OVERLAP_SECONDS
+from services.vad import find_quiet_cut
+
+SAMPLE_RATE = 16000
+
+# Longest run of repeated words searched for where two chunks overlap
+MAX_OVERLAP_WORDS = 12
+
+# Shortest run accepted as overlap; a single matching word is too often a
+# genuine repeat ("the", "I") to be dropped
+MIN_OVERLAP_WORDS = 2
+
+
+def split_long_audio(audio: np.ndarray,
+                     chunk_seconds: float = STT_CHUNK_SECONDS,
+                     overlap_seconds: float = STT_CHUNK_OVERLAP_SECONDS) -> List[np.ndarray]:
+    """
+    Split audio into overlapping chunks that end at pauses.
+
+    Each chunk is at most ``chunk_seconds`` long and ends at the quietest
+    frame of its last few seconds; the next chunk starts ``overlap_seconds``
+    earlier so a word cut at a poor boundary still appears whole in one of
+    the two pieces.
+
+    Returns:
+        Views into ``audio``, in order
+    """
+    max_len = int(chunk_seconds * SAMPLE_RATE)
+    overlap = int(overlap_seconds * SAMPLE_RATE)
+
+    chunks = []
+    start = 0
+    while len(audio) - start > max_len:
+        cut = start + find_quiet_cut(audio[start:start + max_len])
+        chunks.append(audio[start:cut])
+        start = max(cut - overlap, start + 1)
+    chunks.append(audio[start:])
+    return chunks
+
+
+def _normalize(word: str) -> str:
+    return re.sub(r"[^a-z0-9']", "", word.lower())
+
+
+def _overlap_length(previous: List[str], following: List[str]) -> int:
+    """Number of leading words of ``following`` already ending ``previous``."""
+    prev_norm = [_normalize(w) for w in previous[-MAX_OVERLAP_WORDS:]]
+    next_norm = [_normalize(w) for w in following[:MAX_OVERLAP_WORDS + 1]]
+
+    for size in range(min(len(prev_norm), len(next_norm)), MIN_OVERLAP_WORDS - 1, -1):
+        # Allow one clipped word at the very start of the following chunk
+        for skip in (0, 1):
+            if skip + size > len(next_norm):
+                continue
+            if prev_norm[-size:] == next_norm[skip:skip + size]:
+                return skip + size
+    return 0
+
+
+def stitch_transcripts(texts: List[str]) -> str:
+    """Join chunk transcripts, dropping words repeated in the overlaps."""
+    words: List[str] = []
+    for text in texts:
+        following = text.split()
+        words.extend(following[_overlap_length(words, following):])
+    return " ".join(words)
@@ -0,0 +1,218 @@
+"""
+Speech-to-Text Engines.
+Common interface over the reference Whisper implementation and optimized CPU runtimes.
+"""
+import importlib.util
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Type
+
+import numpy as np
+
+# Local imports
+from config.settings import (
+    WHISPER_MODEL,
+    WHISPER_QUANTIZE,
+    STT_ENGINE,
+    STT_COMPUTE_TYPE,
+    STT_CPU_CORES,
+    STT_WORKERS,
+    STT_MAX_BATCH_SIZE
+)
+from services.stt_service import (
+    WARMUP_TOKENS,
+    Transcription,
+    count_fallbacks,
+    create_whisper_model,
+    decode_preset,
+    synthetic_clip,
+    transcribe_batch,
+    transcribe_with_stats,
+    warm_up_model
+)
+
+
+class STTEngine(ABC):
+    """
+    A loaded speech-to-text model.
+
+    Engines are not thread-safe: the worker pool gives every worker thread
+    its own engine instance.
+    """
+
+    name = ""
+    # Whether transcribe_batch decodes several clips in one pass
+    supports_batching = False
+
+    def __init__(self, model_name: str = WHISPER_MODEL, quantize: bool = WHISPER_QUANTIZE):
+        self.model_name = model_name
+        self.quantize = quantize
+
+    @abstractmethod
+    def transcribe(self, audio: np.ndarray, preset: Optional[str] = None,
+                   prompt: Optional[str] = None) -> Transcription:
+        """Transcribe 16 kHz mono float32 audio."""
+
+    def transcribe_batch(self, audios: List[np.ndarray], preset: Optional[str] = None,
+                         prompt: Optional[str] = None,
+                         max_batch_size: int = STT_MAX_BATCH_SIZE) -> List[Transcription]:
+        """Transcribe several clips (one by one unless the engine batches)."""
+        return [self.transcribe(audio, preset, prompt) for audio in audios]
+
+    def warm_up(self) -> float:
+        """Run one short decode and return the seconds it took."""
+        start = time.perf_counter()
+        self.transcribe(synthetic_clip(), preset="fast")
+        return time.perf_counter() - start
+
+    def describe(self) -> dict:
+        """Engine name and model configuration."""
+        return {"engine": self.name, "model": self.model_name, "quantized": self.quantize}
+
+
+class WhisperEngine(STTEngine):
+    """Reference engine: openai-whisper on PyTorch."""
+
+    name = "whisper"
+    supports_batching = True
+
+    def __init__(self, model_name: str = WHISPER_MODEL, quantize: bool = WHISPER_QUANTIZE,
+                 cpu_threads: Optional[int] = None):
+        # Torch threads are process-wide and set by the worker pool, so cpu_threads is unused
+        super().__init__(model_name, quantize)
+        self.model = create_whisper_model(model_name, quantize=quantize)
+
+    def transcribe(self, audio, preset=None, prompt=None):
+        return transcribe_with_stats(audio, self.model, preset, prompt)
+
+    def transcribe_batch(self, audios, preset=None, prompt=None, max_batch_size=STT_MAX_BATCH_SIZE):
+        return transcribe_batch(audios, self.model, preset, prompt, max_batch_size)
+
+    def warm_up(self):
+        return warm_up_model(self.model)
+
+
+class FasterWhisperEngine(STTEngine):
+    """
+    Whisper converted to CTranslate2 (faster-whisper package).
+
+    Uses int8/float32 CPU kernels and its own thread pool, typically several
+    times faster than the reference engine on CPU. The compute type comes
+    from STT_COMPUTE_TYPE; ``quantize`` forces int8 whatever it says.
+    ``cpu_threads`` should be the core share of one worker in its pool
+    (defaults to the primary pool's share without secondary pools).
+    """
+
+    name = "faster-whisper"
+    package = "faster_whisper"
+
+    def __init__(self, model_name: str = WHISPER_MODEL, quantize: bool = WHISPER_QUANTIZE,
+                 cpu_threads: Optional[int] = None):
+        compute_type = "int8" if quantize and not STT_COMPUTE_TYPE.startswith("int8") else STT_COMPUTE_TYPE
+        super().__init__(model_name, compute_type.startswith("int8"))
+        from faster_whisper import WhisperModel
+
+        self.compute_type = compute_type
+        self.model = WhisperModel(
+            model_name,
+            device="cpu",
+            compute_type=compute_type,
+            cpu_threads=cpu_threads or max(1, STT_CPU_CORES // max(1, STT_WORKERS))
+        )
+
+    def transcribe(self, audio, preset=None, prompt=None):
+        options = decode_preset(preset)
+        temperatures = list(options["temperature"])
+        segments, _ = self.model.transcribe(
+            audio,
+            language=options["language"],
+            beam_size=options["beam_size"] or 1,
+            best_of=options["best_of"] or 1,
+            temperature=temperatures,
+            condition_on_previous_text=options["condition_on_previous_text"],
+            initial_prompt=prompt,
+            without_timestamps=True
+        )
+        segments = list(segments)
+        fallbacks = count_fallbacks(
+            ((segment.seek, segment.temperature) for segment in segments), temperatures
+        )
+        return Transcription("".join(segment.text for segment in segments).strip(), fallbacks)
+
+    def warm_up(self):
+        start = time.perf_counter()
+        segments, _ = self.model.transcribe(
+            synthetic_clip(), language="en", beam_size=1, temperature=0.0,
+            without_timestamps=True, max_new_tokens=WARMUP_TOKENS
+        )
+        list(segments)
+        return time.perf_counter() - start
+
+
+ENGINES: Dict[str, Type[STTEngine]] = {
+    WhisperEngine.name: WhisperEngine,
+    FasterWhisperEngine.name: FasterWhisperEngine
+}
+
+
+def available_engines() -> List[str]:
+    """Names of engines whose runtime is installed."""
+    return [
+        name for name, engine in ENGINES.items()
+        if getattr(engine, "package", None) is None
+        or importlib.util.find_spec(engine.package) is not None
+    ]
+
+
+def create_stt_engine(name: str = STT_ENGINE, model_name: str = WHISPER_MODEL,
+                      quantize: bool = WHISPER_QUANTIZE,
+                      cpu_threads: Optional[int] = None) -> STTEngine:
+    """
+    Load a speech-to-text engine.
+
+    Args:
+        name: Engine name, or "auto" for the fastest installed engine
+        model_name: Whisper model size (tiny, base, small, ...)
+        quantize: Int8 quantization for the reference engine
+        cpu_threads: Threads for engines with their own thread pool (one
+            worker's core share)
+
+    Raises:
+        ValueError: If the engine is unknown or its runtime is not installed
+    """
+    installed = available_engines()
+    if name == "auto":
+        name = FasterWhisperEngine.name if FasterWhisperEngine.name in installed else WhisperEngine.name
+    if name not in ENGINES:
+        raise ValueError(f"Unknown STT engine '{name}'. Available: {', '.join(ENGINES)}")
+    if name not in installed:
+        raise ValueError(f"STT engine '{name}' is not installed (pip install {name})")
+    return ENGINES[name](model_name, quantize, cpu_threads)
+
+
+# Worker pool entry points: the pool passes each worker's engine as ``model``
+
+def engine_transcribe(audio: np.ndarray, model: STTEngine, preset: Optional[str] = None,
+                      prompt: Optional[str] = None) -> Transcription:
+    """Transcribe one clip on the worker's engine."""
+    start = time.perf_counter()
+    result = model.transcribe(audio, preset, prompt)
+    result.decode_seconds = time.perf_counter() - start
+    return result
+
+
+def engine_transcribe_batch(audios: List[np.ndarray], model: STTEngine, preset: Optional[str] = None,
+                            prompt: Optional[str] = None,
+                            max_batch_size: int = STT_MAX_BATCH_SIZE) -> List[Transcription]:
+    """Transcribe several clips on the worker's engine."""
+    start = time.perf_counter()
+    results = model.transcribe_batch(audios, preset, prompt, max_batch_size)
+    # Clips in a batch share the decoder pass, so they share its cost
+    for result in results:
+        result.decode_seconds = (time.perf_counter() - start) / max(1, len(results))
+    return results
+
+
+def engine_warm_up(model: STTEngine) -> float:
+    """Warm up the worker's engine."""
+    return model.warm_up()
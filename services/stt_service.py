@@ -1,26 +1,480 @@
 """
 Speech-to-Text Service using OpenAI Whisper.
+Whisper and Torch are imported on first use, so importing this module is cheap.
 """
 import os
+import struct
+import subprocess
 import tempfile
-import streamlit as st
-import whisper
+import time
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 
-@st.cache_resource
-def load_whisper_model():
-    """Load Whisper model with caching."""
-    return whisper.load_model("base")
+# Local imports
+from config.settings import (
+    WHISPER_MODEL,
+    WHISPER_QUANTIZE,
+    WHISPER_MMAP,
+    STT_MAX_BATCH_SIZE,
+    STT_DECODE_PRESETS,
+    STT_DEFAULT_PRESET
+)
 
+SAMPLE_RATE = 16000
 
-def transcribe_audio(audio_bytes: bytes, model) -> str:
-    """Transcribe audio bytes using Whisper."""
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
+# Same thresholds model.transcribe uses to decide on a temperature fallback
+COMPRESSION_RATIO_THRESHOLD = 2.4
+LOGPROB_THRESHOLD = -1.0
+NO_SPEECH_THRESHOLD = 0.6
+
+# Tokens decoded by the warm-up pass
+WARMUP_TOKENS = 8
+
+# Whisper keeps at most 223 prompt tokens; questions are far shorter
+MAX_PROMPT_CHARS = 600
+
+# WAV format tags
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+def quantize_whisper_model(model):
+    """
+    Apply PyTorch dynamic int8 quantization to a CPU Whisper model.
+
+    Whisper defines its own ``nn.Linear`` subclass, which quantize_dynamic
+    skips, so those layers are first swapped for plain ``nn.Linear`` modules
+    sharing the same parameters.
+    """
+    import torch
+
+    for parent in list(model.modules()):
+        for name, child in list(parent.named_children()):
+            if isinstance(child, torch.nn.Linear) and type(child) is not torch.nn.Linear:
+                linear = torch.nn.Linear(child.in_features, child.out_features,
+                                         bias=child.bias is not None)
+                linear.weight = child.weight
+                linear.bias = child.bias
+                setattr(parent, name, linear)
+
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def whisper_cache_dir() -> str:
+    """Directory whisper.load_model downloads checkpoints to."""
+    default = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(os.getenv("XDG_CACHE_HOME", default), "whisper")
+
+
+def can_mmap_weights(name: str = WHISPER_MODEL) -> bool:
+    """
+    Whether ``name`` is an official checkpoint that mmap_weights_path can convert.
+
+    Custom checkpoint paths and fine-tuned names load the regular way.
+    """
+    import whisper
+
+    return name in whisper._MODELS
+
+
+def mmap_weights_path(name: str = WHISPER_MODEL) -> str:
+    """
+    Path of an fp32 copy of a Whisper checkpoint, created on first use.
+
+    Released checkpoints store fp16 weights that load_model converts to fp32
+    in fresh memory; an fp32 file can be memory-mapped and used in place.
+    """
+    path = os.path.join(whisper_cache_dir(), f"{name}.fp32.pt")
+    if os.path.exists(path):
+        return path
+
+    import torch
+    import whisper
+
+    checkpoint_file = whisper._download(whisper._MODELS[name], whisper_cache_dir(), False)
+    checkpoint = torch.load(checkpoint_file, map_location="cpu", weights_only=True)
+    state_dict = {key: value.float() for key, value in checkpoint["model_state_dict"].items()}
+
+    with tempfile.NamedTemporaryFile(dir=whisper_cache_dir(), delete=False) as tmp_file:
+        torch.save({"dims": checkpoint["dims"], "model_state_dict": state_dict}, tmp_file)
+        tmp_file_path = tmp_file.name
+    os.replace(tmp_file_path, path)
+    return path
+
+
+# Memory-mapped checkpoints by model name, loaded once per process
+_mapped_weights = {}
+
+
+def load_shared_weights(name: str = WHISPER_MODEL) -> dict:
+    """
+    Memory-map a model's fp32 weights.
+
+    Call this before forking worker processes: the children inherit the
+    mapping, and the weight pages stay shared copy-on-write since inference
+    never writes to them.
+    """
+    if name not in _mapped_weights:
+        import torch
+        _mapped_weights[name] = torch.load(
+            mmap_weights_path(name), map_location="cpu", mmap=True, weights_only=True
+        )
+    return _mapped_weights[name]
+
+
+def create_mapped_model(name: str = WHISPER_MODEL):
+    """Build a CPU Whisper model whose parameters point into the shared mapping."""
+    import whisper
+
+    checkpoint = load_shared_weights(name)
+    model = whisper.model.Whisper(whisper.model.ModelDimensions(**checkpoint["dims"]))
+    # assign=True keeps the mapped tensors instead of copying into new ones
+    model.load_state_dict(checkpoint["model_state_dict"], assign=True)
+    if name in whisper._ALIGNMENT_HEADS:
+        model.set_alignment_heads(whisper._ALIGNMENT_HEADS[name])
+    return model.eval()
+
+
+def create_whisper_model(name: str = WHISPER_MODEL, quantize: bool = WHISPER_QUANTIZE):
+    """Load a fresh Whisper model instance (no caching)."""
+    import torch
+    import whisper
+
+    if quantize:
+        return quantize_whisper_model(whisper.load_model(name, device="cpu"))
+    if WHISPER_MMAP and not torch.cuda.is_available() and can_mmap_weights(name):
+        return create_mapped_model(name)
+    return whisper.load_model(name)
+
+
+def _parse_pcm_wav(audio_bytes) -> Optional[np.ndarray]:
+    """
+    Read a 16 kHz mono PCM WAV without ffmpeg, or None otherwise.
+
+    Walks the RIFF chunks instead of assuming a 44-byte header, since
+    recorders often add LIST/fact chunks before the audio data. Float32
+    samples are used in place; 16-bit samples are converted to a new
+    float32 array.
+    """
+    view = memoryview(audio_bytes)
+    if len(view) < 12 or bytes(view[0:4]) != b"RIFF" or bytes(view[8:12]) != b"WAVE":
+        return None
+
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(view):
+        chunk_id = bytes(view[offset:offset + 4])
+        chunk_size = int.from_bytes(view[offset + 4:offset + 8], "little")
+        body = offset + 8
+
+        if chunk_id == b"fmt " and chunk_size >= 16:
+            if body + min(chunk_size, 26) > len(view):
+                # Truncated header
+                return None
+            format_tag, channels, sample_rate = struct.unpack_from("<HHI", view, body)
+            bits = struct.unpack_from("<H", view, body + 14)[0]
+            if format_tag == WAVE_FORMAT_EXTENSIBLE and chunk_size >= 26:
+                format_tag = struct.unpack_from("<H", view, body + 24)[0]
+            fmt = (format_tag, channels, sample_rate, bits)
+        elif chunk_id == b"data":
+            if fmt is None:
+                return None
+            format_tag, channels, sample_rate, bits = fmt
+            if channels != 1 or sample_rate != SAMPLE_RATE:
+                return None
+
+            end = min(body + chunk_size, len(view))
+            if format_tag == WAVE_FORMAT_PCM and bits == 16:
+                samples = np.frombuffer(view, np.int16, (end - body) // 2, body)
+                return samples.astype(np.float32) / 32768.0
+            if format_tag == WAVE_FORMAT_IEEE_FLOAT and bits == 32:
+                return np.frombuffer(view, np.float32, (end - body) // 4, body)
+            return None
+
+        # Chunks are word-aligned
+        offset = body + chunk_size + (chunk_size & 1)
+
+    return None
+
+
+def ffmpeg_decode_command(source: str) -> List[str]:
+    """ffmpeg arguments that decode ``source`` to 16 kHz mono s16le on stdout."""
+    return [
+        "ffmpeg", "-nostdin", "-threads", "0",
+        "-i", source,
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le",
+        "-ar", str(SAMPLE_RATE),
+        "-"
+    ]
+
+
+def _ffmpeg_decode(source: str, audio_bytes=None) -> subprocess.CompletedProcess:
+    try:
+        return subprocess.run(ffmpeg_decode_command(source), input=audio_bytes, capture_output=True)
+    except OSError as e:
+        # ffmpeg missing or not executable
+        raise RuntimeError(f"Failed to decode audio: cannot run ffmpeg ({e})") from e
+
+
+def pcm16_to_float(pcm) -> np.ndarray:
+    """Convert 16-bit little-endian PCM bytes to float32 samples in [-1, 1]."""
+    return np.frombuffer(pcm, np.int16).astype(np.float32) / 32768.0
+
+
+def decode_audio_file(path: str) -> np.ndarray:
+    """Decode an audio file on disk to a 16 kHz mono float32 array."""
+    result = _ffmpeg_decode(path)
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to decode audio: {result.stderr.decode(errors='ignore')[-500:]}")
+    return pcm16_to_float(result.stdout)
+
+
+def decode_audio(audio_bytes) -> np.ndarray:
+    """
+    Decode uploaded audio to a 16 kHz mono float32 array in memory.
+
+    16 kHz mono PCM WAV is parsed without ffmpeg. Everything else is
+    piped through ffmpeg stdin/stdout; only inputs ffmpeg cannot demux from a
+    pipe (MP4/M4A with the moov atom at the end) fall back to a temp file.
+
+    Args:
+        audio_bytes: Encoded audio (bytes, bytearray or memoryview)
+
+    Returns:
+        Float32 samples in [-1, 1]
+    """
+    audio = _parse_pcm_wav(audio_bytes)
+    if audio is not None:
+        return audio
+
+    result = _ffmpeg_decode("pipe:0", bytes(audio_bytes))
+    if result.returncode == 0 and result.stdout:
+        return pcm16_to_float(result.stdout)
+
+    # Non-seekable input can't be demuxed, retry from a real file
+    with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
         tmp_file.write(audio_bytes)
         tmp_file_path = tmp_file.name
-    
     try:
-        result = model.transcribe(tmp_file_path)
-        return result["text"].strip()
+        return decode_audio_file(tmp_file_path)
     finally:
         os.unlink(tmp_file_path)
+
+
+def decode_preset(name: Optional[str] = None) -> dict:
+    """
+    Look up a decode preset by name.
+
+    Args:
+        name: Preset name, or None for STT_DEFAULT_PRESET
+
+    Raises:
+        ValueError: If the preset does not exist
+    """
+    name = name or STT_DEFAULT_PRESET
+    if name not in STT_DECODE_PRESETS:
+        raise ValueError(f"Unknown decode preset '{name}'. Available: {', '.join(STT_DECODE_PRESETS)}")
+    return STT_DECODE_PRESETS[name]
+
+
+class Transcription:
+    """Transcript plus decoding statistics."""
+
+    def __init__(self, text: str, fallbacks: int = 0):
+        self.text = text
+        # Extra decode passes at higher temperatures
+        self.fallbacks = fallbacks
+        # Worker time spent decoding (set by the worker pool entry points)
+        self.decode_seconds = 0.0
+
+
+def question_prompt(question: Optional[str]) -> Optional[str]:
+    """
+    Turn a question into a Whisper initial prompt.
+
+    The answer usually reuses the question's vocabulary, so showing it to
+    the decoder as preceding text makes the first decode more confident and
+    avoids temperature fallbacks on accented speech.
+    """
+    if not question:
+        return None
+    return question.strip()[-MAX_PROMPT_CHARS:]
+
+
+def count_fallbacks(windows: Iterable[Tuple[int, float]], temperatures: Sequence[float]) -> int:
+    """
+    Count temperature-fallback re-decodes from per-segment decode results.
+
+    Args:
+        windows: ``(seek, temperature)`` of every segment; segments cut from
+            the same 30-second window share its seek and its temperature
+        temperatures: The preset's temperature schedule
+
+    Returns:
+        Extra decode passes, counted once per window
+    """
+    final = dict(windows)
+    return sum(temperatures.index(t) for t in final.values() if t in temperatures)
+
+
+def transcribe_with_stats(audio: Union[bytes, np.ndarray], model, preset: Optional[str] = None,
+                          prompt: Optional[str] = None) -> Transcription:
+    """
+    Transcribe audio and count temperature-fallback re-decodes.
+
+    Args:
+        audio: Encoded audio bytes or a decoded 16 kHz array
+        model: Loaded Whisper model
+        preset: Decode preset name (default preset if None)
+        prompt: Optional initial prompt (see question_prompt)
+
+    Returns:
+        Transcription with the text and the number of fallback passes
+    """
+    if not isinstance(audio, np.ndarray):
+        audio = decode_audio(audio)
+
+    options = decode_preset(preset)
+    result = model.transcribe(
+        audio,
+        fp16=model.device.type == "cuda",
+        initial_prompt=prompt,
+        **options
+    )
+
+    # Each segment records the temperature its window was finally decoded at
+    fallbacks = count_fallbacks(
+        ((segment["seek"], segment["temperature"]) for segment in result["segments"]),
+        list(options["temperature"])
+    )
+    return Transcription(result["text"].strip(), fallbacks)
+
+
+def transcribe_audio(audio: Union[bytes, np.ndarray], model, preset: Optional[str] = None,
+                     prompt: Optional[str] = None) -> str:
+    """Transcribe audio bytes or a decoded 16 kHz array using Whisper."""
+    return transcribe_with_stats(audio, model, preset, prompt).text
+
+
+def _decoding_options(options: dict, temperature: float, fp16: bool, prompt: Optional[str]):
+    import whisper
+
+    # Beam search only applies to greedy decoding and best_of only to sampling
+    return whisper.DecodingOptions(
+        language=options["language"],
+        temperature=temperature,
+        beam_size=options["beam_size"] if temperature == 0 else None,
+        best_of=options["best_of"] if temperature > 0 else None,
+        prompt=prompt,
+        without_timestamps=True,
+        fp16=fp16
+    )
+
+
+def synthetic_clip(seconds: float = 1.0) -> np.ndarray:
+    """A short voiced-like test signal (harmonic tone with a syllable envelope)."""
+    t = np.arange(int(seconds * SAMPLE_RATE), dtype=np.float32) / SAMPLE_RATE
+    envelope = 0.5 * (1 - np.cos(2 * np.pi * 4 * t))
+    tone = sum(np.sin(2 * np.pi * 140 * k * t) / k for k in range(1, 6))
+    return (0.1 * envelope * tone).astype(np.float32)
+
+
+def warm_up_model(model) -> float:
+    """
+    Run one short decode so the first real request doesn't pay warm-up costs.
+
+    The encoder always sees a full 30-second window, so a 1-second clip
+    exercises the same kernels and allocations as a real answer; the
+    decoder is capped at a few tokens.
+
+    Returns:
+        Seconds spent warming up
+    """
+    import torch
+    import whisper
+
+    start = time.perf_counter()
+    mel = whisper.log_mel_spectrogram(whisper.pad_or_trim(synthetic_clip()), model.dims.n_mels)
+    options = whisper.DecodingOptions(
+        language="en",
+        without_timestamps=True,
+        sample_len=WARMUP_TOKENS,
+        fp16=model.device.type == "cuda"
+    )
+    with torch.no_grad():
+        whisper.decode(model, mel.to(model.device), options)
+    return time.perf_counter() - start
+
+
+def _needs_fallback(result) -> bool:
+    if result.no_speech_prob > NO_SPEECH_THRESHOLD:
+        return False
+    return (result.compression_ratio > COMPRESSION_RATIO_THRESHOLD
+            or result.avg_logprob < LOGPROB_THRESHOLD)
+
+
+def transcribe_batch(audios: List[np.ndarray], model, preset: Optional[str] = None,
+                     prompt: Optional[str] = None,
+                     max_batch_size: int = STT_MAX_BATCH_SIZE) -> List[Transcription]:
+    """
+    Transcribe several clips with one batched encoder/decoder pass.
+
+    Each clip is cut into 30-second windows; the padded log-mel windows of
+    all clips are stacked and decoded together, then regrouped per clip.
+    Windows that look like a failed decode are retried one by one at the
+    preset's higher temperatures, as model.transcribe does.
+
+    Args:
+        audios: 16 kHz mono float32 arrays
+        model: Loaded Whisper model
+        preset: Decode preset name (default preset if None)
+        prompt: Optional initial prompt shared by every window
+        max_batch_size: Maximum windows per decoder pass
+
+    Returns:
+        One Transcription per input clip
+    """
+    import torch
+    import whisper
+
+    options = decode_preset(preset)
+    temperatures = options["temperature"]
+    fp16 = model.device.type == "cuda"
+
+    mels = []
+    owners = []
+    for idx, audio in enumerate(audios):
+        for start in range(0, max(len(audio), 1), whisper.audio.N_SAMPLES):
+            window = whisper.pad_or_trim(audio[start:start + whisper.audio.N_SAMPLES])
+            mels.append(whisper.log_mel_spectrogram(window, model.dims.n_mels))
+            owners.append(idx)
+
+    results = []
+    first_pass = _decoding_options(options, temperatures[0], fp16, prompt)
+    for start in range(0, len(mels), max_batch_size):
+        batch = torch.stack(mels[start:start + max_batch_size]).to(model.device)
+        results.extend(whisper.decode(model, batch, first_pass))
+
+    fallbacks = [0] * len(audios)
+    for idx, result in enumerate(results):
+        for temperature in temperatures[1:]:
+            if not _needs_fallback(result):
+                break
+            fallbacks[owners[idx]] += 1
+            retry = _decoding_options(options, temperature, fp16, prompt)
+            result = whisper.decode(model, mels[idx].to(model.device), retry)
+        results[idx] = result
+
+    texts = [[] for _ in audios]
+    for owner, result in zip(owners, results):
+        # Same silence rule as model.transcribe
+        if result.no_speech_prob > NO_SPEECH_THRESHOLD and result.avg_logprob < LOGPROB_THRESHOLD:
+            continue
+        texts[owner].append(result.text.strip())
+
+    return [
+        Transcription(" ".join(parts).strip(), count)
+        for parts, count in zip(texts, fallbacks)
+    ]
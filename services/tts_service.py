@@ -1,25 +1,70 @@
 """
 Text-to-Speech Service using Edge TTS.
 """
-import os
 import asyncio
-import tempfile
-import edge_tts
+import hashlib
+import json
+from typing import AsyncIterator
 
+from config.settings import TTS_CACHE_DIR, TTS_CACHE_DISK_MAX_BYTES, TTS_CACHE_MAX_BYTES
+from services.cache import TwoTierCache
 
-def text_to_speech(text: str, voice: str = "en-US-ChristopherNeural") -> bytes:
-    """Convert text to speech using edge-tts (async) -> run synchronously."""
-    with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp_file:
-        tmp_file_path = tmp_file.name
+# Edge TTS returns MP3 unless another output format is requested
+TTS_FORMAT = "mp3"
+
+# Synthesized audio shared by the Streamlit app and the API; the disk tier
+# lets both processes (and restarts) reuse each other's audio
+tts_cache = TwoTierCache(TTS_CACHE_MAX_BYTES, TTS_CACHE_DIR, TTS_CACHE_DISK_MAX_BYTES)
+
+
+def tts_cache_key(text: str, voice: str, audio_format: str = TTS_FORMAT) -> str:
+    """Content address of the audio for ``text`` spoken by ``voice``."""
+    payload = json.dumps([text, voice, audio_format])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+async def stream_speech(text: str, voice: str = "en-US-ChristopherNeural") -> AsyncIterator[bytes]:
+    """
+    Yield MP3 chunks as Edge TTS produces them.
 
-    async def _generate_audio():
-        communicate = edge_tts.Communicate(text, voice)
-        await communicate.save(tmp_file_path)
+    Raises:
+        RuntimeError: If the stream ends without any audio
+    """
+    import edge_tts
 
-    asyncio.run(_generate_audio())
+    communicate = edge_tts.Communicate(text, voice)
+    received = False
+    async for chunk in communicate.stream():
+        if chunk["type"] == "audio" and chunk["data"]:
+            received = True
+            yield chunk["data"]
+    if not received:
+        raise RuntimeError("Edge TTS returned no audio")
 
-    with open(tmp_file_path, "rb") as f:
-        audio_bytes = f.read()
-    
-    os.unlink(tmp_file_path)
+
+async def synthesize_speech(text: str, voice: str = "en-US-ChristopherNeural") -> bytes:
+    """Synthesize the complete MP3 in memory on the running event loop."""
+    return b"".join([chunk async for chunk in stream_speech(text, voice)])
+
+
+async def stream_and_cache(text: str, voice: str = "en-US-ChristopherNeural") -> AsyncIterator[bytes]:
+    """Yield MP3 chunks as they are synthesized and cache the complete audio at the end."""
+    chunks = []
+    async for chunk in stream_speech(text, voice):
+        chunks.append(chunk)
+        yield chunk
+    # stream_speech raises rather than end empty, so silence is never cached
+    await tts_cache.aset(tts_cache_key(text, voice), b"".join(chunks))
+
+
+def text_to_speech(text: str, voice: str = "en-US-ChristopherNeural") -> bytes:
+    """
+    Convert text to speech for callers without an event loop (Streamlit),
+    reusing cached audio for repeated text and voice.
+    """
+    key = tts_cache_key(text, voice)
+    audio_bytes = tts_cache.get(key)
+    if audio_bytes is None:
+        audio_bytes = asyncio.run(synthesize_speech(text, voice))
+        tts_cache.set(key, audio_bytes)
     return audio_bytes
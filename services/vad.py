@@ -0,0 +1,158 @@
+"""
+Voice Activity Detection for recorded answers.
+Energy/zero-crossing-rate framing used to trim silence before Whisper.
+"""
+import numpy as np
+
+# Local imports
+from config.settings import (
+    STT_VAD_MIN_SPEECH_SECONDS,
+    STT_VAD_MAX_SILENCE_SECONDS
+)
+
+SAMPLE_RATE = 16000
+
+# 30 ms analysis frames
+FRAME_SAMPLES = 480
+
+# Frames of padding kept around detected speech (240 ms)
+HANGOVER_FRAMES = 8
+
+# Anything quieter than this is silence regardless of the noise floor
+ABSOLUTE_FLOOR_DB = -55.0
+
+# A clip whose loud and quiet frames differ by less than this has no speech
+# in it, just stationary noise or digital silence
+MIN_DYNAMIC_RANGE_DB = 6.0
+
+# Zero-crossing rate band of unvoiced consonants (s, f, th)
+UNVOICED_ZCR = (0.2, 0.6)
+
+# How far back from a cut limit to look for a pause
+CUT_SEARCH_SECONDS = 3.0
+
+
+class VadResult:
+    """Outcome of the voice activity gate."""
+
+    def __init__(self, audio: np.ndarray, speech_seconds: float, trimmed_seconds: float):
+        self.audio = audio
+        self.speech_seconds = speech_seconds
+        self.trimmed_seconds = trimmed_seconds
+
+    @property
+    def is_silent(self) -> bool:
+        """True when the clip holds too little speech to transcribe."""
+        return self.speech_seconds < STT_VAD_MIN_SPEECH_SECONDS
+
+
+def speech_frames(audio: np.ndarray, hangover: bool = True) -> np.ndarray:
+    """
+    Classify 30 ms frames of 16 kHz audio as speech or silence.
+
+    Args:
+        audio: 16 kHz mono float32 samples
+        hangover: Extend detected speech by HANGOVER_FRAMES on each side
+
+    Returns:
+        Boolean mask with one entry per full frame
+    """
+    n_frames = len(audio) // FRAME_SAMPLES
+    if n_frames == 0:
+        return np.zeros(0, dtype=bool)
+
+    frames = audio[:n_frames * FRAME_SAMPLES].reshape(n_frames, FRAME_SAMPLES)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+    energy_db = 20 * np.log10(rms + 1e-10)
+
+    floor_db = np.percentile(energy_db, 10)
+    peak_db = np.percentile(energy_db, 95)
+    dynamic_db = peak_db - floor_db
+    if peak_db < ABSOLUTE_FLOOR_DB or dynamic_db < MIN_DYNAMIC_RANGE_DB:
+        return np.zeros(n_frames, dtype=bool)
+
+    # Adaptive threshold: 10 dB over the noise floor, less for noisy
+    # recordings where speech barely rises above the background
+    threshold_db = max(ABSOLUTE_FLOOR_DB, floor_db + min(10.0, dynamic_db / 2))
+    voiced = energy_db > threshold_db
+
+    signs = np.signbit(frames)
+    zcr = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+    unvoiced = (
+        (energy_db > threshold_db - 6.0)
+        & (zcr > UNVOICED_ZCR[0])
+        & (zcr < UNVOICED_ZCR[1])
+    )
+
+    mask = voiced | unvoiced
+    return add_hangover(mask) if hangover else mask
+
+
+def add_hangover(mask: np.ndarray) -> np.ndarray:
+    """Keep word onsets and tails by widening speech by HANGOVER_FRAMES."""
+    if len(mask) == 0:
+        return mask
+    kernel = np.ones(2 * HANGOVER_FRAMES + 1)
+    return np.convolve(mask, kernel, mode="same") > 0
+
+
+def trim_silence(audio: np.ndarray,
+                 max_silence_seconds: float = STT_VAD_MAX_SILENCE_SECONDS) -> VadResult:
+    """
+    Trim leading/trailing silence and shorten long internal pauses.
+
+    Args:
+        audio: 16 kHz mono float32 samples
+        max_silence_seconds: Internal pauses are cut down to this length
+
+    Returns:
+        VadResult with the trimmed audio and speech/trim durations
+    """
+    # Speech is measured before the hangover padding, which would otherwise
+    # turn a single click into half a second of "speech"
+    voiced = speech_frames(audio, hangover=False)
+    mask = add_hangover(voiced)
+    speech_idx = np.flatnonzero(mask)
+    if len(speech_idx) == 0:
+        return VadResult(audio[:0], 0.0, len(audio) / SAMPLE_RATE)
+
+    keep = np.zeros(len(mask), dtype=bool)
+    first, last = speech_idx[0], speech_idx[-1]
+    keep[first:last + 1] = True
+
+    # Shorten internal pauses, keeping half of the allowance on each side
+    max_silence = int(max_silence_seconds * SAMPLE_RATE / FRAME_SAMPLES)
+    gaps = np.flatnonzero(np.diff(speech_idx) > max_silence + 1)
+    for gap in gaps:
+        start = speech_idx[gap] + 1 + max_silence // 2
+        end = speech_idx[gap + 1] - (max_silence - max_silence // 2)
+        keep[start:end] = False
+
+    sample_keep = np.repeat(keep, FRAME_SAMPLES)
+    trimmed = audio[:len(sample_keep)][sample_keep]
+
+    return VadResult(
+        trimmed,
+        speech_seconds=voiced.sum() * FRAME_SAMPLES / SAMPLE_RATE,
+        trimmed_seconds=(len(audio) - len(trimmed)) / SAMPLE_RATE
+    )
+
+
+def find_quiet_cut(audio: np.ndarray, search_seconds: float = CUT_SEARCH_SECONDS) -> int:
+    """
+    Find the quietest frame near the end of ``audio`` to cut at.
+
+    Cutting in a pause keeps words from being split across two pieces.
+
+    Returns:
+        Sample index of the cut
+    """
+    search = min(len(audio), int(search_seconds * SAMPLE_RATE))
+    start = len(audio) - search
+    n_frames = search // FRAME_SAMPLES
+    if n_frames == 0:
+        return len(audio)
+
+    frames = audio[start:start + n_frames * FRAME_SAMPLES].reshape(n_frames, FRAME_SAMPLES)
+    energy = np.square(frames).mean(axis=1)
+    return start + int(np.argmin(energy)) * FRAME_SAMPLES + FRAME_SAMPLES // 2
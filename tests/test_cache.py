@@ -0,0 +1,114 @@
+"""Tests for the two-tier byte cache."""
+import asyncio
+import os
+
+from services import cache as cache_module
+from services.cache import TwoTierCache
+
+KEY_A = "a" * 64
+KEY_B = "b" * 64
+KEY_C = "c" * 64
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = TwoTierCache(max_bytes=10)
+    cache.set(KEY_A, b"aaaa")
+    cache.set(KEY_B, b"bbbb")
+    assert cache.get(KEY_A) == b"aaaa"
+    cache.set(KEY_C, b"cccc")
+    assert cache.get(KEY_B) is None
+    assert cache.get(KEY_A) == b"aaaa"
+    stats = cache.stats()
+    assert stats["bytes"] == 8
+    assert stats["evictions"] == 1
+    assert (stats["memory_hits"], stats["misses"]) == (2, 1)
+
+
+def test_values_larger_than_memory_go_to_disk_only(tmp_path):
+    cache = TwoTierCache(max_bytes=4, directory=str(tmp_path))
+    cache.set(KEY_A, b"too large")
+    assert cache.stats()["entries"] == 0
+    assert cache.get(KEY_A) == b"too large"
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_disk_tier_is_shared_and_promoted(tmp_path):
+    TwoTierCache(1024, str(tmp_path)).set(KEY_A, b"audio")
+    other = TwoTierCache(1024, str(tmp_path))
+    assert other.get(KEY_A) == b"audio"
+    assert other.get(KEY_A) == b"audio"
+    stats = other.stats()
+    assert (stats["disk_hits"], stats["memory_hits"]) == (1, 1)
+    assert os.path.exists(os.path.join(tmp_path, "aa", KEY_A))
+
+
+def test_disk_tier_evicts_least_recently_used(tmp_path):
+    cache = TwoTierCache(0, str(tmp_path), max_disk_bytes=10)
+    cache.set(KEY_A, b"aaaa")
+    cache.set(KEY_B, b"bbbb")
+    # Make A the oldest entry on disk, then read B so it stays the newest
+    os.utime(cache.path_for(KEY_A), (1, 1))
+    os.utime(cache.path_for(KEY_B), (2, 2))
+    assert cache.get(KEY_B) == b"bbbb"
+    cache.set(KEY_C, b"cccc")
+    assert not os.path.exists(cache.path_for(KEY_A))
+    assert cache.get(KEY_B) == b"bbbb"
+    assert cache.get(KEY_C) == b"cccc"
+    assert cache.stats()["disk_evictions"] == 1
+
+
+def test_disk_trim_leaves_other_files_alone(tmp_path):
+    os.makedirs(os.path.join(tmp_path, "results"))
+    with open(os.path.join(tmp_path, "results", KEY_A), "wb") as f:
+        f.write(b"x" * 100)
+    cache = TwoTierCache(0, str(tmp_path), max_disk_bytes=10)
+    cache.set(KEY_B, b"bbbb")
+    assert os.path.exists(os.path.join(tmp_path, "results", KEY_A))
+    assert cache.get(KEY_B) == b"bbbb"
+
+
+def test_unreadable_entry_is_a_miss(tmp_path):
+    cache = TwoTierCache(1024, str(tmp_path))
+    # A directory where the file should be makes open() fail with an OSError
+    os.makedirs(os.path.join(tmp_path, "aa", KEY_A))
+    assert cache.get(KEY_A) is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_failed_replace_leaves_no_temp_file(tmp_path, monkeypatch):
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cache_module.os, "replace", fail_replace)
+    cache = TwoTierCache(1024, str(tmp_path))
+    cache.set(KEY_A, b"audio")
+    assert cache.get(KEY_A) == b"audio"
+    assert os.listdir(os.path.join(tmp_path, "aa")) == []
+
+
+def test_delete_removes_both_tiers(tmp_path):
+    cache = TwoTierCache(1024, str(tmp_path))
+    cache.set(KEY_A, b"audio")
+    cache.delete(KEY_A)
+    cache.delete(KEY_B)
+    assert cache.get(KEY_A) is None
+    assert cache.stats()["bytes"] == 0
+
+
+def test_async_access_matches_sync(tmp_path):
+    async def run():
+        cache = TwoTierCache(1024, str(tmp_path))
+        await cache.aset(KEY_A, b"audio")
+        fresh = TwoTierCache(1024, str(tmp_path))
+        return await fresh.aget(KEY_A), await fresh.aget(KEY_A), await fresh.aget(KEY_B), fresh.stats()
+
+    from_disk, from_memory, missing, stats = asyncio.run(run())
+    assert from_disk == from_memory == b"audio"
+    assert missing is None
+    assert (stats["disk_hits"], stats["memory_hits"], stats["misses"]) == (1, 1, 1)
+
+
+def test_async_memory_only_miss_is_counted():
+    cache = TwoTierCache(1024)
+    assert asyncio.run(cache.aget(KEY_A)) is None
+    assert cache.stats()["misses"] == 1
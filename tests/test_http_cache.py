@@ -0,0 +1,47 @@
+"""Tests for ETag matching and byte-range parsing."""
+import pytest
+
+from backend.utils.http_cache import RangeNotSatisfiableError, etag_matches, parse_byte_range
+
+
+def test_etag_matches_exact_list_weak_and_wildcard():
+    etag = '"abc"'
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('"x", "abc"', etag)
+    assert etag_matches('W/"abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"abcd"', etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches("", etag)
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-99", (0, 99)),
+    ("bytes=100-", (100, 999)),
+    ("bytes=-100", (900, 999)),
+    ("bytes=-5000", (0, 999)),
+    ("bytes=990-5000", (990, 999)),
+    ("bytes= 10 - 20 ", (10, 20)),
+])
+def test_satisfiable_ranges(header, expected):
+    assert parse_byte_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize("header", [
+    None,
+    "",
+    "items=0-10",
+    "bytes=0-10,20-30",
+    "bytes=abc",
+    "bytes=-",
+    "bytes=a-10",
+    "bytes=20-10",
+])
+def test_ignored_ranges_send_the_whole_resource(header):
+    assert parse_byte_range(header, 1000) is None
+
+
+@pytest.mark.parametrize("header", ["bytes=1000-", "bytes=5000-6000", "bytes=-0"])
+def test_unsatisfiable_ranges(header):
+    with pytest.raises(RangeNotSatisfiableError):
+        parse_byte_range(header, 1000)
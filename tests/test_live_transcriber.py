@@ -0,0 +1,29 @@
+"""Tests for the sliding-window live transcriber."""
+import asyncio
+
+import numpy as np
+
+from backend.utils.live_transcriber import LiveTranscriber
+
+
+def test_odd_length_frames_stay_sample_aligned():
+    received = []
+
+    async def transcribe(audio):
+        received.append(audio)
+        return f"{len(audio)} samples"
+
+    async def run():
+        live = LiveTranscriber(transcribe, partial_seconds=100, window_seconds=100)
+        pcm = (np.arange(1001, dtype=np.int16) * 7).tobytes()
+        # Split at odd offsets so every frame boundary falls inside a sample
+        live.add(pcm[:3])
+        live.add(pcm[3:1001])
+        live.add(pcm[1001:] + b"\x01")
+        return live, await live.finish(), pcm
+
+    live, transcript, pcm = asyncio.run(run())
+    assert live.total_samples == 1001
+    assert transcript == "1001 samples"
+    expected = np.frombuffer(pcm, np.int16).astype(np.float32) / 32768.0
+    np.testing.assert_allclose(received[0], expected)
@@ -0,0 +1,62 @@
+"""Tests for long-answer chunking and transcript stitching."""
+import numpy as np
+
+from services.long_audio import SAMPLE_RATE, _overlap_length, split_long_audio, stitch_transcripts
+
+
+def test_overlap_of_repeated_words_is_dropped():
+    assert stitch_transcripts([
+        "I usually go to the park on weekends",
+        "the park on weekends with my family"
+    ]) == "I usually go to the park on weekends with my family"
+
+
+def test_overlap_allows_one_clipped_leading_word():
+    previous = "we went to the beach last summer".split()
+    following = "mmer last summer and swam every day".split()
+    assert _overlap_length(previous, following) == 3
+
+
+def test_overlap_ignores_case_and_punctuation():
+    previous = "It was a lovely day.".split()
+    following = "Lovely day, and then it rained".split()
+    assert _overlap_length(previous, following) == 2
+
+
+def test_single_word_match_is_not_overlap():
+    # "I" ends one chunk and starts the next, but both were spoken
+    assert _overlap_length("and so I".split(), "I think it helps".split()) == 0
+    assert stitch_transcripts(["and so I", "I think it helps"]) == "and so I I think it helps"
+
+
+def test_single_word_match_after_skip_is_not_overlap():
+    # Skipping "really" to match "the" would drop two real words
+    assert _overlap_length("I liked the".split(), "really the food there".split()) == 0
+
+
+def test_no_overlap_keeps_every_word():
+    assert stitch_transcripts(["first part", "second part here"]) == "first part second part here"
+    assert stitch_transcripts(["", "only text"]) == "only text"
+
+
+def test_short_audio_is_one_chunk():
+    audio = np.zeros(5 * SAMPLE_RATE, np.float32)
+    chunks = split_long_audio(audio, chunk_seconds=10, overlap_seconds=1)
+    assert len(chunks) == 1
+    assert len(chunks[0]) == len(audio)
+
+
+def test_long_audio_chunks_overlap_and_cover_everything():
+    rng = np.random.default_rng(0)
+    audio = (rng.standard_normal(65 * SAMPLE_RATE) * 0.1).astype(np.float32)
+    chunks = split_long_audio(audio, chunk_seconds=20, overlap_seconds=1)
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 20 * SAMPLE_RATE for chunk in chunks)
+    # Chunks are views: consecutive chunks overlap by about a second
+    offsets = [chunk.__array_interface__["data"][0] - audio.__array_interface__["data"][0]
+               for chunk in chunks]
+    offsets = [offset // audio.itemsize for offset in offsets]
+    assert offsets[0] == 0
+    for offset, chunk, next_offset in zip(offsets, chunks, offsets[1:]):
+        assert offset + len(chunk) - next_offset == SAMPLE_RATE
+    assert offsets[-1] + len(chunks[-1]) == len(audio)
@@ -0,0 +1,40 @@
+"""Tests for the Streamlit service adapters."""
+import threading
+import time
+
+import numpy as np
+
+from components.service_adapters import SerializedEngine
+from services.stt_service import Transcription
+
+
+class RacyEngine:
+    """Fails if two threads are inside transcribe at once."""
+
+    def __init__(self):
+        self.inside = 0
+        self.overlaps = 0
+
+    def transcribe(self, audio, preset=None, prompt=None):
+        self.inside += 1
+        if self.inside > 1:
+            self.overlaps += 1
+        time.sleep(0.01)
+        self.inside -= 1
+        return Transcription(f"{len(audio)} {prompt}")
+
+
+def test_sessions_transcribe_one_at_a_time():
+    racy = RacyEngine()
+    engine = SerializedEngine(racy)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(engine.transcribe(np.zeros(4), prompt="q")))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert racy.overlaps == 0
+    assert [result.text for result in results] == ["4 q"] * 5
@@ -0,0 +1,93 @@
+"""Tests for dynamic micro-batching."""
+import asyncio
+
+import numpy as np
+
+from backend.utils import stt_batcher
+from backend.utils.stt_batcher import MicroBatcher
+from services.stt_service import Transcription
+
+
+class FakePool:
+    """Runs batch jobs inline and records each batch's size and options."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def submit(self, fn, audios, max_batch_size, **options):
+        self.batches.append((len(audios), options))
+        await asyncio.sleep(0)
+        if options.get("preset") == "broken":
+            raise RuntimeError("decode failed")
+        return [Transcription(f"{len(audio)} {options.get('preset')}") for audio in audios]
+
+
+def clip(samples):
+    return np.zeros(samples, np.float32)
+
+
+def test_concurrent_requests_share_a_batch():
+    async def run():
+        pool = FakePool()
+        batcher = MicroBatcher(pool, window_ms=20, max_batch_size=8)
+        results = await asyncio.gather(*(batcher.transcribe(clip(n), preset="fast") for n in (1, 2, 3)))
+        return pool, batcher, results
+
+    pool, batcher, results = asyncio.run(run())
+    assert [result.text for result in results] == ["1 fast", "2 fast", "3 fast"]
+    assert pool.batches == [(3, {"preset": "fast"})]
+    assert (batcher.batches_run, batcher.requests_batched, batcher.pending) == (1, 3, 0)
+
+
+def test_full_batch_flushes_without_waiting_for_the_window():
+    async def run():
+        pool = FakePool()
+        batcher = MicroBatcher(pool, window_ms=10_000, max_batch_size=2)
+        return pool, await asyncio.wait_for(
+            asyncio.gather(batcher.transcribe(clip(1)), batcher.transcribe(clip(2))), 1
+        )
+
+    pool, results = asyncio.run(run())
+    assert len(results) == 2
+    assert pool.batches == [(2, {})]
+
+
+def test_different_options_are_batched_separately():
+    async def run():
+        pool = FakePool()
+        batcher = MicroBatcher(pool, window_ms=10, max_batch_size=8)
+        await asyncio.gather(
+            batcher.transcribe(clip(1), preset="fast"),
+            batcher.transcribe(clip(1), preset="accurate"),
+            batcher.transcribe(clip(1), preset="fast", prompt="Describe a holiday")
+        )
+        return pool
+
+    pool = asyncio.run(run())
+    assert sorted(size for size, _ in pool.batches) == [1, 1, 1]
+
+
+def test_batch_failure_fails_every_request():
+    async def run():
+        batcher = MicroBatcher(FakePool(), window_ms=10, max_batch_size=8)
+        return await asyncio.gather(
+            *(batcher.transcribe(clip(1), preset="broken") for _ in range(2)), return_exceptions=True
+        )
+
+    assert all(isinstance(result, RuntimeError) for result in asyncio.run(run()))
+
+
+def test_batches_go_through_the_batch_entry_point():
+    calls = []
+
+    class RecordingPool(FakePool):
+        async def submit(self, fn, *args, **kwargs):
+            calls.append(fn)
+            return await super().submit(fn, *args, **kwargs)
+
+    async def run():
+        batcher = MicroBatcher(RecordingPool(), window_ms=1)
+        await batcher.transcribe(clip(1))
+
+    asyncio.run(run())
+    assert calls == [stt_batcher.engine_transcribe_batch]
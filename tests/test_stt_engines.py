@@ -0,0 +1,60 @@
+"""Tests for the speech-to-text engine interface."""
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from services import stt_engines
+from services.stt_engines import FasterWhisperEngine, STTEngine
+from services.stt_service import Transcription
+
+
+class EchoEngine(STTEngine):
+    name = "echo"
+
+    def transcribe(self, audio, preset=None, prompt=None):
+        return Transcription(str(len(audio)))
+
+
+def test_engine_interface_is_abstract():
+    with pytest.raises(TypeError):
+        STTEngine()
+
+
+def test_default_batch_transcribes_one_by_one():
+    engine = EchoEngine("tiny", False)
+    results = engine.transcribe_batch([np.zeros(3), np.zeros(5)])
+    assert [result.text for result in results] == ["3", "5"]
+
+
+@pytest.fixture
+def fake_faster_whisper(monkeypatch):
+    created = []
+
+    class WhisperModel:
+        def __init__(self, model_name, device, compute_type, cpu_threads):
+            self.cpu_threads = cpu_threads
+            created.append(compute_type)
+
+    monkeypatch.setitem(sys.modules, "faster_whisper", types.SimpleNamespace(WhisperModel=WhisperModel))
+    return created
+
+
+def test_faster_whisper_quantize_forces_int8(fake_faster_whisper, monkeypatch):
+    monkeypatch.setattr(stt_engines, "STT_COMPUTE_TYPE", "float32")
+    assert FasterWhisperEngine("tiny", quantize=True).quantize
+    assert not FasterWhisperEngine("tiny", quantize=False).quantize
+    assert fake_faster_whisper == ["int8", "float32"]
+
+
+def test_faster_whisper_keeps_configured_int8_variant(fake_faster_whisper, monkeypatch):
+    monkeypatch.setattr(stt_engines, "STT_COMPUTE_TYPE", "int8_float32")
+    assert FasterWhisperEngine("tiny", quantize=True).compute_type == "int8_float32"
+
+
+def test_faster_whisper_uses_the_pool_core_share(fake_faster_whisper, monkeypatch):
+    monkeypatch.setattr(stt_engines, "STT_CPU_CORES", 8)
+    monkeypatch.setattr(stt_engines, "STT_WORKERS", 2)
+    assert FasterWhisperEngine("tiny").model.cpu_threads == 4
+    assert FasterWhisperEngine("tiny", cpu_threads=2).model.cpu_threads == 2
@@ -0,0 +1,42 @@
+"""Tests for load-adaptive model routing."""
+from backend.utils.stt_router import ModelRouter
+
+
+class FakePool:
+    num_workers = 2
+    queue_depth = 0
+
+
+def test_switches_to_fallback_on_queue_depth_and_back_with_hysteresis():
+    pool = FakePool()
+    router = ModelRouter(pool, "base", "tiny", max_queue_depth=4, max_wait_seconds=100)
+    assert router.choose() == "base"
+
+    pool.queue_depth = 4
+    assert router.choose() == "tiny"
+    # Still above half the threshold: stay on the fallback
+    pool.queue_depth = 3
+    assert router.choose() == "tiny"
+    pool.queue_depth = 2
+    assert router.choose() == "base"
+
+    assert router.switches == 2
+    assert router.requests == {"base": 2, "tiny": 2}
+
+
+def test_switches_on_predicted_wait():
+    pool = FakePool()
+    router = ModelRouter(pool, "base", "tiny", max_queue_depth=100, max_wait_seconds=5)
+    router.record(4.0)
+    router.record(4.0)
+    pool.queue_depth = 3
+    # 3 queued jobs x 4 s / 2 workers = 6 s
+    assert router.predicted_wait == 6.0
+    assert router.choose() == "tiny"
+
+
+def test_decode_time_is_a_moving_average():
+    router = ModelRouter(FakePool(), "base", "tiny")
+    router.record(1.0)
+    router.record(2.0)
+    assert 1.0 < router.decode_seconds < 2.0
@@ -0,0 +1,85 @@
+"""Tests for transcription statistics and in-memory audio decoding."""
+import struct
+import subprocess
+
+import numpy as np
+import pytest
+
+from services import stt_service
+from services.stt_service import (
+    WAVE_FORMAT_IEEE_FLOAT,
+    WAVE_FORMAT_PCM,
+    _parse_pcm_wav,
+    count_fallbacks,
+    decode_audio
+)
+
+TEMPERATURES = [0.0, 0.2, 0.4, 0.6]
+
+
+def test_no_fallbacks_at_first_temperature():
+    assert count_fallbacks([(0, 0.0), (0, 0.0), (3000, 0.0)], TEMPERATURES) == 0
+
+
+def test_fallbacks_count_once_per_window():
+    # Three segments cut from one window decoded at 0.4 are two re-decodes, not six
+    windows = [(0, 0.4), (0, 0.4), (0, 0.4), (3000, 0.2)]
+    assert count_fallbacks(windows, TEMPERATURES) == 3
+
+
+def test_unknown_temperature_is_ignored():
+    assert count_fallbacks([(0, 1.0), (3000, 0.2)], TEMPERATURES) == 1
+
+
+def test_no_segments():
+    assert count_fallbacks([], TEMPERATURES) == 0
+
+
+def wav(data: bytes, format_tag=WAVE_FORMAT_PCM, channels=1, rate=16000, bits=16, extra=b""):
+    block_align = channels * bits // 8
+    fmt = struct.pack("<HHIIHH", format_tag, channels, rate, rate * block_align, block_align, bits)
+    body = (b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt + extra
+            + b"data" + struct.pack("<I", len(data)) + data)
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+def test_mono_pcm16_is_parsed_without_ffmpeg():
+    samples = np.array([0, 16384, -32768, 32767], dtype="<i2")
+    # A LIST chunk before the data (odd-sized, so padded) is skipped
+    audio = _parse_pcm_wav(wav(samples.tobytes(), extra=b"LIST\x03\x00\x00\x00abc\x00"))
+    assert audio.dtype == np.float32
+    np.testing.assert_allclose(audio, samples / 32768.0)
+
+
+def test_mono_float32_is_used_in_place():
+    samples = np.array([0.0, 0.5, -0.25], dtype="<f4")
+    data = bytearray(wav(samples.tobytes(), format_tag=WAVE_FORMAT_IEEE_FLOAT, bits=32))
+    audio = _parse_pcm_wav(data)
+    np.testing.assert_array_equal(audio, samples)
+    assert np.shares_memory(audio, np.frombuffer(data, np.uint8))
+
+
+@pytest.mark.parametrize("channels, rate", [(2, 16000), (1, 44100)])
+def test_other_layouts_fall_back_to_ffmpeg(monkeypatch, channels, rate):
+    decoded = np.array([1000, -1000], dtype="<i2").tobytes()
+    calls = []
+
+    def fake_ffmpeg(source, audio_bytes=None):
+        calls.append(source)
+        return subprocess.CompletedProcess([], 0, stdout=decoded, stderr=b"")
+
+    monkeypatch.setattr(stt_service, "_ffmpeg_decode", fake_ffmpeg)
+    data = wav(b"\x00" * 16, channels=channels, rate=rate)
+    assert _parse_pcm_wav(data) is None
+    np.testing.assert_allclose(decode_audio(data), [1000 / 32768.0, -1000 / 32768.0])
+    assert calls == ["pipe:0"]
+
+
+@pytest.mark.parametrize("data", [
+    b"RIFF\x00\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00",
+    wav(b"\x00" * 4)[:20],
+    b"RIFF",
+    wav(b"\x00" * 4).replace(b"fmt ", b"junk"),
+])
+def test_truncated_or_malformed_header_is_not_parsed(data):
+    assert _parse_pcm_wav(data) is None
@@ -0,0 +1,122 @@
+"""Tests for the inference worker pool."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from backend.utils.stt_worker import InferenceWorkerPool, QueueFullError, WorkerStartupError
+
+
+def broken_factory():
+    raise RuntimeError("no weights")
+
+
+def echo(value, model):
+    return value, model
+
+
+def test_submit_runs_on_worker_model():
+    async def run():
+        pool = InferenceWorkerPool(lambda: "replica", num_workers=2, max_queue=8)
+        pool.start(first_model="first")
+        try:
+            results = await asyncio.gather(*(pool.submit(echo, i) for i in range(6)))
+        finally:
+            pool.shutdown()
+        return results
+
+    results = asyncio.run(run())
+    assert [value for value, _ in results] == list(range(6))
+    assert {model for _, model in results} <= {"first", "replica"}
+
+
+def test_factory_failure_fails_jobs_instead_of_hanging():
+    async def run():
+        pool = InferenceWorkerPool(broken_factory, num_workers=2, max_queue=4)
+        pool.start()
+        for _ in range(50):
+            if pool.failed:
+                break
+            await asyncio.sleep(0.01)
+        try:
+            with pytest.raises(WorkerStartupError):
+                await asyncio.wait_for(pool.submit(echo, 1), 1)
+        finally:
+            pool.shutdown()
+        return pool
+
+    pool = asyncio.run(run())
+    assert pool.failed_workers == 2
+    assert isinstance(pool.error, RuntimeError)
+
+
+def test_shutdown_with_full_queue_does_not_block():
+    release = threading.Event()
+
+    def block(model):
+        release.wait(5)
+
+    async def run():
+        pool = InferenceWorkerPool(lambda: None, num_workers=1, max_queue=2)
+        pool.start(first_model="model")
+        running = asyncio.ensure_future(pool.submit(block))
+        await asyncio.sleep(0.1)
+        queued = [asyncio.ensure_future(pool.submit(block)) for _ in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(QueueFullError):
+            await pool.submit(block)
+
+        started = time.perf_counter()
+        release.set()
+        pool.shutdown(timeout=1)
+        elapsed = time.perf_counter() - started
+        results = await asyncio.gather(running, *queued, return_exceptions=True)
+        return elapsed, results
+
+    elapsed, results = asyncio.run(run())
+    assert elapsed < 2
+    assert any(isinstance(result, RuntimeError) for result in results[1:])
+
+
+def test_every_worker_warms_its_own_replica_before_ready():
+    warmed = []
+    lock = threading.Lock()
+    counter = iter(range(100))
+
+    def factory():
+        time.sleep(0.05)
+        with lock:
+            return f"replica-{next(counter)}"
+
+    def warm_up(model):
+        with lock:
+            warmed.append(model)
+
+    pool = InferenceWorkerPool(factory, num_workers=3, warm_up=warm_up)
+    pool.start(first_model="first")
+    try:
+        assert pool.wait_started(2)
+        assert pool.ready
+        assert pool.ready_workers == 3
+        assert sorted(warmed) == ["first", "replica-0", "replica-1"]
+    finally:
+        pool.shutdown()
+
+
+def test_ready_counts_failed_workers_as_started():
+    calls = iter(range(100))
+
+    def factory():
+        if next(calls) == 0:
+            raise RuntimeError("out of memory")
+        return "replica"
+
+    pool = InferenceWorkerPool(factory, num_workers=2)
+    pool.start(first_model="first")
+    try:
+        assert pool.wait_started(2)
+        assert pool.ready
+        assert (pool.ready_workers, pool.failed_workers) == (1, 1)
+    finally:
+        pool.shutdown()
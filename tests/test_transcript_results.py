@@ -0,0 +1,89 @@
+"""Tests for the two-pass transcript results store."""
+import asyncio
+import os
+
+from backend.models.schemas import STTResponse
+from backend.utils.transcript_results import TranscriptResults
+
+
+def refined(text):
+    return STTResponse(transcript=text, word_count=len(text.split()), duration=1.0)
+
+
+async def resolve_later(results, result_id, text, delay):
+    await asyncio.sleep(delay)
+    await results.resolve(result_id, refined(text))
+
+
+def test_wait_returns_once_resolved():
+    async def run():
+        results = TranscriptResults()
+        result_id = await results.create("draft text", "session", 1)
+        asyncio.create_task(resolve_later(results, result_id, "final text", 0.05))
+        return result_id, await results.wait(result_id, 2), await results.find("session", 1)
+
+    result_id, result, found = asyncio.run(run())
+    assert result.status == "ready"
+    assert result.final.transcript == "final text"
+    assert found == result_id
+
+
+def test_unknown_result_is_none():
+    assert asyncio.run(TranscriptResults().wait("0" * 32, 0)) is None
+
+
+def test_oldest_results_are_evicted():
+    async def run():
+        results = TranscriptResults(max_results=2)
+        first = await results.create("one", "session", 1)
+        await results.create("two")
+        await results.create("three")
+        return await results.get(first), await results.find("session", 1)
+
+    assert asyncio.run(run()) == (None, None)
+
+
+def test_eviction_removes_shared_entries(tmp_path):
+    async def run():
+        results = TranscriptResults(max_results=1, directory=str(tmp_path))
+        await results.create("one", "session", 1)
+        await results.create("two")
+        # Only the second result is left on disk
+        return await results.find("session", 1), results.shared._disk_entries()
+
+    found, entries = asyncio.run(run())
+    assert found is None
+    assert len(entries) == 1
+
+
+def test_results_are_shared_between_processes(tmp_path):
+    # Two stores on one directory stand in for two API worker processes
+    owner = TranscriptResults(directory=str(tmp_path))
+    other = TranscriptResults(directory=str(tmp_path))
+
+    async def run():
+        result_id = await owner.create("draft text", "session", 3)
+        assert (await other.get(result_id)).status == "pending"
+        assert await other.find("session", 3) == result_id
+        asyncio.create_task(resolve_later(owner, result_id, "final text", 0.1))
+        return await other.wait(result_id, 2)
+
+    result = asyncio.run(run())
+    assert result.status == "ready"
+    assert result.final.transcript == "final text"
+
+
+def test_clear_empties_the_shared_directory(tmp_path):
+    async def run():
+        results = TranscriptResults(directory=str(tmp_path))
+        result_id = await results.create("draft text", "session", 1)
+        results.clear()
+        return await results.get(result_id), await results.find("session", 1)
+
+    assert asyncio.run(run()) == (None, None)
+    assert all(os.listdir(os.path.join(tmp_path, shard)) == [] for shard in os.listdir(tmp_path))
+
+
+def test_shared_store_rejects_malformed_ids(tmp_path):
+    results = TranscriptResults(directory=str(tmp_path))
+    assert asyncio.run(results.get("../../etc/passwd")) is None
@@ -0,0 +1,68 @@
+"""Tests for the outbound speech synthesis dispatcher."""
+import asyncio
+
+import pytest
+
+from backend.utils.tts_dispatcher import TTSBusyError, TTSDispatcher
+
+
+async def hold(dispatcher, release):
+    async with dispatcher.slot():
+        await release.wait()
+
+
+def test_concurrency_is_capped_and_queue_bounded():
+    async def run():
+        dispatcher = TTSDispatcher(max_concurrency=2, max_queue=1, queue_timeout=5)
+        release = asyncio.Event()
+        holders = [asyncio.ensure_future(hold(dispatcher, release)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        assert (dispatcher.active, dispatcher.waiting) == (2, 1)
+
+        # Two running and one queued: the next request is turned away at once
+        with pytest.raises(TTSBusyError):
+            async with dispatcher.slot():
+                pass
+
+        release.set()
+        await asyncio.gather(*holders)
+        return dispatcher
+
+    dispatcher = asyncio.run(run())
+    stats = dispatcher.stats()
+    assert (stats["admitted"], stats["rejected"], stats["timed_out"]) == (3, 1, 0)
+    assert (stats["active"], stats["waiting"]) == (0, 0)
+
+
+def test_queued_request_times_out_and_its_wait_is_recorded():
+    async def run():
+        dispatcher = TTSDispatcher(max_concurrency=1, max_queue=4, queue_timeout=0.05)
+        release = asyncio.Event()
+        holder = asyncio.ensure_future(hold(dispatcher, release))
+        await asyncio.sleep(0.01)
+        with pytest.raises(TTSBusyError):
+            async with dispatcher.slot():
+                pass
+        release.set()
+        await holder
+        return dispatcher
+
+    dispatcher = asyncio.run(run())
+    assert dispatcher.timed_out == 1
+    assert dispatcher.waiting == 0
+    assert dispatcher.max_queue_wait_seconds >= 0.05
+    assert dispatcher.stats()["avg_queue_wait_seconds"] > 0
+
+
+def test_slot_is_released_when_synthesis_fails():
+    async def run():
+        dispatcher = TTSDispatcher(max_concurrency=1, max_queue=0, queue_timeout=1)
+        with pytest.raises(RuntimeError):
+            async with dispatcher.slot():
+                raise RuntimeError("synthesis failed")
+        async with dispatcher.slot():
+            pass
+        return dispatcher
+
+    dispatcher = asyncio.run(run())
+    assert (dispatcher.admitted, dispatcher.active) == (2, 0)
@@ -0,0 +1,84 @@
+"""Tests for single-flight speech synthesis."""
+import asyncio
+
+import pytest
+
+from backend.utils import tts_flight
+from backend.utils.tts_dispatcher import TTSDispatcher
+from backend.utils.tts_flight import SpeechSingleFlight
+
+
+@pytest.fixture
+def syntheses(monkeypatch):
+    """Replace Edge TTS with a slow fake; records each synthesis started."""
+    started = []
+
+    async def fake_stream_and_cache(text, voice):
+        started.append((text, voice))
+        for i in range(3):
+            await asyncio.sleep(0.01)
+            if text == "fail" and i == 1:
+                raise RuntimeError("network down")
+            yield f"[{voice}:{i}]".encode()
+
+    monkeypatch.setattr(tts_flight, "stream_and_cache", fake_stream_and_cache)
+    return started
+
+
+def test_identical_requests_share_one_synthesis(syntheses):
+    async def run():
+        flights = SpeechSingleFlight(TTSDispatcher(max_concurrency=1, max_queue=0))
+        results = await asyncio.gather(*(flights.synthesize("Hello", "v") for _ in range(5)))
+        return flights, results
+
+    flights, results = asyncio.run(run())
+    assert syntheses == [("Hello", "v")]
+    assert set(results) == {b"[v:0][v:1][v:2]"}
+    assert flights.stats() == {"leaders": 1, "coalesced": 4, "in_flight": 0}
+
+
+def test_late_subscriber_gets_every_chunk(syntheses):
+    async def run():
+        flights = SpeechSingleFlight(TTSDispatcher())
+        first = asyncio.ensure_future(flights.synthesize("Hello", "v"))
+        await asyncio.sleep(0.025)
+        late = await flights.synthesize("Hello", "v")
+        return await first, late
+
+    first, late = asyncio.run(run())
+    assert first == late == b"[v:0][v:1][v:2]"
+    assert len(syntheses) == 1
+
+
+def test_different_voices_are_separate_flights(syntheses):
+    async def run():
+        flights = SpeechSingleFlight(TTSDispatcher())
+        return await asyncio.gather(flights.synthesize("Hello", "a"), flights.synthesize("Hello", "b"))
+
+    assert asyncio.run(run()) == [b"[a:0][a:1][a:2]", b"[b:0][b:1][b:2]"]
+    assert len(syntheses) == 2
+
+
+def test_failure_reaches_every_subscriber_and_is_not_kept(syntheses):
+    async def run():
+        flights = SpeechSingleFlight(TTSDispatcher())
+        results = await asyncio.gather(
+            *(flights.synthesize("fail", "v") for _ in range(3)), return_exceptions=True
+        )
+        return flights, results
+
+    flights, results = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert flights.stats()["in_flight"] == 0
+
+
+def test_leader_disconnect_does_not_cancel_the_others(syntheses):
+    async def run():
+        flights = SpeechSingleFlight(TTSDispatcher())
+        leader = asyncio.ensure_future(flights.synthesize("Hello", "v"))
+        follower = asyncio.ensure_future(flights.synthesize("Hello", "v"))
+        await asyncio.sleep(0.015)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(run()) == b"[v:0][v:1][v:2]"
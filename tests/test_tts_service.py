@@ -0,0 +1,60 @@
+"""Tests for speech synthesis streaming and caching."""
+import asyncio
+import sys
+import types
+
+import pytest
+
+from services import tts_service
+from services.cache import TwoTierCache
+
+
+def fake_edge_tts(monkeypatch, chunks):
+    class Communicate:
+        def __init__(self, text, voice):
+            self.voice = voice
+
+        async def stream(self):
+            yield {"type": "WordBoundary"}
+            for chunk in chunks:
+                yield {"type": "audio", "data": chunk}
+
+    monkeypatch.setitem(sys.modules, "edge_tts", types.SimpleNamespace(Communicate=Communicate))
+
+
+@pytest.fixture
+def tts_cache(monkeypatch):
+    cache = TwoTierCache(1024 * 1024)
+    monkeypatch.setattr(tts_service, "tts_cache", cache)
+    return cache
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+def test_stream_and_cache_caches_the_complete_audio(monkeypatch, tts_cache):
+    fake_edge_tts(monkeypatch, [b"ab", b"cd"])
+    chunks = asyncio.run(collect(tts_service.stream_and_cache("Hello", "voice")))
+    assert chunks == [b"ab", b"cd"]
+    assert tts_cache.get(tts_service.tts_cache_key("Hello", "voice")) == b"abcd"
+
+
+def test_empty_stream_raises_and_is_not_cached(monkeypatch, tts_cache):
+    fake_edge_tts(monkeypatch, [])
+    with pytest.raises(RuntimeError):
+        asyncio.run(collect(tts_service.stream_and_cache("Hello", "voice")))
+    assert tts_cache.get(tts_service.tts_cache_key("Hello", "voice")) is None
+
+
+def test_text_to_speech_uses_the_cache(monkeypatch, tts_cache):
+    tts_cache.set(tts_service.tts_cache_key("Hello", "voice"), b"cached")
+    fake_edge_tts(monkeypatch, [])
+    assert tts_service.text_to_speech("Hello", "voice") == b"cached"
+
+
+def test_cache_key_depends_on_text_voice_and_format():
+    key = tts_service.tts_cache_key("Hello", "voice")
+    assert len(key) == 64
+    assert key != tts_service.tts_cache_key("Hello", "other")
+    assert key != tts_service.tts_cache_key("Hello", "voice", "wav")
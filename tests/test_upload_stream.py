@@ -0,0 +1,145 @@
+"""Tests for the streaming multipart parser and audio decoder."""
+import asyncio
+import io
+import wave
+
+import numpy as np
+import pytest
+
+from backend.utils import upload_stream
+from backend.utils.upload_stream import (
+    StreamingAudioDecoder,
+    UploadFormatError,
+    UploadTooLargeError,
+    stream_multipart
+)
+
+BOUNDARY = "testboundary"
+
+
+class FakeRequest:
+    def __init__(self, body: bytes, content_type: str = f"multipart/form-data; boundary={BOUNDARY}",
+                 content_length=None, chunk_size: int = 7):
+        self.headers = {"content-type": content_type}
+        if content_length is not None:
+            self.headers["content-length"] = str(content_length)
+        self.body = body
+        self.chunk_size = chunk_size
+        self.chunks_read = 0
+
+    async def stream(self):
+        for start in range(0, len(self.body), self.chunk_size):
+            self.chunks_read += 1
+            yield self.body[start:start + self.chunk_size]
+
+
+def multipart_body(audio: bytes, language: str = "en") -> bytes:
+    return (
+        f"--{BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="language"\r\n\r\n'
+        f"{language}\r\n"
+        f"--{BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="audio_file"; filename="a.wav"\r\n'
+        "Content-Type: audio/wav\r\n\r\n"
+    ).encode() + audio + f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+def wav_bytes(samples: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        wav_file.writeframes(samples.astype("<i2").tobytes())
+    return buffer.getvalue()
+
+
+def collect(request, max_bytes=10_000):
+    async def run():
+        parts = {}
+        async for part, chunk in stream_multipart(request, max_bytes):
+            parts.setdefault(part.name, [part, b""])[1] += chunk
+        return parts
+
+    return asyncio.run(run())
+
+
+def decode(chunks, max_seconds=30):
+    async def run():
+        decoder = StreamingAudioDecoder(max_seconds)
+        for chunk in chunks:
+            await decoder.feed(chunk)
+        return decoder, await decoder.finish()
+
+    return asyncio.run(run())
+
+
+def test_parts_are_streamed_with_their_headers():
+    parts = collect(FakeRequest(multipart_body(b"RIFFdata")))
+    language, audio = parts["language"], parts["audio_file"]
+    assert language[1] == b"en"
+    assert audio[0].filename == "a.wav"
+    assert audio[0].content_type == "audio/wav"
+    assert audio[1] == b"RIFFdata"
+
+
+@pytest.mark.parametrize("content_type", [
+    "application/json",
+    "multipart/form-data",
+])
+def test_non_multipart_or_missing_boundary_is_rejected(content_type):
+    with pytest.raises(UploadFormatError):
+        collect(FakeRequest(b"{}", content_type=content_type))
+
+
+def test_declared_length_over_the_limit_is_rejected_before_reading():
+    request = FakeRequest(multipart_body(b"x"), content_length=20_000)
+    with pytest.raises(UploadTooLargeError):
+        collect(request)
+    assert request.chunks_read == 0
+
+
+def test_streamed_body_over_the_limit_is_rejected_early():
+    request = FakeRequest(multipart_body(b"x" * 5000), chunk_size=100)
+    with pytest.raises(UploadTooLargeError):
+        collect(request, max_bytes=1000)
+    assert request.chunks_read <= 11
+
+
+def test_wav_is_buffered_and_decoded_without_ffmpeg(monkeypatch):
+    async def no_ffmpeg(*args, **kwargs):
+        raise AssertionError("ffmpeg should not run for 16 kHz mono WAV")
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", no_ffmpeg)
+    samples = np.array([0, 16384, -16384, 32767] * 100, dtype=np.int16)
+    data = wav_bytes(samples)
+    decoder, audio = decode([data[i:i + 5] for i in range(0, len(data), 5)])
+    assert decoder.bytes_received == len(data)
+    np.testing.assert_allclose(audio, samples / 32768.0)
+
+
+def test_empty_upload_fails_to_decode():
+    with pytest.raises(RuntimeError, match="empty upload"):
+        decode([])
+
+
+def test_uploads_shorter_than_the_sniffed_header_are_decoded_whole(monkeypatch):
+    received = []
+
+    def fake_decode(data):
+        received.append(bytes(data))
+        return np.zeros(16, dtype=np.float32)
+
+    monkeypatch.setattr(upload_stream, "decode_audio", fake_decode)
+    _, audio = decode([b"RIFF", b"abc"])
+    assert received == [b"RIFFabc"]
+    assert len(audio) == 16
+
+
+def test_missing_ffmpeg_is_a_decode_failure(monkeypatch):
+    async def missing(*args, **kwargs):
+        raise FileNotFoundError("ffmpeg")
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", missing)
+    with pytest.raises(RuntimeError, match="cannot run ffmpeg"):
+        decode([b"ID3" + b"\0" * 20])
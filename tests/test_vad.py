@@ -0,0 +1,48 @@
+"""Tests for the voice activity gate."""
+import numpy as np
+
+from services.vad import FRAME_SAMPLES, SAMPLE_RATE, trim_silence
+
+rng = np.random.default_rng(0)
+
+
+def noise(seconds, level=0.001):
+    return (rng.standard_normal(int(seconds * SAMPLE_RATE)) * level).astype(np.float32)
+
+
+def tone(seconds, level=0.3):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    # Syllable-like amplitude modulation
+    envelope = 0.55 + 0.45 * np.sin(2 * np.pi * 4 * t)
+    return (np.sin(2 * np.pi * 220 * t) * envelope * level).astype(np.float32)
+
+
+def test_silence_is_rejected():
+    assert trim_silence(noise(3)).is_silent
+    assert trim_silence(np.zeros(3 * SAMPLE_RATE, np.float32)).is_silent
+
+
+def test_single_click_is_rejected():
+    audio = noise(3)
+    start = SAMPLE_RATE
+    audio[start:start + FRAME_SAMPLES] = 0.5
+    result = trim_silence(audio)
+    assert result.speech_seconds < 0.1
+    assert result.is_silent
+
+
+def test_speech_is_kept_and_silence_trimmed():
+    audio = np.concatenate([noise(1), tone(1.5), noise(1)])
+    result = trim_silence(audio)
+    assert not result.is_silent
+    assert 1.2 < result.speech_seconds < 1.8
+    assert result.trimmed_seconds > 1.0
+    # Hangover padding keeps some context around the speech
+    assert len(result.audio) > 1.5 * SAMPLE_RATE
+
+
+def test_long_pause_is_shortened():
+    audio = np.concatenate([tone(1), noise(4), tone(1)])
+    result = trim_silence(audio, max_silence_seconds=1.0)
+    assert not result.is_silent
+    assert len(result.audio) / SAMPLE_RATE < 4.0